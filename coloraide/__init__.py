@@ -1,7 +1,9 @@
 """ColorAide Library."""
 from .__meta__ import __version_info__, __version__  # noqa: F401
-from .color import Color, ColorMatch
+from .color import Color, ColorMatch, FrozenColor
+from .color_array import ColorArray
 from .interpolate import Piecewise, Lerp
+from .profiler import profile
 from .util import NaN
 
-__all__ = ("Color", "ColorMatch", "NaN", "Piecewise", "Lerp")
+__all__ = ("Color", "ColorArray", "ColorMatch", "FrozenColor", "NaN", "Piecewise", "Lerp", "profile")
@@ -192,5 +192,5 @@ def parse_version(ver: str) -> Version:
     return Version(major, minor, micro, release, pre, post, dev)
 
 
-__version_info__ = Version(0, 8, 0, "final")
+__version_info__ = Version(0, 9, 0, "final")
 __version__ = __version_info__._get_canonical()
@@ -84,22 +84,22 @@ def calc_adaptation_matrices(
         m = CATS[method]
     except KeyError:  # pragma: no cover
         raise ValueError('Unknown chromatic adaptation method encountered: {}'.format(method))
-    mi = util.inv(m)
+    mi = util.inv3(m)
 
     try:
-        first = util.dot(m, util.xy_to_xyz(WHITES[w1]))
+        first = util.matvec3(m, util.xy_to_xyz(WHITES[w1]))
     except KeyError:  # pragma: no cover
         raise ValueError('Unknown white point encountered: {}'.format(w1))
 
     try:
-        second = util.dot(m, util.xy_to_xyz(WHITES[w2]))
+        second = util.matvec3(m, util.xy_to_xyz(WHITES[w2]))
     except KeyError:  # pragma: no cover
         raise ValueError('Unknown white point encountered: {}'.format(w2))
 
-    m2 = util.diag(cast(Vector, util.divide(cast(Vector, first), cast(Vector, second))))
-    adapt = util.dot(mi, util.dot(m2, m))
+    m2 = cast(MutableMatrix, util.diag([a / b for a, b in zip(first, second)]))
+    adapt = util.matmul3(mi, util.matmul3(m2, m))
 
-    return cast(MutableMatrix, adapt), util.inv(cast(Matrix, adapt))
+    return adapt, util.inv3(adapt)
 
 
 def get_adaptation_matrix(w1: str, w2: str, method: str) -> MutableMatrix:
@@ -124,4 +124,4 @@ def chromatic_adaptation(w1: str, w2: str, xyz: Vector, method: str = 'bradford'
         return list(xyz)
     else:
         # Get the appropriate chromatic adaptation matrix and apply.
-        return cast(MutableVector, util.dot(get_adaptation_matrix(w1, w2, method), xyz))
+        return util.matvec3(get_adaptation_matrix(w1, w2, method), xyz)
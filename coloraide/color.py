@@ -1,14 +1,24 @@
 """Colors."""
 import abc
 import functools
+import math
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from . import cat
 from . import distance
 from . import convert
+from . import lut
+from . import parallel
+from . import profiler
+from . import tokenizer
 from . import gamut
 from . import compositing
 from . import interpolate
 from . import util
-from .util import Vector, MutableVector, ColorInput
+from .util import Vector, MutableVector, ColorInput, Array
+from .convert import CacheInfo
 from .spaces import Space, Cylindrical
 from .spaces.hsv import HSV
 from .spaces.srgb.css import SRGB
@@ -51,7 +61,9 @@ from .distance.delta_e_ok import DEOK
 from .gamut import Fit
 from .gamut.fit_lch_chroma import LchChroma
 from .gamut.fit_oklch_chroma import OklchChroma
-from typing import Union, Sequence, Dict, List, Optional, Any, cast, Callable, Set, Tuple, Type, Mapping
+from typing import (
+    Union, Sequence, Dict, List, Optional, Any, cast, Callable, Tuple, Type, Mapping, Iterable, Iterator, IO
+)
 
 SUPPORTED_DE = (
     DE76, DE94, DECMC, DE2000, DEITP, DE99o, DEZ, DEHyAB, DEOK
@@ -87,9 +99,102 @@ class ColorMatch:
     __repr__ = __str__
 
 
+class FrozenColor:
+    """
+    Immutable and hashable color value.
+
+    Undefined channels hash and compare equal to each other, consistent with `Color` equality.
+    """
+
+    __slots__ = ('_color_cls', '_space', '_coords', '_alpha', '_key')
+
+    def __init__(self, color: 'Color') -> None:
+        """Initialize."""
+
+        self._color_cls = type(color)
+        self._space = color.space()
+        self._coords = tuple(color.coords_view())  # type: Tuple[float, ...]
+        self._alpha = color.alpha  # type: float
+        # NaN is not equal to itself and NaN objects do not hash the same, so use `None` in their place.
+        self._key = (self._space,) + tuple(None if math.isnan(c) else c for c in self._coords + (self._alpha,))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent mutability."""
+
+        if not hasattr(self, name) and name in self.__slots__:
+            super().__setattr__(name, value)
+            return
+
+        raise AttributeError("'{}' is immutable".format(self.__class__.__name__))
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare equal."""
+
+        return (
+            type(other) == type(self) and
+            other._color_cls is self._color_cls and
+            other._key == self._key
+        )
+
+    def __hash__(self) -> int:
+        """Hash."""
+
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return 'FrozenColor({!r})'.format(self._color_cls.CS_MAP[self._space]._new(list(self._coords), self._alpha))
+
+    __str__ = __repr__
+
+    @property
+    def alpha(self) -> float:
+        """Alpha channel."""
+
+        return self._alpha
+
+    def space(self) -> str:
+        """The current color space."""
+
+        return self._space
+
+    def coords(self) -> MutableVector:
+        """Coordinates."""
+
+        return list(self._coords)
+
+    def get(self, name: str) -> float:
+        """Get channel."""
+
+        if name == 'alpha':
+            return self._alpha
+        index = self._color_cls.CS_MAP[self._space]._CHANNEL_INDEX.get(name)
+        if index is None:
+            raise AttributeError("'{}' is an invalid channel name".format(name))
+        return self._coords[index]
+
+    def thaw(self) -> 'Color':
+        """Create a mutable color."""
+
+        return self._color_cls._new(self._space, list(self._coords), self._alpha)
+
+    def to_string(self, **kwargs: Any) -> str:
+        """To string."""
+
+        return self.thaw().to_string(**kwargs)
+
+
 class BaseColor(abc.ABCMeta):
     """Ensure on subclass that the subclass has new instances of mappings."""
 
+    def __new__(mcls, name: str, bases: Tuple[type, ...], clsdict: Dict[str, Any]) -> 'BaseColor':
+        """Keep the library's subclasses slotted, unless they define their own slots."""
+
+        if clsdict.get('__module__', '').startswith('coloraide.'):
+            clsdict.setdefault('__slots__', ())
+        return super().__new__(mcls, name, bases, clsdict)
+
     def __init__(cls, name: str, bases: Tuple[object, ...], clsdict: Dict[str, Any]) -> None:
         """Copy mappings on subclass."""
 
@@ -97,11 +202,24 @@ class BaseColor(abc.ABCMeta):
             cls.CS_MAP = cls.CS_MAP.copy()  # type: Dict[str, Type[Space]]
             cls.DE_MAP = cls.DE_MAP.copy()  # type: Dict[str, Type[DeltaE]]
             cls.FIT_MAP = cls.FIT_MAP.copy()  # type: Dict[str, Type[Fit]]
+            cls._CUSTOM_ADAPTATION = any('chromatic_adaptation' in vars(c) for c in cls.mro()[:-2])
+            cls._CONVERT_CHAINS = {}  # type: Dict[convert.ChainKey, List[convert.Stage]]
+            cls._CONVERT_ARRAY_CHAINS = {}  # type: Dict[convert.ChainKey, Optional[List[convert.Stage]]]
+            cls._CONVERTERS = {}  # type: Dict[convert.ChainKey, convert.Converter]
+            cls._CONVERT_CACHE = OrderedDict()  # type: OrderedDict[convert.CacheKey, Tuple[float, ...]]
+            cls._CONVERT_CACHE_STATS = [0, 0]  # type: List[int]
+            cls._CONVERT_CACHE_LOCK = threading.RLock()
+            cls._MATCH_TABLE = {}  # type: tokenizer.MatchTable
+            cls._PARSE_CACHE = OrderedDict()  # type: OrderedDict[tokenizer.ParseKey, tokenizer.ParseEntry]
+            cls._PARSE_CACHE_STATS = [0, 0]  # type: List[int]
+            cls._PARSE_CACHE_LOCK = threading.RLock()
 
 
 class Color(metaclass=BaseColor):
     """Color class object which provides access and manipulation of color spaces."""
 
+    __slots__ = ('_space', '_derived')
+
     CS_MAP = {}  # type: Dict[str, Type[Space]]
     DE_MAP = {}  # type: Dict[str, Type[DeltaE]]
     FIT_MAP = {}  # type: Dict[str, Type[Fit]]
@@ -109,6 +227,12 @@ class Color(metaclass=BaseColor):
     FIT = util.DEF_FIT
     DELTA_E = util.DEF_DELTA_E
     CHROMATIC_ADAPTATION = 'bradford'
+    # Maximum number of converted coordinates to remember, `0` disables the cache.
+    CONVERT_CACHE_SIZE = 0
+    # Maximum number of color spaces each color remembers its converted coordinates for, `0` disables it.
+    DERIVED_CACHE_SIZE = 0
+    # Maximum number of parsed color strings to remember, `0` disables the cache.
+    PARSE_CACHE_SIZE = 0
 
     # It is highly unlikely that a user would ever need to override this, but
     # just in case, it is exposed, but undocumented.
@@ -120,6 +244,30 @@ class Color(metaclass=BaseColor):
     #    XYZ -> sRGB Linear -> sRGB -> HSL -> HSV -> HWB
     _MAX_CONVERT_ITERATIONS = 10
 
+    # Whether the class overrides `chromatic_adaptation`, in which case conversions call it on each color.
+    _CUSTOM_ADAPTATION = False
+    # Resolved conversion chains keyed by source and target space names and chromatic adaptation method.
+    # Cleared whenever plugins are registered or deregistered.
+    _CONVERT_CHAINS = {}  # type: Dict[convert.ChainKey, List[convert.Stage]]
+    # NumPy variants of the above, `None` if a space in the chain has no array form.
+    _CONVERT_ARRAY_CHAINS = {}  # type: Dict[convert.ChainKey, Optional[List[convert.Stage]]]
+    # Conversion chains composed into a single function, see `converter`.
+    _CONVERTERS = {}  # type: Dict[convert.ChainKey, convert.Converter]
+    # Least recently used cache of converted coordinates, its hits and misses, and the lock guarding them,
+    # see `CONVERT_CACHE_SIZE`.
+    _CONVERT_CACHE = OrderedDict()  # type: OrderedDict[convert.CacheKey, Tuple[float, ...]]
+    _CONVERT_CACHE_STATS = [0, 0]  # type: List[int]
+    _CONVERT_CACHE_LOCK = threading.RLock()
+    # Color spaces to try when matching colors, by token, see `tokenizer`.
+    _MATCH_TABLE = {}  # type: tokenizer.MatchTable
+    # Least recently used cache of parsed color strings, its hits and misses, and the lock guarding them,
+    # see `PARSE_CACHE_SIZE`.
+    _PARSE_CACHE = OrderedDict()  # type: OrderedDict[tokenizer.ParseKey, tokenizer.ParseEntry]
+    _PARSE_CACHE_STATS = [0, 0]  # type: List[int]
+    _PARSE_CACHE_LOCK = threading.RLock()
+    # Incremented whenever plugins change, invalidating the converted coordinates remembered by colors.
+    _CACHE_GENERATION = 0
+
     def __init__(
         self,
         color: ColorInput,
@@ -149,7 +297,8 @@ class Color(metaclass=BaseColor):
         return (
             type(other) == type(self) and
             other.space() == self.space() and
-            util.cmp_coords(other.coords() + [other.alpha], self.coords() + [self.alpha])
+            util.cmp_coords(other.coords_view(), self.coords_view()) and
+            util.cmp_coords([other.alpha], [self.alpha])
         )
 
     def _parse(
@@ -166,22 +315,26 @@ class Color(metaclass=BaseColor):
         obj = None
         if isinstance(color, str):
             if data is not None:
-                for space, space_class in self.CS_MAP.items():
-                    s = color.lower()
-                    if space == s and (not filters or s in filters):
-                        num_channels = len(space_class.CHANNEL_NAMES)
-                        if len(data) < num_channels:
-                            data = list(data) + [util.NaN] * (num_channels - len(data))
-                        obj = space_class(data[:num_channels], alpha)
-                        break
+                s = color.lower()
+                space_class = self.CS_MAP.get(s)
+                if space_class is not None and (not filters or s in filters):
+                    num_channels = len(space_class.CHANNEL_NAMES)
+                    if len(data) < num_channels:
+                        data = list(data) + [util.NaN] * (num_channels - len(data))
+                    obj = space_class(data[:num_channels], alpha)
+            elif self.PARSE_CACHE_SIZE > 0:
+                obj = tokenizer.cached_parse(type(self), color, filters)
+                if obj is None:
+                    raise ValueError("'{}' is not a valid color".format(color))
             else:
                 m = self._match(color, fullmatch=True, filters=filters)
                 if m is None:
                     raise ValueError("'{}' is not a valid color".format(color))
                 obj = m[0]
-        elif isinstance(color, Color):
+        elif isinstance(color, (Color, FrozenColor)):
             if not filters or color.space() in filters:
-                obj = self.CS_MAP[color.space()](color._space)
+                # Values of an existing color have already been validated.
+                obj = self.CS_MAP[color.space()]._new(color.coords(), color.alpha)
         elif isinstance(color, Mapping):
             space = color['space']
             if not filters or space in filters:
@@ -210,16 +363,7 @@ class Color(metaclass=BaseColor):
         This must return the color space, not the Color object.
         """
 
-        filter_set = set(filters) if filters is not None else set()  # type: Set[str]
-
-        for space, space_class in cls.CS_MAP.items():
-            if filter_set and space not in filter_set:
-                continue
-            m = space_class.match(string, start, fullmatch)
-            if m is not None:
-                color = space_class(*m[0])
-                return color, start, m[1]
-        return None
+        return tokenizer.match(cls, string, start, fullmatch, filters)
 
     @classmethod
     def match(
@@ -238,6 +382,49 @@ class Color(metaclass=BaseColor):
             return ColorMatch(cls(color.NAME, color.coords(), color.alpha), m[1], m[2])
         return None
 
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        *,
+        filters: Optional[Sequence[str]] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 4096
+    ) -> parallel.ParseResult:
+        """
+        Parse many color strings using a pool of worker processes.
+
+        Strings that are not valid colors are reported by index instead of raising an exception.
+        """
+
+        return parallel.parse_many(cls, strings, filters, workers, chunksize)
+
+    @classmethod
+    def finditer(
+        cls,
+        string: str,
+        start: int = 0,
+        *,
+        filters: Optional[Sequence[str]] = None
+    ) -> Iterator[ColorMatch]:
+        """Find all colors in a buffer."""
+
+        for color, s, e in tokenizer.finditer(cls, string, start, filters=filters):
+            yield ColorMatch(cls(color.NAME, color.coords(), color.alpha), s, e)
+
+    @classmethod
+    def finditer_stream(
+        cls,
+        stream: IO[str],
+        *,
+        filters: Optional[Sequence[str]] = None,
+        chunk_size: int = 65536
+    ) -> Iterator[ColorMatch]:
+        """Find all colors in a file-like object, reading it in chunks."""
+
+        for color, s, e in tokenizer.finditer_stream(cls, stream, filters, chunk_size):
+            yield ColorMatch(cls(color.NAME, color.coords(), color.alpha), s, e)
+
     @classmethod
     def register(
         cls,
@@ -270,6 +457,7 @@ class Color(metaclass=BaseColor):
 
             if name != "*" and name not in mapping or overwrite:
                 mapping[name] = value
+                cls._clear_caches()
             else:
                 raise ValueError("A plugin with the name of '{}' already exists or is not allowed".format(name))
 
@@ -286,6 +474,7 @@ class Color(metaclass=BaseColor):
                 cls.CS_MAP.clear()
                 cls.DE_MAP.clear()
                 cls.FIT_MAP.clear()
+                cls._clear_caches()
                 return
 
             ptype, name = p.split(':', 1)
@@ -302,16 +491,33 @@ class Color(metaclass=BaseColor):
 
             if name == '*':
                 mapping.clear()
+                cls._clear_caches()
             elif name in mapping:
                 del mapping[name]
+                cls._clear_caches()
             elif not silent:
                 raise ValueError("A plugin of name '{}' under category '{}' could not be found".format(name, ptype))
 
+    @classmethod
+    def _clear_caches(cls) -> None:
+        """Clear any cached data that depends on the currently registered plugins."""
+
+        cls._CONVERT_CHAINS.clear()
+        cls._CONVERT_ARRAY_CHAINS.clear()
+        cls._CONVERTERS.clear()
+        with cls._CONVERT_CACHE_LOCK:
+            cls._CONVERT_CACHE.clear()
+        # Replaced rather than cleared, as other threads may be using the current table.
+        cls._MATCH_TABLE = {}
+        with cls._PARSE_CACHE_LOCK:
+            cls._PARSE_CACHE.clear()
+        cls._CACHE_GENERATION += 1
+
     def to_dict(self) -> Mapping[str, Any]:
         """Return color as a data object."""
 
         data = {'space': self.space()}  # type: Dict[str, Any]
-        coords = self.coords()
+        coords = self.coords_view()
         for i, name in enumerate(self._space.CHANNEL_NAMES, 0):
             data[name] = coords[i]
         data['alpha'] = self.alpha
@@ -321,7 +527,7 @@ class Color(metaclass=BaseColor):
         """Normalize the color."""
 
         coords, alpha = self._space.null_adjust(self.coords(), self.alpha)
-        return self.mutate(self.space(), coords, alpha)
+        return self._mutate(self.space(), coords, alpha)
 
     def is_nan(self, name: str) -> bool:
         """Check if channel is NaN."""
@@ -342,6 +548,28 @@ class Color(metaclass=BaseColor):
         """Attach the this objects convert space to the color."""
 
         self._space = space
+        self._derived = None  # type: Optional[Dict[str, convert.DerivedEntry]]
+
+    @classmethod
+    def _new(cls, space: str, coords: MutableVector, alpha: float) -> 'Color':
+        """
+        Create a new color from trusted values without parsing or validation.
+
+        The space must be a registered color space name, coordinates must be a list of floats,
+        one per channel, and alpha must already be clamped. The list is used directly and is not copied.
+        """
+
+        obj = cls.__new__(cls)
+        obj._space = cls.CS_MAP[space]._new(coords, alpha)
+        obj._derived = None
+        return obj
+
+    def _mutate(self, space: str, coords: MutableVector, alpha: float) -> 'Color':
+        """Mutate the current color from trusted values without parsing or validation, see `_new`."""
+
+        self._space = self.CS_MAP[space]._new(coords, alpha)
+        self._derived = None
+        return self
 
     def _handle_color_input(self, color: ColorInput) -> 'Color':
         """Handle color input."""
@@ -349,6 +577,7 @@ class Color(metaclass=BaseColor):
         if (
             isinstance(color, str) or
             isinstance(color, Mapping) or
+            isinstance(color, FrozenColor) or
             (self._is_color(color) and not self._is_this_color(color))
         ):
             return self.new(color)
@@ -366,6 +595,11 @@ class Color(metaclass=BaseColor):
 
         return self._space.coords()
 
+    def coords_view(self) -> Vector:
+        """Coordinates without copying, see `Space.coords_view`."""
+
+        return self._space._coords
+
     def new(
         self,
         color: ColorInput,
@@ -386,7 +620,12 @@ class Color(metaclass=BaseColor):
     def clone(self) -> 'Color':
         """Clone."""
 
-        return self.new(self.space(), self.coords(), self.alpha)
+        return self._new(self.space(), self.coords(), self.alpha)
+
+    def freeze(self) -> FrozenColor:
+        """Create an immutable and hashable copy of the color."""
+
+        return FrozenColor(self)
 
     def chromatic_adaptation(self, w1: str, w2: str, xyz: Vector) -> MutableVector:
         """Apply chromatic adaption to XYZ coordinates."""
@@ -404,9 +643,87 @@ class Color(metaclass=BaseColor):
                 converted = self.convert(space, in_place=in_place)
                 return converted.fit(space, method=method, in_place=True)
 
+        stats = profiler.STATE.stats
+        if stats is not None:
+            start = time.perf_counter()
+            coords = convert.convert(self, space)
+            color = self._mutate(space, coords, self.alpha) if in_place else self._new(space, coords, self.alpha)
+            stats.record(stats.calls, 'Color.convert', time.perf_counter() - start)
+            return color
+
         coords = convert.convert(self, space)
 
-        return self.mutate(space, coords, self.alpha) if in_place else self.new(space, coords, self.alpha)
+        return self._mutate(space, coords, self.alpha) if in_place else self._new(space, coords, self.alpha)
+
+    @classmethod
+    def convert_many(
+        cls,
+        current: str,
+        space: str,
+        coords: Union[Iterable[Vector], Array]
+    ) -> Union[List[MutableVector], Array]:
+        """
+        Convert many coordinates from one color space to another.
+
+        Coordinates are converted directly without creating a color object for each.
+        If NumPy is installed, and every space in the conversion supports it, the coordinates
+        are converted as a single array. A NumPy array input returns a NumPy array, anything
+        else returns a list of coordinate lists.
+        """
+
+        return convert.convert_many(cls, current.lower(), space.lower(), coords)
+
+    @classmethod
+    def converter(cls, current: str, space: str) -> Callable[[Vector], MutableVector]:
+        """
+        Get a function that converts coordinates from one color space to another.
+
+        The function is built once per pair of color spaces, so it can be hoisted out of hot loops.
+        """
+
+        return convert.get_converter(cls, current.lower(), space.lower())
+
+    @classmethod
+    def convert_cache_info(cls) -> CacheInfo:
+        """Get the hits, misses, maximum size, and current size of the conversion cache."""
+
+        with cls._CONVERT_CACHE_LOCK:
+            hits, misses = cls._CONVERT_CACHE_STATS
+            return CacheInfo(hits, misses, cls.CONVERT_CACHE_SIZE, len(cls._CONVERT_CACHE))
+
+    @classmethod
+    def convert_cache_clear(cls) -> None:
+        """Clear the conversion cache and its statistics."""
+
+        with cls._CONVERT_CACHE_LOCK:
+            cls._CONVERT_CACHE.clear()
+            cls._CONVERT_CACHE_STATS[:] = [0, 0]
+
+    @classmethod
+    def parse_cache_info(cls) -> CacheInfo:
+        """Get the hits, misses, maximum size, and current size of the parse cache."""
+
+        with cls._PARSE_CACHE_LOCK:
+            hits, misses = cls._PARSE_CACHE_STATS
+            return CacheInfo(hits, misses, cls.PARSE_CACHE_SIZE, len(cls._PARSE_CACHE))
+
+    @classmethod
+    def parse_cache_clear(cls) -> None:
+        """Clear the parse cache and its statistics."""
+
+        with cls._PARSE_CACHE_LOCK:
+            cls._PARSE_CACHE.clear()
+            cls._PARSE_CACHE_STATS[:] = [0, 0]
+
+    @classmethod
+    def lut(cls, current: str, space: str, size: int = 33, method: str = 'tetrahedral') -> lut.LUT:
+        """
+        Create a 3D lookup table that approximates the conversion from one color space to another.
+
+        The table covers the bounds of the current color space with `size` samples per channel.
+        """
+
+        return lut.LUT(cls, current.lower(), space.lower(), size, method)
 
     def mutate(
         self,
@@ -464,7 +781,7 @@ class Color(metaclass=BaseColor):
         uv = None
         if mode == '1976':
             xyz = self.convert('xyz-d65')
-            coords = self.chromatic_adaptation(xyz._space.WHITE, self._space.WHITE, xyz.coords())
+            coords = self.chromatic_adaptation(xyz._space.WHITE, self._space.WHITE, xyz.coords_view())
             uv = util.xyz_to_uv(coords)
         elif mode == '1960':
             uv = util.xy_to_uv_1960(self.xy())
@@ -476,7 +793,7 @@ class Color(metaclass=BaseColor):
         """Convert to `xy`."""
 
         xyz = self.convert('xyz-d65')
-        coords = self.chromatic_adaptation(xyz._space.WHITE, self._space.WHITE, xyz.coords())
+        coords = self.chromatic_adaptation(xyz._space.WHITE, self._space.WHITE, xyz.coords_view())
         return util.xyz_to_xyY(coords, self._space.white())[:2]
 
     def clip(self, space: Optional[str] = None, *, in_place: bool = False) -> 'Color':
@@ -619,7 +936,7 @@ class Color(metaclass=BaseColor):
         The basic mixing logic is outlined in the CSS level 5 draft.
         """
 
-        if not self._is_color(color) and not isinstance(color, (str, interpolate.Piecewise, Mapping)):
+        if not self._is_color(color) and not isinstance(color, (str, interpolate.Piecewise, Mapping, FrozenColor)):
             raise TypeError("Unexpected type '{}'".format(type(color)))
         mixed = self.interpolate(color, **interpolate_args)(percent)
         return self.mutate(mixed) if in_place else mixed
@@ -654,7 +971,7 @@ class Color(metaclass=BaseColor):
         # or we've changed the stop of the base color, so run it through piecewise.
         if (
             isinstance(color, interpolate.Piecewise) or
-            (stop != 0 and (isinstance(color, (str, Mapping)) or self._is_color(color)))
+            (stop != 0 and (isinstance(color, (str, Mapping, FrozenColor)) or self._is_color(color)))
         ):
             color = cast(Sequence[Union['Color', str, Mapping[str, Any], interpolate.Piecewise]], [color])
 
@@ -775,33 +1092,82 @@ class Color(metaclass=BaseColor):
 
         return self
 
+    def set_many(self, values: Mapping[str, Union[float, Callable[..., float]]]) -> 'Color':
+        """
+        Set multiple channels.
+
+        Consecutive channels of the same color space are set with a single conversion to and from that space.
+        """
+
+        obj = None  # type: Optional[Color]
+        current = ''
+        for name, value in values.items():
+            space = ''
+            if '.' in name:
+                parts = name.split('.')
+                if len(parts) != 2:
+                    raise ValueError("Could not resolve attribute '{}'".format(name))
+                space, name = parts
+
+            if space != current:
+                if obj is not None:
+                    self.update(obj)
+                obj = self.convert(space) if space else None
+                current = space
+
+            (self if obj is None else obj).set(name, value)
+
+        if obj is not None:
+            self.update(obj)
+        return self
+
+    @contextmanager
+    def edit(self, space: str) -> Iterator['Color']:
+        """
+        Edit the color in the given color space.
+
+        The color is converted once on entry and the edits are applied back once on exit.
+        Edits are discarded if the context exits with an exception.
+        """
+
+        obj = self.convert(space)
+        yield obj
+        self.update(obj)
+
     def __getattr__(self, name: str) -> Any:
         """Get attribute."""
 
+        # Don't test `_space` as it is used to get Space channel attributes.
+        if name != "_space":
+            space = self._space
+            index = space._CHANNEL_INDEX.get(name)
+            if index is not None:
+                return space._coords[index]
+            elif name == 'alpha':
+                return space._alpha
+
         if name.startswith('delta_e_'):
             de = name[8:]
             if de in self.DE_MAP:
                 return functools.partial(self.delta_e, method=de)
 
-        # Don't test `_space` as it is used to get Space channel attributes.
-        elif name != "_space":
-            try:
-                return self._space.get(name)
-            except AttributeError:
-                pass
-
         # Get attributes from Color class.
         return super().__getattribute__(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set attribute."""
 
-        try:
+        # Internal attributes are never channels.
+        if name[0] != '_':
             # See if we need to set the space specific channel attributes.
-            self._space.set(name, value)
-            return
-        except AttributeError:
-            pass
+            space = self._space
+            index = space._CHANNEL_INDEX.get(name)
+            if index is not None:
+                space._coords[index] = space._handle_input(value)
+                return
+            elif name == 'alpha':
+                space.alpha = value
+                return
         # Set all attributes on the Color class.
         super().__setattr__(name, value)
 
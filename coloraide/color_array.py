@@ -0,0 +1,654 @@
+"""
+Columnar color arrays.
+
+A color array stores many colors of a single color space as one `array('d')` column per channel
+and one for alpha, so large palettes and images do not need a Python object per color. Arrays
+can instead store `float32` columns, `array('f')`, to halve their memory. `Color`
+objects are only created on demand, such as when indexing or iterating. When NumPy is installed,
+conversions view the columns as a single NumPy array and convert all colors at once, in the
+precision of the columns.
+
+Color arrays can be saved to a binary file that can be memory mapped when loaded, so large
+datasets can be shared without parsing them again.
+"""
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from . import convert
+from . import gamut
+from . import util
+from .color import Color
+from .interpolate import adjust_hue
+from .spaces import Cylindrical, GamutBound, FLG_ANGLE
+from .util import Vector, MutableVector, ColorInput
+from typing import Dict, Iterable, Iterator, List, Optional, Callable, Union, Type, Any, cast, overload
+
+# Binary format: the magic string and format version, the length of the header as a little endian
+# 32 bit unsigned integer, and a UTF-8 JSON header padded with spaces so the payload is aligned.
+# The header has the color space, the names of the stored columns (channels and alpha), the dtype,
+# and the number of colors. The payload has each column in order, as contiguous little endian floats.
+MAGIC = b'\x93COLORS'
+VERSION = 1
+ALIGNMENT = 64
+DTYPES = {'float32': 'f', 'float64': 'd'}  # type: Dict[str, Any]
+TYPECODES = {'f': 'float32', 'd': 'float64'}
+
+
+class ColorArray:
+    """An array of colors in a single color space stored by channel."""
+
+    __slots__ = ('_color_cls', '_space', '_channels', '_alpha')
+
+    def __init__(
+        self,
+        space: str,
+        coords: Iterable[Vector] = (),
+        alpha: Optional[Iterable[float]] = None,
+        *,
+        dtype: str = 'float64',
+        color_cls: Optional[Type[Color]] = None
+    ) -> None:
+        """Initialize."""
+
+        cls = Color if color_cls is None else color_cls
+        space = space.lower()
+        obj = cls.CS_MAP.get(space)
+        if obj is None:
+            raise ValueError("'{}' is not a valid color space".format(space))
+        typecode = get_typecode(dtype)
+
+        num_channels = len(obj.CHANNEL_NAMES)
+        channels = [array(typecode) for _ in range(num_channels)]  # type: List[array[float]]
+        for row in coords:
+            if len(row) != num_channels:
+                raise ValueError(
+                    "'{}' colors should have {} channels, not {}".format(space, num_channels, len(row))
+                )
+            for column, value in zip(channels, row):
+                column.append(value)
+
+        size = len(channels[0])
+        if alpha is None:
+            alphas = array(typecode, [util.DEF_ALPHA]) * size  # type: array[float]
+        else:
+            alphas = array(typecode, [util.clamp(a, 0.0, 1.0) for a in alpha])
+            if len(alphas) != size:
+                raise ValueError("Expected {} alpha values, not {}".format(size, len(alphas)))
+
+        self._attach(cls, space, channels, alphas)
+
+    @classmethod
+    def from_colors(
+        cls,
+        colors: Iterable[ColorInput],
+        space: Optional[str] = None,
+        *,
+        dtype: str = 'float64',
+        color_cls: Optional[Type[Color]] = None
+    ) -> 'ColorArray':
+        """
+        Create an array from colors.
+
+        Colors are converted to the given color space, or the color space of the first color if none is given.
+        """
+
+        color_cls = Color if color_cls is None else color_cls
+        typecode = get_typecode(dtype)
+        channels = []  # type: List[array[float]]
+        alphas = array(typecode)  # type: array[float]
+        for color in colors:
+            c = color if isinstance(color, color_cls) else color_cls(color)
+            if space is None:
+                space = c.space()
+            if not channels:
+                channels = [array(typecode) for _ in color_cls.CS_MAP[space].CHANNEL_NAMES]
+            for column, value in zip(channels, c.convert(space).coords_view()):
+                column.append(value)
+            alphas.append(c.alpha)
+
+        if space is None:
+            space = 'srgb'
+        if not channels:
+            return cls(space, dtype=dtype, color_cls=color_cls)
+        return cls._new(color_cls, space, channels, alphas)
+
+    @classmethod
+    def _new(
+        cls,
+        color_cls: Type[Color],
+        space: str,
+        channels: List['array[float]'],
+        alpha: 'array[float]'
+    ) -> 'ColorArray':
+        """Create an array from trusted columns without validation."""
+
+        obj = cls.__new__(cls)
+        obj._attach(color_cls, space, channels, alpha)
+        return obj
+
+    def _attach(
+        self,
+        color_cls: Type[Color],
+        space: str,
+        channels: List['array[float]'],
+        alpha: 'array[float]'
+    ) -> 'ColorArray':
+        """Attach the columns to the array."""
+
+        self._color_cls = color_cls
+        self._space = space
+        self._channels = channels
+        self._alpha = alpha
+        return self
+
+    def _writable(self) -> None:
+        """Replace read-only columns, such as those of a memory-mapped file, with copies."""
+
+        typecode = self._typecode()
+        self._channels = [
+            column if isinstance(column, array) else copy_column(column, typecode) for column in self._channels
+        ]
+        if not isinstance(self._alpha, array):
+            self._alpha = copy_column(self._alpha, typecode)
+
+    def _typecode(self) -> str:
+        """Get the typecode of the columns."""
+
+        return column_typecode(self._alpha)
+
+    def _rows(self) -> List[MutableVector]:
+        """Get the coordinates of each color as rows."""
+
+        return [list(row) for row in zip(*self._channels)]
+
+    def _from_rows(self, space: str, rows: List[MutableVector], alpha: 'array[float]') -> 'ColorArray':
+        """Create an array of the same color class from rows of coordinates."""
+
+        typecode = column_typecode(alpha)
+        if rows:
+            channels = [array(typecode, column) for column in zip(*rows)]
+        else:
+            channels = [array(typecode) for _ in self._color_cls.CS_MAP[space].CHANNEL_NAMES]
+        return self._new(self._color_cls, space, channels, alpha)
+
+    def _convert_channels(self, space: str) -> List['array[float]']:
+        """Get the channels converted to the given color space."""
+
+        typecode = self._typecode()
+        if space == self._space:
+            return [copy_column(column, typecode) for column in self._channels]
+
+        obj = self._color_cls.CS_MAP.get(space)
+        if obj is None:
+            raise ValueError("'{}' is not a valid color space".format(space))
+        if not len(self):
+            return [array(typecode) for _ in obj.CHANNEL_NAMES]
+
+        np = util.load_numpy()
+        if np is not None:
+            # The columns are viewed in their own precision, so `float32` arrays are converted in `float32`.
+            values = np.column_stack([np.asarray(column) for column in self._channels])
+            result = cast(Any, convert.convert_many(self._color_cls, self._space, space, values))
+            return [
+                array(typecode, np.ascontiguousarray(result[:, i]).tobytes()) for i in range(len(obj.CHANNEL_NAMES))
+            ]
+
+        rows = convert.convert_many(self._color_cls, self._space, space, zip(*self._channels))
+        return [array(typecode, column) for column in zip(*rows)]
+
+    def _verify(self, tolerance: float) -> List[bool]:
+        """Verify which colors have channels within the bounds of the current color space."""
+
+        result = [True] * len(self)
+        for column, bounds in zip(self._channels, self._color_cls.CS_MAP[self._space].BOUNDS):
+            # Angles wrap and unbound channels have no limits.
+            if bounds.flags & FLG_ANGLE or not isinstance(bounds, GamutBound):
+                continue
+            lower = bounds.lower - tolerance
+            upper = bounds.upper + tolerance
+            for i, value in enumerate(column):
+                if math.isnan(value):
+                    value = 0.0
+                if value < lower or value > upper:
+                    result[i] = False
+        return result
+
+    def _get_fit(self, method: Optional[str]) -> Optional[Callable[..., MutableVector]]:
+        """Get the gamut mapping function of a method, `None` if the method clips."""
+
+        if method == 'clip' or (method is None and self._color_cls.FIT == 'clip'):
+            return None
+
+        if method is None:
+            method = self._color_cls.FIT
+        if method not in self._color_cls.FIT_MAP:
+            raise ValueError("'{}' gamut mapping is not currently supported".format(method))
+        return self._color_cls.FIT_MAP[method].fit
+
+    def _fit(
+        self,
+        space: str,
+        func: Optional[Callable[..., MutableVector]],
+        only_out_of_gamut: bool,
+        **kwargs: Any
+    ) -> 'ColorArray':
+        """
+        Convert to the color space and fit colors that are out of its gamut.
+
+        Colors that are in gamut have their hue constrained and are normalized, unless
+        only colors that are out of gamut are to be adjusted.
+        """
+
+        target = self.convert(space)
+        inside = target.in_gamut(tolerance=0.0)
+        obj = self._color_cls.CS_MAP[space]
+        hue = obj.hue_index() if issubclass(obj, Cylindrical) else -1
+        rows = target._rows()
+        alpha = target._alpha
+
+        for i, coords in enumerate(rows):
+            if inside[i]:
+                if only_out_of_gamut:
+                    continue
+                if hue >= 0:
+                    coords[hue] = util.constrain_hue(coords[hue])
+            else:
+                color = self._color_cls._new(space, coords, alpha[i])
+                coords = gamut.clip_channels(color) if func is None else func(color, **kwargs)
+            rows[i], alpha[i] = obj.null_adjust(coords, alpha[i])
+
+        return self._from_rows(space, rows, alpha)
+
+    def _update(self, other: 'ColorArray', in_place: bool) -> 'ColorArray':
+        """Get the colors of another array in the current color space."""
+
+        channels = other._convert_channels(self._space)
+        if in_place:
+            return self._attach(self._color_cls, self._space, channels, other._alpha)
+        return self._new(self._color_cls, self._space, channels, other._alpha)
+
+    def _handle_colors(self, color: Union[ColorInput, 'ColorArray']) -> Union[Color, 'ColorArray']:
+        """Handle a single color or an array of colors of the same length."""
+
+        if isinstance(color, ColorArray):
+            if len(color) != len(self):
+                raise ValueError("Expected an array of {} colors, not {}".format(len(self), len(color)))
+            return color
+        return color if isinstance(color, self._color_cls) else self._color_cls(color)
+
+    def __len__(self) -> int:
+        """Get the number of colors."""
+
+        return len(self._alpha)
+
+    def __iter__(self) -> Iterator[Color]:
+        """Iterate the colors, creating each `Color` on demand."""
+
+        new = self._color_cls._new
+        space = self._space
+        for coords, alpha in zip(zip(*self._channels), self._alpha):
+            yield new(space, list(coords), alpha)
+
+    @overload
+    def __getitem__(self, index: int) -> Color:
+        """Get a color."""
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ColorArray':
+        """Get an array of the colors in a slice."""
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Color, 'ColorArray']:
+        """Get a color, or an array of the colors in a slice."""
+
+        if isinstance(index, slice):
+            channels = [column[index] for column in self._channels]
+            return self._new(self._color_cls, self._space, channels, self._alpha[index])
+        return self._color_cls._new(self._space, [column[index] for column in self._channels], self._alpha[index])
+
+    def __setitem__(self, index: int, color: ColorInput) -> None:
+        """Set a color, converting it to the color space of the array."""
+
+        c = self._color_cls(color).convert(self._space)
+        self._writable()
+        for column, value in zip(self._channels, c.coords_view()):
+            column[index] = value
+        self._alpha[index] = c.alpha
+
+    def __repr__(self) -> str:
+        """Representation."""
+
+        return "<ColorArray '{}' len={}>".format(self._space, len(self))
+
+    __str__ = __repr__
+
+    def space(self) -> str:
+        """The current color space."""
+
+        return self._space
+
+    def dtype(self) -> str:
+        """The precision the colors are stored and converted in, `float64` or `float32`."""
+
+        return TYPECODES[self._typecode()]
+
+    def astype(self, dtype: str) -> 'ColorArray':
+        """Create a copy of the array that stores the colors in the given precision."""
+
+        typecode = get_typecode(dtype)
+        channels = [copy_column(column, typecode) for column in self._channels]
+        return self._new(self._color_cls, self._space, channels, copy_column(self._alpha, typecode))
+
+    def get(self, name: str) -> 'array[float]':
+        """Get a copy of the values of a channel."""
+
+        typecode = self._typecode()
+        if name == 'alpha':
+            return copy_column(self._alpha, typecode)
+        index = self._color_cls.CS_MAP[self._space]._CHANNEL_INDEX.get(name)
+        if index is None:
+            raise AttributeError("'{}' is an invalid channel name".format(name))
+        return copy_column(self._channels[index], typecode)
+
+    def set(self, name: str, value: Union[float, Iterable[float]]) -> 'ColorArray':  # noqa: A003
+        """Set the values of a channel to a single value or a value for each color."""
+
+        size = len(self)
+        typecode = self._typecode()
+        if isinstance(value, Iterable):
+            values = array(typecode, value)
+            if len(values) != size:
+                raise ValueError("Expected {} values, not {}".format(size, len(values)))
+        else:
+            values = array(typecode, [value]) * size
+
+        if name == 'alpha':
+            self._alpha = array(typecode, [util.clamp(a, 0.0, 1.0) for a in values])
+            return self
+        index = self._color_cls.CS_MAP[self._space]._CHANNEL_INDEX.get(name)
+        if index is None:
+            raise AttributeError("'{}' is an invalid channel name".format(name))
+        self._channels[index] = values
+        return self
+
+    def convert(self, space: str, *, fit: Union[bool, str] = False, in_place: bool = False) -> 'ColorArray':
+        """Convert to color space."""
+
+        space = space.lower()
+
+        if fit:
+            result = self._fit(space, self._get_fit(None if not isinstance(fit, str) else fit), True)
+        else:
+            alpha = copy_column(self._alpha, self._typecode())
+            result = self._new(self._color_cls, space, self._convert_channels(space), alpha)
+
+        if in_place:
+            return self._attach(result._color_cls, result._space, result._channels, result._alpha)
+        return result
+
+    def in_gamut(self, space: Optional[str] = None, *, tolerance: float = util.DEF_FIT_TOLERANCE) -> List[bool]:
+        """Check which colors are in gamut."""
+
+        space = space.lower() if space is not None else self._space
+
+        # Check gamut in the provided space
+        if space != self._space:
+            return self.convert(space).in_gamut(tolerance=tolerance)
+
+        result = self._verify(tolerance)
+
+        # Check the color space specified for gamut checking as well.
+        check = self._color_cls.CS_MAP[space].GAMUT_CHECK
+        if check is not None:
+            for i, inside in enumerate(self.convert(check).in_gamut(tolerance=tolerance)):
+                if not inside:
+                    result[i] = False
+        return result
+
+    def clip(self, space: Optional[str] = None, *, in_place: bool = False) -> 'ColorArray':
+        """Clip the color channels."""
+
+        space = space.lower() if space is not None else self._space
+        return self._update(self._fit(space, None, False), in_place)
+
+    def fit(
+        self,
+        space: Optional[str] = None,
+        *,
+        method: Optional[str] = None,
+        in_place: bool = False,
+        **kwargs: Any
+    ) -> 'ColorArray':
+        """
+        Fit the gamut using the provided method.
+
+        Only colors that are out of gamut are mapped, one at a time, with the same gamut mapping
+        plugins used by `Color`.
+        """
+
+        space = space.lower() if space is not None else self._space
+        return self._update(self._fit(space, self._get_fit(method), False, **kwargs), in_place)
+
+    def delta_e(
+        self,
+        color: Union[ColorInput, 'ColorArray'],
+        *,
+        method: Optional[str] = None,
+        **kwargs: Any
+    ) -> List[float]:
+        """Delta E distance of each color to a color, or to the color at the same index of another array."""
+
+        algorithm = (self._color_cls.DELTA_E if method is None else method).lower()
+        if algorithm not in self._color_cls.DE_MAP:
+            raise ValueError("'{}' is not currently a supported distancing algorithm.".format(algorithm))
+        distance = self._color_cls.DE_MAP[algorithm].distance
+
+        other = self._handle_colors(color)
+        if isinstance(other, ColorArray):
+            return [distance(c1, c2, **kwargs) for c1, c2 in zip(self, other)]
+        return [distance(c1, other, **kwargs) for c1 in self]
+
+    def mix(
+        self,
+        color: Union[ColorInput, 'ColorArray'],
+        percent: float = util.DEF_MIX,
+        *,
+        space: str = 'lab',
+        out_space: Optional[str] = None,
+        hue: str = util.DEF_HUE_ADJ,
+        premultiplied: bool = False,
+        in_place: bool = False
+    ) -> 'ColorArray':
+        """
+        Mix each color with a color, or with the color at the same index of another array.
+
+        Colors are mixed the same way as `Color.mix`.
+        """
+
+        space = space.lower()
+        out_space = self._space if out_space is None else out_space.lower()
+        hue = hue.lower()
+
+        other = self._handle_colors(color)
+        colors1 = self.convert(space, fit=True)
+        rows1 = colors1._rows()
+        alpha1 = colors1._alpha
+        if isinstance(other, ColorArray):
+            colors2 = other.convert(space, fit=True)
+            rows2 = colors2._rows()
+            alpha2 = colors2._alpha
+        else:
+            c = other.convert(space, fit=True)
+            rows2 = [c.coords()] * len(self)
+            alpha2 = array('d', [c.alpha]) * len(self)
+
+        obj = self._color_cls.CS_MAP[space]
+        hue_index = obj.hue_index() if issubclass(obj, Cylindrical) else -1
+        angles = [bool(bounds.flags & FLG_ANGLE) for bounds in obj.BOUNDS]
+
+        rows = []
+        alpha = array(self._typecode())  # type: array[float]
+        for coords1, a1, coords2, a2 in zip(rows1, alpha1, rows2, alpha2):
+            coords2 = coords2[:]
+            if hue_index >= 0:
+                coords1[hue_index], coords2[hue_index] = adjust_hue(coords1[hue_index], coords2[hue_index], hue)
+            if premultiplied:
+                premultiply(coords1, a1, angles)
+                premultiply(coords2, a2, angles)
+
+            mixed = []
+            for c1, c2 in zip(coords1 + [a1], coords2 + [a2]):
+                if math.isnan(c1):
+                    mixed.append(c2)
+                elif math.isnan(c2):
+                    mixed.append(c1)
+                else:
+                    mixed.append(c1 + (c2 - c1) * percent)
+            a = util.clamp(mixed.pop(), 0.0, 1.0)
+
+            if premultiplied and a < 1.0:
+                mixed = [v if angle or a == 0 else v / a for v, angle in zip(mixed, angles)]
+            if out_space == space:
+                mixed, a = obj.null_adjust(mixed, a)
+            rows.append(mixed)
+            alpha.append(a)
+
+        result = self._from_rows(space, rows, alpha)
+        if out_space != space:
+            result.convert(out_space, in_place=True)
+        if in_place:
+            return self._attach(result._color_cls, result._space, result._channels, result._alpha)
+        return result
+
+    def to_string(self, **kwargs: Any) -> List[str]:
+        """Convert each color to a string."""
+
+        return [color.to_string(**kwargs) for color in self]
+
+    def save(self, path: str, dtype: Optional[str] = None) -> None:
+        """
+        Save the colors to a binary file.
+
+        Colors can be stored as `float64`, or as `float32` to halve the size at the cost of precision.
+        If no dtype is given, the dtype of the array is used.
+        """
+
+        if dtype is None:
+            dtype = self.dtype()
+        typecode = get_typecode(dtype)
+
+        header = json.dumps(
+            {
+                'space': self._space,
+                'channels': list(self._color_cls.CS_MAP[self._space].CHANNEL_NAMES) + ['alpha'],
+                'dtype': dtype,
+                'count': len(self)
+            }
+        ).encode('utf-8')
+        header += b' ' * (-(len(MAGIC) + 5 + len(header)) % ALIGNMENT)
+
+        with open(path, 'wb') as f:
+            f.write(MAGIC + struct.pack('<BI', VERSION, len(header)) + header)
+            for column in self._channels + [self._alpha]:
+                if not isinstance(column, array) or column.typecode != typecode:
+                    column = array(typecode, column)
+                if sys.byteorder == 'big':  # pragma: no cover
+                    column = column[:]
+                    column.byteswap()
+                column.tofile(f)
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        *,
+        memory_map: bool = True,
+        color_cls: Optional[Type[Color]] = None
+    ) -> 'ColorArray':
+        """
+        Load colors from a binary file.
+
+        When memory mapped, the columns are read directly from the file without copying them into memory,
+        and are only copied when the colors are modified in place.
+        """
+
+        color_cls = Color if color_cls is None else color_cls
+
+        with open(path, 'rb') as f:
+            if memory_map:
+                view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                view = memoryview(f.read())
+
+        start = len(MAGIC) + 5
+        if len(view) < start or view[:len(MAGIC)] != MAGIC:
+            raise ValueError("'{}' is not a color array file".format(path))
+        version, size = struct.unpack('<BI', view[len(MAGIC):start])
+        if version != VERSION:
+            raise ValueError("Unsupported color array file version {}".format(version))
+        header = json.loads(bytes(view[start:start + size]).decode('utf-8'))
+        start += size
+
+        space = header['space']
+        obj = color_cls.CS_MAP.get(space)
+        if obj is None:
+            raise ValueError("'{}' is not a valid color space".format(space))
+        names = list(obj.CHANNEL_NAMES) + ['alpha']
+        if header['channels'] != names:
+            raise ValueError("Stored channels {} do not match the channels of '{}'".format(header['channels'], space))
+        typecode = DTYPES.get(header['dtype'])
+        if typecode is None:
+            raise ValueError("'{}' is not a supported dtype".format(header['dtype']))
+
+        length = array(typecode).itemsize * header['count']
+        if len(view) < start + length * len(names):
+            raise ValueError("'{}' is truncated".format(path))
+
+        columns = []
+        for i in range(len(names)):
+            data = view[start + i * length:start + (i + 1) * length]
+            if memory_map and sys.byteorder == 'little':
+                # Read-only views support the same reads as arrays and are copied before any writes.
+                columns.append(cast('array[float]', data.cast(typecode)))
+            else:
+                column = array(typecode, data.tobytes())
+                if sys.byteorder == 'big':  # pragma: no cover
+                    column.byteswap()
+                columns.append(column)
+        return cls._new(color_cls, space, columns[:-1], columns[-1])
+
+
+def premultiply(coords: MutableVector, alpha: float, angles: List[bool]) -> None:
+    """Premultiply coordinates that are not angles."""
+
+    if alpha >= 1.0:
+        return
+    for i, angle in enumerate(angles):
+        if not angle:
+            coords[i] *= alpha
+
+
+def get_typecode(dtype: str) -> str:
+    """Get the array typecode of a dtype."""
+
+    typecode = DTYPES.get(dtype)
+    if typecode is None:
+        raise ValueError("'{}' is not a supported dtype, use one of: {}".format(dtype, ', '.join(DTYPES)))
+    return cast(str, typecode)
+
+
+def column_typecode(column: 'array[float]') -> str:
+    """Get the typecode of a column, or a read-only view of a column."""
+
+    return column.typecode if isinstance(column, array) else cast(memoryview, column).format
+
+
+def copy_column(column: 'array[float]', typecode: str = 'd') -> 'array[float]':
+    """Copy a column, or a read-only view of a column, to a new array of the given typecode."""
+
+    if isinstance(column, array):
+        return column[:] if column.typecode == typecode else array(typecode, column)
+    view = cast(memoryview, column)
+    return array(typecode, view.tobytes()) if view.format == typecode else array(typecode, view)
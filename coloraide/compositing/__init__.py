@@ -44,8 +44,8 @@ def apply_compositing(
     # Get the color coordinates
     csa = util.no_nan(color1.alpha)
     cba = util.no_nan(color2.alpha)
-    coords1 = util.no_nans(color1.coords())
-    coords2 = util.no_nans(color2.coords())
+    coords1 = util.no_nans(color1.coords_view())
+    coords2 = util.no_nans(color2.coords_view())
 
     # Setup compositing
     compositor = None  # type: Optional[porter_duff.PorterDuff]
@@ -90,7 +90,7 @@ def apply_compositing(
             coords.append(compositor.co(cb, cr) if compositor is not None else cr)
             i += 1
 
-    return color1.update(color1.space(), coords, cra)
+    return color1._mutate(color1.space(), coords, cra)
 
 
 def compose(
@@ -1,7 +1,12 @@
 """Convert the color."""
+from . import cat
 from . import util
-from .util import Vector
-from typing import TYPE_CHECKING
+from . import profiler
+from .spaces import Space
+from .util import Vector, MutableVector, Matrix, MutableMatrix, Array
+import time
+from collections import namedtuple
+from typing import List, Tuple, Type, Callable, Iterable, Optional, Union, Any, cast, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from .color import Color
@@ -10,75 +15,569 @@ if TYPE_CHECKING:  # pragma: no cover
 # This is a design expectation regardless of whether someone assigns a different base to XYZ or not.
 ABSOLUTE_BASE = 'xyz-d65'
 
+# Conversion directions
+TO_BASE = 0
+FROM_BASE = 1
 
-def convert(color: 'Color', space: str) -> Vector:
-    """Convert the color coordinates to the specified space."""
+# A single step in a conversion chain: the current space, the next space, the direction
+# of the conversion, and whether chromatic adaptation is required between the two.
+Step = Tuple[Type[Space], Type[Space], int, bool]
 
-    if color.space() != space:
-        obj = color.CS_MAP.get(space)
-        if obj is None:
-            raise ValueError("'{}' is not a valid color space".format(space))
+# Stage types of a compiled conversion chain
+STAGE_FUNC = 0
+STAGE_MATRIX = 1
+
+# A single stage of a compiled conversion chain: the stage type, either a function
+# that transforms the coordinates or a matrix that should be applied to them, and a
+# descriptive name of the stage used when profiling.
+Stage = Tuple[int, Any, str]
+
+# A function that converts coordinates from one space to another.
+Converter = Callable[[Vector], MutableVector]
+
+# Conversion chain and converter key: the current space, the target space, and the chromatic adaptation method.
+ChainKey = Tuple[str, str, str]
+
+# Conversion cache key: the current space, the target space, the chromatic adaptation method, and the coordinates.
+CacheKey = Tuple[str, str, str, Tuple[float, ...]]
+
+# Converted coordinates remembered by a color: the plugin generation, the source space, the chromatic
+# adaptation method, a snapshot of the source coordinates, and the converted coordinates.
+DerivedEntry = Tuple[int, str, str, List[float], Tuple[float, ...]]
 
-        # Create a worse case conversion chain from XYZ to the target
-        temp = obj
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def calc_convert_chain(color_cls: Type['Color'], current: Type[Space], space: str) -> List[Step]:
+    """Calculate the chain of conversion steps required to go from the current space to the target space."""
+
+    obj = color_cls.CS_MAP.get(space)
+    if obj is None:
+        raise ValueError("'{}' is not a valid color space".format(space))
+
+    # Create a worse case conversion chain from XYZ to the target
+    temp = obj
+    count = 0
+    from_color = []
+    from_color_index = {}
+    name = ''
+    while name != ABSOLUTE_BASE:
+        from_color.append(temp)
+        name = temp.NAME
+        from_color_index[name] = count
+        temp = color_cls.CS_MAP[temp.BASE]
+
+        count += 1
+        if count > color_cls._MAX_CONVERT_ITERATIONS:  # pragma: no cover
+            raise RuntimeError(
+                'Conversion chain reached max size of {} and has terminated to avoid an infinite loop'.format(
+                    count
+                )
+            )
+
+    # Start walking the chain until we either match a space in the conversion chain or bottom out at XYZ
+    chain = []  # type: List[Step]
+    if current.NAME != ABSOLUTE_BASE:
         count = 0
-        from_color = []
-        from_color_index = {}
-        name = ''
-        while name != ABSOLUTE_BASE:
-            from_color.append(temp)
-            name = temp.NAME
-            from_color_index[name] = count
-            temp = color.CS_MAP[temp.BASE]
+        while current.NAME not in from_color_index:
+            # Convert to color's base, make sure we chromatically adapt to the appropriate white point
+            # if we've reached XYZ.
+            base_space = color_cls.CS_MAP[current.BASE]
+            chain.append((current, base_space, TO_BASE, base_space.NAME == ABSOLUTE_BASE))
+
+            # Get next color in the chain
+            current = base_space
 
             count += 1
-            if count > color._MAX_CONVERT_ITERATIONS:  # pragma: no cover
+            if count > color_cls._MAX_CONVERT_ITERATIONS:  # pragma: no cover
                 raise RuntimeError(
-                    'Conversion chain reached max size of {} and has terminated to avoid an infinite loop'.format(
+                    'Conversions reached max iteration of {} and has terminated to avoid an infinite loop'.format(
                         count
                     )
                 )
 
-        # Start converting coordinates until we either match a space in the conversion chain or bottom out at XYZ
-        coords = util.no_nans(color.coords())
-        current = type(color._space)
-        if current.NAME != ABSOLUTE_BASE:
-            count = 0
-            while current.NAME not in from_color_index:
-                # Convert to color's base
-                base_space = color.CS_MAP[current.BASE]
-                coords = current.to_base(coords)
-
-                # Convert to XYZ, make sure we chromatically adapt to the appropriate white point
-                if base_space.NAME == ABSOLUTE_BASE:
-                    coords = color.chromatic_adaptation(current.WHITE, base_space.WHITE, coords)
-
-                # Get next color in the chain
-                current = base_space
-
-                count += 1
-                if count > color._MAX_CONVERT_ITERATIONS:  # pragma: no cover
-                    raise RuntimeError(
-                        'Conversions reached max iteration of {} and has terminated to avoid an infinite loop'.format(
-                            count
-                        )
-                    )
+    # If we still do not match, start converting from the point in the conversion chain
+    # where are current color resides
+    if current.NAME != space:
+        start = from_color_index[current.NAME] - 1
+
+        # Convert from XYZ, make sure we chromatically adapt from the appropriate white point
+        adapt = current.NAME == ABSOLUTE_BASE
+        for index in range(start, -1, -1):
+            chain.append((current, from_color[index], FROM_BASE, adapt))
+            current = from_color[index]
+            adapt = False
+
+    return chain
+
+
+def _get_linear(space: Type[Space], method: str, attr: str) -> Optional[Matrix]:
+    """
+    Get the linear portion of a space's conversion method if it is declared.
+
+    The declaration is only trusted if it is made by the same class, or a subclass of the class,
+    that defines the conversion method. This prevents a plugin that overrides `to_base` or `from_base`
+    from silently inheriting a linear declaration that no longer applies.
+    """
+
+    matrix = getattr(space, attr)  # type: Optional[Matrix]
+    if matrix is not None:
+        mro = space.mro()
+        method_owner = next(i for i, c in enumerate(mro) if method in vars(c))
+        attr_owner = next(i for i, c in enumerate(mro) if attr in vars(c))
+        if attr_owner > method_owner:
+            return None
+    return matrix
+
+
+def _is_default(space: Type[Space], method: str) -> bool:
+    """Check if the given conversion helper is the default, no-op implementation."""
+
+    return getattr(space, method).__func__ is getattr(Space, method).__func__
+
+
+def _is_3x3(m: Matrix) -> bool:
+    """Check if the matrix is 3x3."""
+
+    return len(m) == 3 and all(len(row) == 3 for row in m)
+
+
+def compile_convert_chain(color_cls: Type['Color'], chain: List[Step]) -> List[Stage]:
+    """
+    Compile a conversion chain into a list of stages.
+
+    Adjacent linear transforms, including any chromatic adaptation, are multiplied together
+    into a single matrix that only needs to be calculated once. Classes that override
+    `chromatic_adaptation` do not use compiled chains, see `adapted_convert`.
+    """
+
+    stages = []  # type: List[Stage]
+    method = color_cls.CHROMATIC_ADAPTATION
+
+    def add_matrix(m: Matrix, name: str) -> None:
+        """Add a matrix stage, combining it with the previous stage if it is also a matrix."""
+
+        if stages and stages[-1][0] == STAGE_MATRIX:
+            prev = stages[-1][1]
+            if _is_3x3(m) and _is_3x3(prev):
+                fused = util.matmul3(m, prev)
+            else:  # pragma: no cover
+                fused = cast(MutableMatrix, util.dot(m, prev))
+            stages[-1] = (STAGE_MATRIX, fused, stages[-1][2] + ' + ' + name)
+        else:
+            stages.append((STAGE_MATRIX, [list(row) for row in m], name))
+
+    def add_adaptation(w1: str, w2: str) -> None:
+        """Add a chromatic adaptation stage if the white points differ."""
+
+        if w1 != w2:
+            add_matrix(cat.get_adaptation_matrix(w1, w2, method), '{}:{}->{}'.format(method, w1, w2))
+
+    for a, b, direction, adapt in chain:
+        if direction == TO_BASE:
+            m = _get_linear(a, 'to_base', 'LINEAR_TO_BASE')
+            if m is None:
+                stages.append((STAGE_FUNC, a.to_base, a.NAME + '.to_base'))
+            else:
+                if not _is_default(a, 'to_linear'):
+                    stages.append((STAGE_FUNC, a.to_linear, a.NAME + '.to_linear'))
+                add_matrix(m, a.NAME + '.LINEAR_TO_BASE')
+            if adapt:
+                add_adaptation(a.WHITE, b.WHITE)
+        else:
+            if adapt:
+                add_adaptation(a.WHITE, b.WHITE)
+            m = _get_linear(b, 'from_base', 'LINEAR_FROM_BASE')
+            if m is None:
+                stages.append((STAGE_FUNC, b.from_base, b.NAME + '.from_base'))
+            else:
+                add_matrix(m, b.NAME + '.LINEAR_FROM_BASE')
+                if not _is_default(b, 'from_linear'):
+                    stages.append((STAGE_FUNC, b.from_linear, b.NAME + '.from_linear'))
+
+    return stages
+
+
+def get_convert_chain(color_cls: Type['Color'], current: Type[Space], space: str) -> List[Stage]:
+    """
+    Get the compiled conversion chain from the current space to the target space.
+
+    Chains are cached per `Color` class and chromatic adaptation method as they only change when plugins
+    are registered or deregistered, at which point the cache is cleared.
+    """
+
+    key = (current.NAME, space, color_cls.CHROMATIC_ADAPTATION)
+    chain = color_cls._CONVERT_CHAINS.get(key)
+    if chain is None:
+        chain = compile_convert_chain(color_cls, calc_convert_chain(color_cls, current, space))
+        color_cls._CONVERT_CHAINS[key] = chain
+    return chain
+
+
+def _get_array(func: Callable[..., Any]) -> Optional[Callable[[Array], Array]]:
+    """
+    Get the NumPy array form of a space's conversion method.
+
+    Like linear declarations, the array form is only trusted if it is defined by the same class,
+    or a subclass of the class, that defines the conversion method.
+    """
+
+    space = getattr(func, '__self__', None)
+    if not isinstance(space, type) or not issubclass(space, Space):
+        return None
+    method = func.__name__
+    attr = method + '_array'
+    mro = space.mro()
+    method_owner = next(i for i, c in enumerate(mro) if method in vars(c))
+    attr_owner = next((i for i, c in enumerate(mro) if attr in vars(c)), len(mro))
+    if attr_owner > method_owner:
+        return None
+    return cast(Callable[[Array], Array], getattr(space, attr))
+
+
+def compile_array_chain(chain: List[Stage]) -> Optional[List[Stage]]:
+    """Compile a conversion chain into stages that operate on `(N, channels)` NumPy arrays."""
+
+    np = util.load_numpy()
+    stages = []  # type: List[Stage]
+    for kind, value, name in chain:
+        if kind == STAGE_MATRIX:
+            stages.append((STAGE_MATRIX, np.transpose(value), name))
+        else:
+            func = _get_array(value)
+            if func is None:
+                return None
+            stages.append((STAGE_FUNC, func, name))
+    return stages
+
+
+def get_convert_array_chain(color_cls: Type['Color'], current: Type[Space], space: str) -> Optional[List[Stage]]:
+    """
+    Get the NumPy conversion chain from the current space to the target space.
+
+    `None` is returned, and cached, if any space in the chain does not provide an array form.
+    `None` is also returned if the class overrides `chromatic_adaptation`.
+    """
+
+    if color_cls._CUSTOM_ADAPTATION:
+        return None
+    key = (current.NAME, space, color_cls.CHROMATIC_ADAPTATION)
+    if key not in color_cls._CONVERT_ARRAY_CHAINS:
+        color_cls._CONVERT_ARRAY_CHAINS[key] = compile_array_chain(get_convert_chain(color_cls, current, space))
+    return color_cls._CONVERT_ARRAY_CHAINS[key]
+
+
+def _compose(func: Converter, kind: int, value: Any) -> Converter:
+    """Compose a conversion stage on top of the given function."""
+
+    if kind == STAGE_MATRIX:
+        m = cast(Matrix, value)
+        if not _is_3x3(m):  # pragma: no cover
+            def matrix(coords: Vector) -> MutableVector:
+                """Apply the matrix."""
+
+                return cast(MutableVector, util.dot(m, func(coords)))
+
+            return matrix
+
+        # Unpack the matrix so the multiplication can be done without any indexing or looping.
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = m
+
+        def matrix3(coords: Vector) -> MutableVector:
+            """Apply the 3x3 matrix."""
+
+            x, y, z = func(coords)
+            return [
+                m00 * x + m01 * y + m02 * z,
+                m10 * x + m11 * y + m12 * z,
+                m20 * x + m21 * y + m22 * z
+            ]
+
+        return matrix3
 
-        # If we still do not match start converting from the point in the conversion chain
-        # where are current color resides
-        if current.NAME != space:
-            start = from_color_index[current.NAME] - 1
+    step = cast(Callable[[MutableVector], MutableVector], value)
 
-            # Convert from XYZ, make sure we chromatically adapt from the appropriate white point
-            if current.NAME == ABSOLUTE_BASE:
-                coords = color.chromatic_adaptation(current.WHITE, from_color[start].WHITE, coords)
+    def call(coords: Vector) -> MutableVector:
+        """Apply the conversion function."""
 
-            for index in range(start, -1, -1):
-                current = from_color[index]
-                coords = current.from_base(coords)
+        return step(func(coords))
+
+    return call
+
+
+def _identity(coords: Vector) -> MutableVector:
+    """Return the coordinates, the start of a single composed stage."""
+
+    return cast(MutableVector, coords)
+
+
+def compose_chain(chain: List[Stage]) -> Converter:
+    """
+    Compose the stages of a compiled conversion chain into a single function.
+
+    Undefined channels are treated as zero, just as they are when converting a color.
+    """
+
+    func = util.no_nans  # type: Converter
+    for kind, value, _ in chain:
+        func = _compose(func, kind, value)
+    return func
+
+
+def get_converter(color_cls: Type['Color'], current: str, space: str) -> Converter:
+    """
+    Get a function that converts coordinates from the current space to the target space.
+
+    Converters are cached per `Color` class and are cleared along with the conversion chains.
+    If the class overrides `chromatic_adaptation`, the converter creates a color from the coordinates
+    so the override can be called on it.
+    """
+
+    key = (current, space, color_cls.CHROMATIC_ADAPTATION)
+    converter = color_cls._CONVERTERS.get(key)
+    if converter is None:
+        obj = color_cls.CS_MAP.get(current)
+        if obj is None:
+            raise ValueError("'{}' is not a valid color space".format(current))
+        if current == space:
+            converter = list
+        elif color_cls._CUSTOM_ADAPTATION:
+            calc_convert_chain(color_cls, obj, space)
+
+            def converter(coords: Vector) -> MutableVector:
+                """Convert the coordinates as a color."""
+
+                return adapted_convert(color_cls._new(current, list(coords), 1.0), space)
+        else:
+            converter = compose_chain(get_convert_chain(color_cls, obj, space))
+        color_cls._CONVERTERS[key] = converter
+    return converter
+
+
+def apply_array_chain(chain: List[Stage], coords: Array) -> Array:
+    """Apply the stages of a compiled NumPy conversion chain to an `(N, channels)` array."""
+
+    for kind, value, _ in chain:
+        if kind == STAGE_MATRIX:
+            # Apply matrices in the precision of the coordinates.
+            coords = coords @ value.astype(coords.dtype, copy=False)
+        else:
+            coords = value(coords)
+    return coords
+
+
+def get_profiled_converter(
+    color_cls: Type['Color'],
+    current: str,
+    space: str,
+    stats: profiler.ProfileStats
+) -> Converter:
+    """
+    Get a converter that records the time spent in each stage of the conversion chain.
+
+    Each stage is composed just as it is by `compose_chain`, so the same implementation is timed.
+    """
+
+    stages = [
+        (_compose(_identity, kind, value), name)
+        for kind, value, name in get_convert_chain(color_cls, color_cls.CS_MAP[current], space)
+    ]
+
+    def converter(coords: Vector) -> MutableVector:
+        """Convert the coordinates, timing each stage."""
+
+        result = util.no_nans(coords)
+        for stage, name in stages:
+            start = time.perf_counter()
+            result = stage(result)
+            stats.record(stats.stages, name, time.perf_counter() - start)
+        return result
+
+    return converter
+
+
+def cached_convert(
+    color_cls: Type['Color'],
+    current: str,
+    space: str,
+    coords: Vector,
+    converter: Optional[Converter] = None
+) -> MutableVector:
+    """
+    Convert the coordinates using the class's least recently used conversion cache.
+
+    Undefined channels are treated as zero when converting, so they are keyed as zero as well.
+    Like `functools.lru_cache`, the cache is guarded by a lock, but conversions are done outside of it.
+    """
+
+    cache = color_cls._CONVERT_CACHE
+    stats = color_cls._CONVERT_CACHE_STATS
+    key = (current, space, color_cls.CHROMATIC_ADAPTATION, tuple(util.no_nans(coords)))
+    with color_cls._CONVERT_CACHE_LOCK:
+        result = cache.get(key)
+        if result is not None:
+            stats[0] += 1
+            cache.move_to_end(key)
+            return list(result)
+        stats[1] += 1
+
+    if converter is None:
+        converter = get_converter(color_cls, current, space)
+    converted = converter(coords)
+    with color_cls._CONVERT_CACHE_LOCK:
+        cache[key] = tuple(converted)
+        while len(cache) > color_cls.CONVERT_CACHE_SIZE:
+            cache.popitem(last=False)
+    return converted
+
+
+def profiled_convert(color: 'Color', space: str, stats: profiler.ProfileStats) -> MutableVector:
+    """Convert the color coordinates to the specified space, recording the time spent."""
+
+    start = time.perf_counter()
+    color_cls = type(color)
+    current = color.space()
+    if space not in color_cls.CS_MAP:
+        raise ValueError("'{}' is not a valid color space".format(space))
+    converter = get_profiled_converter(color_cls, current, space, stats)
+    if color_cls.CONVERT_CACHE_SIZE > 0:
+        coords = cached_convert(color_cls, current, space, color.coords_view(), converter)
+    else:
+        coords = converter(color.coords_view())
+    stats.record(stats.routes, '{} -> {}'.format(current, space), time.perf_counter() - start)
+    return coords
+
+
+def derived_convert(color: 'Color', space: str) -> MutableVector:
+    """
+    Convert the color coordinates to the specified space, remembering the result on the color.
+
+    Entries record the plugin generation, the source space, the chromatic adaptation method, and a
+    snapshot of the source coordinates, so they are only used while none of them have changed. As the snapshot is
+    compared, a mutation through any path invalidates the entry.
+    """
+
+    color_cls = type(color)
+    current = color.space()
+    coords = color.coords_view()
+    stats = profiler.STATE.stats
+    cache = color._derived
+    if cache is None:
+        cache = color._derived = {}
+    else:
+        start = time.perf_counter()
+        entry = cache.get(space)
+        if (
+            entry is not None and
+            entry[0] == color_cls._CACHE_GENERATION and
+            entry[1] == current and
+            entry[2] == color_cls.CHROMATIC_ADAPTATION and
+            entry[3] == coords
+        ):
+            if stats is not None:
+                stats.record(stats.routes, '{} -> {}'.format(current, space), time.perf_counter() - start)
+            return list(entry[4])
+
+    if stats is not None:
+        converted = profiled_convert(color, space, stats)
+    elif color_cls.CONVERT_CACHE_SIZE > 0:
+        converted = cached_convert(color_cls, current, space, coords)
+    else:
+        converted = get_converter(color_cls, current, space)(coords)
+
+    cache.pop(space, None)
+    cache[space] = (
+        color_cls._CACHE_GENERATION, current, color_cls.CHROMATIC_ADAPTATION, list(coords), tuple(converted)
+    )
+    if len(cache) > color_cls.DERIVED_CACHE_SIZE:
+        del cache[next(iter(cache))]
+    return converted
+
+
+def adapted_convert(color: 'Color', space: str) -> MutableVector:
+    """
+    Convert the color coordinates to the specified space, calling the color's `chromatic_adaptation`.
+
+    This is used by classes that override `chromatic_adaptation`. The override may depend on the
+    color being converted, so it is called on the color itself, and nothing is compiled or cached.
+    """
+
+    stats = profiler.STATE.stats
+    start = time.perf_counter()
+    coords = util.no_nans(color.coords_view())
+    for a, b, direction, adapt in calc_convert_chain(type(color), type(color._space), space):
+        if direction == TO_BASE:
+            coords = a.to_base(coords)
+            if adapt:
+                coords = color.chromatic_adaptation(a.WHITE, b.WHITE, coords)
+        else:
+            if adapt:
+                coords = color.chromatic_adaptation(a.WHITE, b.WHITE, coords)
+            coords = b.from_base(coords)
+    if stats is not None:
+        stats.record(stats.routes, '{} -> {}'.format(color.space(), space), time.perf_counter() - start)
+    return coords
+
+
+def convert(color: 'Color', space: str) -> MutableVector:
+    """Convert the color coordinates to the specified space."""
+
+    if color.space() != space:
+        color_cls = type(color)
+        if color_cls._CUSTOM_ADAPTATION:
+            return adapted_convert(color, space)
+        if color_cls.DERIVED_CACHE_SIZE > 0:
+            return derived_convert(color, space)
+        stats = profiler.STATE.stats
+        if stats is not None:
+            return profiled_convert(color, space, stats)
+        if color_cls.CONVERT_CACHE_SIZE > 0:
+            coords = cached_convert(color_cls, color.space(), space, color.coords_view())
+        else:
+            coords = get_converter(color_cls, color.space(), space)(color.coords_view())
 
     else:
         # Nothing to convert, just pass values as is
         coords = color.coords()
 
     return coords
+
+
+def convert_many(
+    color_cls: Type['Color'],
+    current: str,
+    space: str,
+    coords: Union[Iterable[Vector], Array]
+) -> Union[List[MutableVector], Array]:
+    """
+    Convert many sets of coordinates from the current space to the specified space.
+
+    The conversion chain is only resolved once and no intermediate color objects are created.
+    When NumPy is available and the chain can be vectorized, all coordinates are converted at once.
+    A NumPy array input returns an `(N, channels)` NumPy array, anything else returns a list of lists.
+    """
+
+    obj = color_cls.CS_MAP.get(current)
+    if obj is None:
+        raise ValueError("'{}' is not a valid color space".format(current))
+
+    np = util.load_numpy()
+    is_array = np is not None and isinstance(coords, np.ndarray)
+    # `float32` arrays are converted, and returned, in single precision, anything else in double precision.
+    dtype = np.float32 if is_array and cast(Array, coords).dtype == np.float32 else float
+
+    if current == space:
+        return np.array(coords, dtype=dtype) if is_array else [list(c) for c in coords]
+
+    if np is not None:
+        array_chain = get_convert_array_chain(color_cls, obj, space)
+        if array_chain is not None:
+            values = np.array(coords if is_array else list(coords), dtype=dtype)
+            if values.size == 0:
+                return values if is_array else []
+            values = apply_array_chain(array_chain, util.no_nans_array(values)).astype(dtype, copy=False)
+            return values if is_array else values.tolist()
+
+    converter = get_converter(color_cls, current, space)
+    result = [converter(c) for c in coords]
+    return np.array(result, dtype=dtype) if is_array else result
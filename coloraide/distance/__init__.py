@@ -15,8 +15,8 @@ def distance_euclidean(color: 'Color', sample: 'Color', space: str = "lab") -> f
     https://en.wikipedia.org/wiki/Euclidean_distance
     """
 
-    coords1 = util.no_nans(color.convert(space).coords())
-    coords2 = util.no_nans(sample.convert(space).coords())
+    coords1 = util.no_nans(color.convert(space).coords_view())
+    coords2 = util.no_nans(sample.convert(space).coords_view())
 
     return math.sqrt(sum((x - y) ** 2.0 for x, y in zip(coords1, coords2)))
 
@@ -28,8 +28,8 @@ class DECMC(DeltaE):
         http://www.brucelindbloom.com/index.html?Eqn_DeltaE_CMC.html
         """
 
-        l1, a1, b1 = util.no_nans(color.convert("lab").coords())
-        l2, a2, b2 = util.no_nans(sample.convert("lab").coords())
+        l1, a1, b1 = util.no_nans(color.convert("lab").coords_view())
+        l2, a2, b2 = util.no_nans(sample.convert("lab").coords_view())
 
         # Equation (3)
         c1 = math.sqrt(a1 ** 2 + b1 ** 2)
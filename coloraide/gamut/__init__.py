@@ -12,7 +12,7 @@ if TYPE_CHECKING:  # pragma: no cover
 def clip_channels(color: 'Color') -> MutableVector:
     """Clip channels."""
 
-    channels = util.no_nans(color.coords())
+    channels = util.no_nans(color.coords_view())
     fit = []
 
     for i, value in enumerate(channels):
@@ -40,7 +40,7 @@ def clip_channels(color: 'Color') -> MutableVector:
 def verify(color: 'Color', tolerance: float) -> bool:
     """Verify the values are in bound."""
 
-    channels = util.no_nans(color.coords())
+    channels = util.no_nans(color.coords_view())
     for i, value in enumerate(channels):
         bounds = color._space.BOUNDS[i]
         a = bounds.lower  # type: Optional[float]
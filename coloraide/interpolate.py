@@ -18,7 +18,7 @@ from abc import ABCMeta, abstractmethod
 from collections import namedtuple
 from . import util
 from .spaces import Cylindrical, FLG_ANGLE
-from typing import Optional, Callable, Sequence, Mapping, Type, Dict, List, Any, Union, cast, TYPE_CHECKING
+from typing import Optional, Callable, Sequence, Mapping, Type, Dict, List, Tuple, Any, Union, cast, TYPE_CHECKING
 from .util import Vector, ColorInput
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -130,7 +130,7 @@ class InterpolateSingle(Interpolator):
                 lerp = progress if isinstance(progress, Lerp) else Lerp(progress)
                 value = lerp(c1, c2, p)
             channels.append(value)
-        color = self.create(self.space, channels[:-1], channels[-1])
+        color = self.create._new(self.space, channels[:-1], util.clamp(channels[-1], 0.0, 1.0))
         if self.premultiplied:
             postdivide(color)
         if self.outspace != color.space():
@@ -253,7 +253,7 @@ def postdivide(color: 'Color') -> None:
     if color.alpha >= 1.0:
         return
 
-    channels = color.coords()
+    channels = color.coords_view()
     alpha = color.alpha
     coords = []
     for i, value in enumerate(channels):
@@ -272,7 +272,7 @@ def premultiply(color: 'Color') -> None:
     if color.alpha >= 1.0:
         return
 
-    channels = color.coords()
+    channels = color.coords_view()
     alpha = color.alpha
     coords = []
     for i, value in enumerate(channels):
@@ -285,24 +285,17 @@ def premultiply(color: 'Color') -> None:
     color._space._coords = coords
 
 
-def adjust_hues(color1: 'Color', color2: 'Color', hue: str) -> None:
-    """Adjust hues."""
+def adjust_hue(c1: float, c2: float, hue: str) -> Tuple[float, float]:
+    """Adjust a pair of hues for interpolation, hue adjusters must be lower case."""
 
-    hue = hue.lower()
     if hue == "specified":
-        return
-
-    name = cast(Cylindrical, color1._space).hue_name()
-    c1 = color1.get(name)
-    c2 = color2.get(name)
+        return c1, c2
 
     c1 = c1 % 360
     c2 = c2 % 360
 
     if util.is_nan(c1) or util.is_nan(c2):
-        color1.set(name, c1)
-        color2.set(name, c2)
-        return
+        return c1, c2
 
     if hue == "shorter":
         if c2 - c1 > 180:
@@ -327,6 +320,18 @@ def adjust_hues(color1: 'Color', color2: 'Color', hue: str) -> None:
     else:
         raise ValueError("Unknown hue adjuster '{}'".format(hue))
 
+    return c1, c2
+
+
+def adjust_hues(color1: 'Color', color2: 'Color', hue: str) -> None:
+    """Adjust hues."""
+
+    hue = hue.lower()
+    if hue == "specified":
+        return
+
+    name = cast(Cylindrical, color1._space).hue_name()
+    c1, c2 = adjust_hue(color1.get(name), color2.get(name), hue)
     color1.set(name, c1)
     color2.set(name, c2)
 
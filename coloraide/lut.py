@@ -0,0 +1,263 @@
+"""
+3D lookup tables.
+
+A lookup table samples a conversion over a regular grid spanning the bounds of the source space.
+Conversions are then approximated by interpolating the nearest samples. This is only cheaper than
+the exact conversion when the exact conversion is expensive, such as to Okhsl and Okhsv. Conversions
+to spaces like Lab, JzCzhz, and ICtCp are faster, and exact, without a table, both per color and with
+`convert_many`.
+
+Errors are largest near the achromatic axis, where hues change rapidly, and near the edge of the
+gamut approximations used by Okhsl and Okhsv, and do not shrink much with larger tables. With the
+default size, sRGB colors converted to Okhsl or Okhsv are within 0.04 of the exact conversion in
+Oklab, and usually within 0.015.
+"""
+import math
+from . import convert
+from . import util
+from .spaces import Cylindrical
+from .util import Vector, MutableVector, Array
+from typing import Iterable, List, Optional, Type, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .color import Color
+
+METHODS = ('trilinear', 'tetrahedral')
+
+
+class LUT:
+    """
+    A 3D lookup table that approximates the conversion between two color spaces.
+
+    Coordinates outside the bounds of the source space are converted exactly.
+    """
+
+    def __init__(
+        self,
+        color_cls: Type['Color'],
+        current: str,
+        space: str,
+        size: int = 33,
+        method: str = 'tetrahedral'
+    ) -> None:
+        """Initialize."""
+
+        if method not in METHODS:
+            raise ValueError("'{}' is not a valid lookup table interpolation method".format(method))
+        if size < 2:
+            raise ValueError("Lookup table size must be at least 2, not {}".format(size))
+
+        obj = color_cls.CS_MAP.get(current)
+        if obj is None:
+            raise ValueError("'{}' is not a valid color space".format(current))
+        if len(obj.CHANNEL_NAMES) != 3:
+            raise ValueError("Lookup tables require a color space with 3 channels, '{}' is not".format(current))
+
+        self.current = current
+        self.space = space
+        self.size = size
+        self.method = method
+        self.domain = [(b.lower, b.upper) for b in obj.BOUNDS]
+        self.exact = convert.get_converter(color_cls, current, space)
+        self._color_cls = color_cls
+
+        # Hues are stored as a unit vector so they can be interpolated across 0/360.
+        target = color_cls.CS_MAP[space]
+        self._src_hue = obj.hue_index() if issubclass(obj, Cylindrical) else -1
+        self._hue = target.hue_index() if issubclass(target, Cylindrical) else -1
+
+        steps = [[lo + (hi - lo) * i / (size - 1) for i in range(size)] for lo, hi in self.domain]
+        self._table = [
+            self._encode(coords) for coords in color_cls.convert_many(
+                current,
+                space,
+                [[x, y, z] for x in steps[0] for y in steps[1] for z in steps[2]]
+            )
+        ]
+        # The table as a NumPy array, created on first use by `convert_many`.
+        self._array = None  # type: Optional[Array]
+
+    def _encode(self, coords: Vector) -> MutableVector:
+        """Encode converted coordinates for storage in the table."""
+
+        values = list(coords)
+        if self._hue >= 0:
+            h = values.pop(self._hue)
+            if math.isnan(h):
+                values.extend([0.0, 0.0])
+            else:
+                values.extend([math.cos(math.radians(h)), math.sin(math.radians(h))])
+        return values
+
+    def _decode(self, values: MutableVector) -> MutableVector:
+        """Decode interpolated table values to coordinates."""
+
+        if self._hue >= 0:
+            hy = values.pop()
+            hx = values.pop()
+            # Only samples without a hue contributed to this value.
+            h = util.NaN if hx == 0 and hy == 0 else math.degrees(math.atan2(hy, hx)) % 360
+            values.insert(self._hue, h)
+        return values
+
+    def __call__(self, coords: Vector) -> MutableVector:
+        """Convert the coordinates using the lookup table."""
+
+        coords = util.no_nans(coords)
+        if self._src_hue >= 0:
+            coords[self._src_hue] %= 360
+
+        size = self.size
+        index = []
+        fraction = []
+        for c, (lo, hi) in zip(coords, self.domain):
+            if not lo <= c <= hi:
+                return self.exact(coords)
+            p = (c - lo) / (hi - lo) * (size - 1)
+            i = min(int(p), size - 2)
+            index.append(i)
+            fraction.append(p - i)
+
+        table = self._table
+        i, j, k = index
+        fx, fy, fz = fraction
+        base = (i * size + j) * size + k
+        sx = size * size
+
+        if self.method == 'tetrahedral':
+            # Walk from the lower corner to the upper corner along the axes in order of
+            # the largest fractional offset, this selects the enclosing tetrahedron.
+            if fx >= fy:
+                if fy >= fz:
+                    c1, c2, f1, f2, f3 = base + sx, base + sx + size, fx, fy, fz
+                elif fx >= fz:
+                    c1, c2, f1, f2, f3 = base + sx, base + sx + 1, fx, fz, fy
+                else:
+                    c1, c2, f1, f2, f3 = base + 1, base + sx + 1, fz, fx, fy
+            elif fx >= fz:
+                c1, c2, f1, f2, f3 = base + size, base + sx + size, fy, fx, fz
+            elif fy >= fz:
+                c1, c2, f1, f2, f3 = base + size, base + size + 1, fy, fz, fx
+            else:
+                c1, c2, f1, f2, f3 = base + 1, base + size + 1, fz, fy, fx
+            result = [
+                a + f1 * (b - a) + f2 * (c - b) + f3 * (d - c)
+                for a, b, c, d in zip(table[base], table[c1], table[c2], table[base + sx + size + 1])
+            ]
+        else:
+            result = []
+            for c000, c001, c010, c011, c100, c101, c110, c111 in zip(
+                table[base],
+                table[base + 1],
+                table[base + size],
+                table[base + size + 1],
+                table[base + sx],
+                table[base + sx + 1],
+                table[base + sx + size],
+                table[base + sx + size + 1]
+            ):
+                c00 = c000 + (c100 - c000) * fx
+                c01 = c001 + (c101 - c001) * fx
+                c10 = c010 + (c110 - c010) * fx
+                c11 = c011 + (c111 - c011) * fx
+                c0 = c00 + (c10 - c00) * fy
+                c1 = c01 + (c11 - c01) * fy
+                result.append(c0 + (c1 - c0) * fz)
+
+        return self._decode(result)
+
+    def max_error(self) -> List[float]:
+        """
+        Get the maximum error of each channel against the exact conversion.
+
+        Colors are sampled at the center of every cell of the table, which is where interpolation
+        is least accurate. Hue errors are measured as the shortest angle and are ignored when either
+        hue is undefined.
+        """
+
+        size = self.size
+        steps = [[lo + (hi - lo) * (i + 0.5) / (size - 1) for i in range(size - 1)] for lo, hi in self.domain]
+        points = [[x, y, z] for x in steps[0] for y in steps[1] for z in steps[2]]
+        exact = self._color_cls.convert_many(self.current, self.space, points)
+
+        errors = [0.0] * len(exact[0])
+        for point, expected in zip(points, exact):
+            for n, (a, b) in enumerate(zip(self(point), expected)):
+                if n == self._hue:
+                    if math.isnan(a) or math.isnan(b):
+                        continue
+                    diff = abs(a - b) % 360
+                    diff = min(diff, 360 - diff)
+                else:
+                    diff = abs(a - b)
+                if diff > errors[n]:
+                    errors[n] = diff
+        return errors
+
+    def convert_many(self, coords: Union[Iterable[Vector], Array]) -> Union[List[MutableVector], Array]:
+        """
+        Convert many coordinates using the lookup table.
+
+        With NumPy, all coordinates are interpolated at once, which is much faster than calling the
+        table for each color. A NumPy array input returns a NumPy array, anything else returns a list.
+        Without NumPy, each color is converted by calling the table.
+        """
+
+        np = util.load_numpy()
+        if np is None:  # pragma: no cover
+            return [self(c) for c in coords]
+
+        is_array = isinstance(coords, np.ndarray)
+        values = util.no_nans_array(np.array(coords if is_array else list(coords), dtype=float).reshape(-1, 3))
+        if self._src_hue >= 0:
+            values[:, self._src_hue] %= 360
+
+        lo = np.array([d[0] for d in self.domain])
+        hi = np.array([d[1] for d in self.domain])
+        inside = np.all((values >= lo) & (values <= hi), axis=1)
+        points = values if inside.all() else values[inside]
+
+        size = self.size
+        if self._array is None:
+            self._array = np.array(self._table, dtype=float)
+        table = self._array
+        p = (points - lo) * ((size - 1) / (hi - lo))
+        index = np.minimum(p.astype(int), size - 2)
+        fraction = p - index
+        offsets = np.array([size * size, size, 1])
+        base = index @ offsets
+        last = base + (size * size + size + 1)
+
+        if self.method == 'tetrahedral':
+            # Walk from the lower corner to the upper corner along the axes in order of the largest
+            # fractional offset. Ties select different tetrahedra, but they interpolate the same value.
+            fmax = fraction.max(axis=1)[:, None]
+            fmin = fraction.min(axis=1)[:, None]
+            fmid = fraction.sum(axis=1)[:, None] - fmax - fmin
+            t0 = table.take(base, axis=0)
+            t1 = table.take(base + offsets[fraction.argmax(axis=1)], axis=0)
+            t2 = table.take(last - offsets[fraction.argmin(axis=1)], axis=0)
+            t3 = table.take(last, axis=0)
+            result = t0 + fmax * (t1 - t0) + fmid * (t2 - t1) + fmin * (t3 - t2)
+        else:
+            fx, fy, fz = fraction[:, :1], fraction[:, 1:2], fraction[:, 2:]
+            corners = []
+            for o in (0, 1, size, size + 1):
+                a = table.take(base + o, axis=0)
+                corners.append(a + (table.take(base + (size * size + o), axis=0) - a) * fx)
+            c0 = corners[0] + (corners[2] - corners[0]) * fy
+            c1 = corners[1] + (corners[3] - corners[1]) * fy
+            result = c0 + (c1 - c0) * fz
+
+        if self._hue >= 0:
+            hx, hy = result[:, -2], result[:, -1]
+            # Only samples without a hue contributed to values of zero.
+            h = np.where((hx == 0) & (hy == 0), util.NaN, np.degrees(np.arctan2(hy, hx)) % 360)
+            result = np.insert(result[:, :-2], self._hue, h, axis=1)
+
+        if points is not values:
+            converted = np.empty((len(values), result.shape[1]))
+            converted[inside] = result
+            converted[~inside] = self._color_cls.convert_many(self.current, self.space, values[~inside])
+            result = converted
+        return result if is_array else result.tolist()
@@ -0,0 +1,88 @@
+"""
+Parse many color strings in parallel.
+
+Strings are split into chunks that are parsed by a pool of worker processes. Workers send back
+each color's space, coordinates, and alpha instead of pickled colors, and the colors are rebuilt
+by the parent. The `Color` class is sent to workers by reference, so it must be importable from
+a module. Workers only try the color spaces registered with the class in the parent, but color
+spaces registered outside of its module are not seen by the workers, and strings in those color
+spaces are reported as invalid.
+"""
+import os
+from collections import namedtuple
+from itertools import repeat
+from . import tokenizer
+from typing import Iterable, List, Optional, Sequence, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .color import Color
+
+# Parsed colors, `None` for strings that are not valid colors, and the indexes of those strings.
+ParseResult = namedtuple('ParseResult', ['colors', 'invalid'])
+
+
+def parse_chunk(
+    color_cls: Type['Color'],
+    strings: Sequence[str],
+    filters: Optional[Sequence[str]] = None
+) -> List[tokenizer.ParseEntry]:
+    """Parse a chunk of color strings into their color space, coordinates, and alpha."""
+
+    entries = []  # type: List[tokenizer.ParseEntry]
+    for string in strings:
+        obj = None
+        if isinstance(string, str):
+            if color_cls.PARSE_CACHE_SIZE > 0:
+                obj = tokenizer.cached_parse(color_cls, string, filters)
+            else:
+                m = color_cls._match(string, fullmatch=True, filters=filters)
+                if m is not None:
+                    obj = m[0]
+        entries.append((obj.NAME, tuple(obj.coords_view()), obj.alpha) if obj is not None else None)
+    return entries
+
+
+def parse_many(
+    color_cls: Type['Color'],
+    strings: Iterable[str],
+    filters: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 4096
+) -> ParseResult:
+    """
+    Parse many color strings, using a pool of worker processes when there is more than one chunk.
+
+    `workers` defaults to the number of CPUs, and a single worker parses in the current process.
+    """
+
+    if chunksize < 1:
+        raise ValueError("'chunksize' must be at least 1, not {}".format(chunksize))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("'workers' must be at least 1, not {}".format(workers))
+
+    items = list(strings)
+    chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+    results = []  # type: List[List[tokenizer.ParseEntry]]
+    if workers == 1 or len(chunks) < 2:
+        results = [parse_chunk(color_cls, chunk, filters) for chunk in chunks]
+    else:
+        # Imported when needed as it is slow to import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers may not share the parent's registered plugins, so restrict them to the parent's color spaces.
+        names = [name for name in color_cls.CS_MAP if not filters or name in filters]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(parse_chunk, repeat(color_cls), chunks, repeat(names)))
+
+    colors = []  # type: List[Optional[Color]]
+    invalid = []  # type: List[int]
+    for entries in results:
+        for entry in entries:
+            if entry is None or entry[0] not in color_cls.CS_MAP:
+                invalid.append(len(colors))
+                colors.append(None)
+            else:
+                colors.append(color_cls._new(entry[0], list(entry[1]), entry[2]))
+    return ParseResult(colors, invalid)
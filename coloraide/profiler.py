@@ -0,0 +1,85 @@
+"""
+Conversion profiling.
+
+Profiling is disabled unless a `profile` context is active, in which case conversions
+take an instrumented path that records how often each part of the pipeline runs and
+how long it takes. Contexts are tracked per thread, so a context only records the
+conversions made by the thread that entered it.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Iterator, Optional
+
+
+class ProfileStats:
+    """
+    Counts and cumulative times in seconds, stored as `[count, time]`.
+
+    - `calls`: public API calls such as `Color.convert`, which includes creating the new color.
+    - `routes`: conversions between a source and target color space.
+    - `stages`: individual stages of a conversion, such as a space's `to_base`, or a matrix
+      combining linear transforms and chromatic adaptation.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+
+        self.calls = {}  # type: Dict[str, List[float]]
+        self.routes = {}  # type: Dict[str, List[float]]
+        self.stages = {}  # type: Dict[str, List[float]]
+
+    @staticmethod
+    def record(mapping: Dict[str, List[float]], name: str, elapsed: float) -> None:
+        """Record a timing under the given name."""
+
+        entry = mapping.get(name)
+        if entry is None:
+            mapping[name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+
+    def report(self) -> str:
+        """Format the statistics as a table sorted by total time."""
+
+        lines = []
+        for title, mapping in (('Calls', self.calls), ('Routes', self.routes), ('Stages', self.stages)):
+            lines.append('{:<60} {:>10} {:>12} {:>12}'.format(title, 'count', 'total (ms)', 'mean (us)'))
+            for name, (count, total) in sorted(mapping.items(), key=lambda i: i[1][1], reverse=True):
+                lines.append(
+                    '{:<60} {:>10d} {:>12.3f} {:>12.3f}'.format(name, int(count), total * 1e3, total / count * 1e6)
+                )
+            lines.append('')
+        return '\n'.join(lines)
+
+    def __str__(self) -> str:
+        """Return the report."""
+
+        return self.report()
+
+
+class State(threading.local):
+    """Profiling state of the current thread."""
+
+    # The statistics of the innermost active `profile` context.
+    stats = None  # type: Optional[ProfileStats]
+
+
+STATE = State()
+
+
+@contextmanager
+def profile() -> Iterator[ProfileStats]:
+    """
+    Profile conversions made by the current thread within the context.
+
+    Contexts can be nested, only the innermost context records statistics.
+    """
+
+    previous = STATE.stats
+    stats = ProfileStats()
+    STATE.stats = stats
+    try:
+        yield stats
+    finally:
+        STATE.stats = previous
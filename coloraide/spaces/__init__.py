@@ -1,7 +1,8 @@
 """Color base."""
+import re
 from abc import ABCMeta, abstractmethod
 from .. import util
-from ..util import Vector, MutableVector
+from ..util import Vector, MutableVector, Matrix, Array
 from .. import parse
 from typing import Tuple, Dict, Pattern, Optional, Union, Sequence, Any, List, cast, Type, TYPE_CHECKING
 
@@ -22,6 +23,35 @@ color\(\s*
 )
 
 
+class LazyPattern:
+    """
+    A regular expression pattern that is compiled the first time it is used.
+
+    Once compiled, the pattern replaces this descriptor on the class that defines it.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """Initialize."""
+
+        self.pattern = pattern
+        self.owner = None  # type: Optional[type]
+        self.name = ''
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Remember where the pattern is defined."""
+
+        self.owner = owner
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Pattern[str]:
+        """Compile the pattern."""
+
+        compiled = re.compile(self.pattern)
+        if self.owner is not None:
+            setattr(self.owner, self.name, compiled)
+        return compiled
+
+
 # From CIE 2004 Colorimetry T.3 and T.8
 # B from https://en.wikipedia.org/wiki/Standard_illuminant#White_point
 WHITES = {
@@ -85,6 +115,8 @@ class GamutUnbound(Bounds):
 class Cylindrical:
     """Cylindrical space."""
 
+    __slots__ = ()
+
     @classmethod
     def hue_name(cls) -> str:
         """Hue channel name."""
@@ -101,6 +133,8 @@ class Cylindrical:
 class Labish:
     """Lab-ish color spaces."""
 
+    __slots__ = ()
+
     @classmethod
     def labish_names(cls) -> Tuple[str, ...]:
         """Return Lab-ish names in the order L a b."""
@@ -118,6 +152,8 @@ class Labish:
 class Lchish(Cylindrical):
     """Lch-ish color spaces."""
 
+    __slots__ = ()
+
     @classmethod
     def lchish_names(cls) -> Tuple[str, ...]:  # pragma: no cover
         """Return Lch-ish names in the order L c h."""
@@ -135,18 +171,38 @@ class Lchish(Cylindrical):
 class BaseSpace(ABCMeta):
     """Ensure on subclass that the subclass has new instances of mappings."""
 
+    def __new__(mcls, name: str, bases: Tuple[type, ...], clsdict: Dict[str, Any]) -> 'BaseSpace':
+        """
+        Keep the library's subclasses slotted, unless they define their own slots.
+
+        Subclasses defined outside the library keep an instance dictionary unless they define slots.
+        """
+
+        if clsdict.get('__module__', '').startswith('coloraide.'):
+            clsdict.setdefault('__slots__', ())
+        return super().__new__(mcls, name, bases, clsdict)
+
     def __init__(cls, name: str, bases: Tuple[object, ...], clsdict: Dict[str, Any]) -> None:
         """Copy mappings on subclass."""
 
         if len(cls.mro()) > 2:
             cls.CHANNEL_ALIASES = cls.CHANNEL_ALIASES.copy()  # type: Dict[str, str]
 
+        # Index of each channel by name and alias.
+        index = {name: i for i, name in enumerate(cast(Type['Space'], cls).CHANNEL_NAMES)}
+        for alias, name in cls.CHANNEL_ALIASES.items():
+            if name in index:
+                index[alias] = index[name]
+        cls._CHANNEL_INDEX = index
+
 
 class Space(
     metaclass=BaseSpace
 ):
     """Base color space object."""
 
+    __slots__ = ('_coords', '_alpha')
+
     BASE = ""  # type: str
     # Color space name
     NAME = ""
@@ -156,12 +212,19 @@ class Space(
     CHANNEL_NAMES = tuple()  # type: Tuple[str, ...]
     # Channel aliases
     CHANNEL_ALIASES = {}  # type: Dict[str, str]
+    # Index of channels by name and alias, generated from the above.
+    _CHANNEL_INDEX = {}  # type: Dict[str, int]
     # For matching the default form of `color(space coords+ / alpha)`.
     # Classes should define this if they want to use the default match.
     DEFAULT_MATCH = None  # type: Optional[Pattern[str]]
     # Match pattern variable for classes to override so we can also
     # maintain the default and other alternatives.
     MATCH = None  # type: Optional[Pattern[str]]
+    # Tokens that start the colors matched by `MATCH`: function names followed by `(`, such as `rgb(`,
+    # `#` for hex colors, and `<ident>` for identifiers, such as color names. `color(` is always matched
+    # for the serialized names. Colors are only matched with the spaces that declare their token,
+    # unless a space overrides `match` and leaves this as `None`, in which case it is always tried.
+    MATCH_TOKENS = None  # type: Optional[Tuple[str, ...]]
     # Should this color also be checked in a different color space? Only when set to a string (specifying a color space)
     # will the default gamut checking also check the specified space as well as the current.
     #
@@ -175,6 +238,13 @@ class Space(
     BOUNDS = tuple()  # type: Tuple[Bounds, ...]
     # White point
     WHITE = "D50"
+    # Spaces whose conversion to their base is purely linear, or is a non-linear transform followed by a linear one,
+    # can expose the linear part as a matrix. When defined, `to_base(coords)` must be equivalent to
+    # `dot(LINEAR_TO_BASE, to_linear(coords))` and `from_base(coords)` must be equivalent to
+    # `from_linear(dot(LINEAR_FROM_BASE, coords))`. This allows conversions to combine adjacent linear
+    # transforms, chromatic adaptation included, into a single matrix.
+    LINEAR_TO_BASE = None  # type: Optional[Matrix]
+    LINEAR_FROM_BASE = None  # type: Optional[Matrix]
 
     def __init__(self, color: Union['Space', Vector], alpha: Optional[float] = None) -> None:
         """Initialize."""
@@ -184,7 +254,7 @@ class Space(
         self._coords = [util.NaN] * num_channels
 
         if isinstance(color, Space):
-            for index, channel in enumerate(color.coords()):
+            for index, channel in enumerate(color.coords_view()):
                 setattr(self, self.CHANNEL_NAMES[index], channel)
             self.alpha = color.alpha
         elif isinstance(color, Sequence):
@@ -200,10 +270,24 @@ class Space(
             # Only likely to happen with direct usage internally.
             raise TypeError("Unexpected type '{}' received".format(type(color)))
 
+    @classmethod
+    def _new(cls, coords: MutableVector, alpha: float) -> 'Space':
+        """
+        Create the color space object from trusted values without validation.
+
+        Coordinates must be a list of floats, one per channel, and alpha must already be clamped.
+        The list is used directly and is not copied.
+        """
+
+        obj = cls.__new__(cls)
+        obj._coords = coords
+        obj._alpha = alpha
+        return obj
+
     def __repr__(self) -> str:
         """Representation."""
 
-        values = [util.fmt_float(coord, util.DEF_PREC) for coord in self.coords()]
+        values = [util.fmt_float(coord, util.DEF_PREC) for coord in self._coords]
 
         return 'color({} {} / {})'.format(
             self._serialize()[0],
@@ -225,6 +309,15 @@ class Space(
 
         return self._coords[:]
 
+    def coords_view(self) -> Vector:
+        """
+        Coordinates without copying.
+
+        This is the color's own storage, so it reflects later changes and must not be modified.
+        """
+
+        return self._coords
+
     @classmethod
     def _serialize(cls) -> Tuple[str, ...]:
         """Get the serialized name."""
@@ -277,6 +370,50 @@ class Space(
     def from_base(cls, coords: MutableVector) -> MutableVector:  # pragma: no cover
         """From base color."""
 
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:  # pragma: no cover
+        """
+        Vectorized form of `to_base` that operates on an `(N, channels)` NumPy array.
+
+        Spaces that do not implement this will not be vectorized in bulk conversions.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:  # pragma: no cover
+        """
+        Vectorized form of `from_base` that operates on an `(N, channels)` NumPy array.
+
+        Spaces that do not implement this will not be vectorized in bulk conversions.
+        """
+
+        raise NotImplementedError
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """Apply the non-linear portion of the conversion to base that precedes `LINEAR_TO_BASE`."""
+
+        return coords
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """Apply the non-linear portion of the conversion from base that follows `LINEAR_FROM_BASE`."""
+
+        return coords
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """Vectorized form of `to_linear` that operates on an `(N, channels)` NumPy array."""
+
+        return coords
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """Vectorized form of `from_linear` that operates on an `(N, channels)` NumPy array."""
+
+        return coords
+
     def to_string(
         self,
         parent: 'Color',
@@ -296,7 +433,7 @@ class Space(
         alpha = alpha is not False and (alpha is True or a < 1.0 or util.is_nan(a))
 
         method = None if not isinstance(fit, str) else fit
-        coords = parent.fit(method=method).coords() if fit else self.coords()
+        coords = parent.fit(method=method).coords_view() if fit else self.coords_view()
         if not none:
             coords = util.no_nans(coords)
 
@@ -1,10 +1,8 @@
 """A98 RGB color class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .srgb import SRGB
 from .. import util
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 RGB_TO_XYZ = [
     [0.5766690429101304, 0.18555823790654635, 0.18822864623499475],
@@ -29,13 +27,13 @@ def lin_a98rgb_to_xyz(rgb: MutableVector) -> MutableVector:
     https://www.adobe.com/digitalimag/pdfs/AdobeRGB1998.pdf
     """
 
-    return cast(MutableVector, util.dot(RGB_TO_XYZ, rgb))
+    return util.matvec3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_a98rgb(xyz: MutableVector) -> MutableVector:
     """Convert XYZ to linear-light a98-rgb."""
 
-    return cast(MutableVector, util.dot(XYZ_TO_RGB, xyz))
+    return util.matvec3(XYZ_TO_RGB, xyz)
 
 
 def lin_a98rgb(rgb: MutableVector) -> MutableVector:
@@ -50,13 +48,27 @@ def gam_a98rgb(rgb: MutableVector) -> MutableVector:
     return [util.npow(val, 256 / 563) for val in rgb]
 
 
+def lin_a98rgb_array(rgb: Array) -> Array:
+    """Convert a NumPy array of a98-rgb values to linear light (un-corrected) form."""
+
+    return util.npow_array(rgb, 563 / 256)
+
+
+def gam_a98rgb_array(rgb: Array) -> Array:
+    """Convert a NumPy array of linear-light a98-rgb values to gamma corrected form."""
+
+    return util.npow_array(rgb, 256 / 563)
+
+
 class A98RGB(SRGB):
     """A98 RGB class."""
 
     BASE = "xyz-d65"
     NAME = "a98-rgb"
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = RGB_TO_XYZ
+    LINEAR_FROM_BASE = XYZ_TO_RGB
 
     @classmethod
     def to_base(cls, coords: MutableVector) -> MutableVector:
@@ -69,3 +81,39 @@ class A98RGB(SRGB):
         """From XYZ to A98 RGB."""
 
         return gam_a98rgb(xyz_to_lin_a98rgb(coords))
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """To linear light."""
+
+        return lin_a98rgb(coords)
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """From linear light."""
+
+        return gam_a98rgb(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from A98 RGB."""
+
+        return util.dot_array(RGB_TO_XYZ, lin_a98rgb_array(coords))
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to A98 RGB."""
+
+        return gam_a98rgb_array(util.dot_array(XYZ_TO_RGB, coords))
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """To linear light."""
+
+        return lin_a98rgb_array(coords)
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """From linear light."""
+
+        return gam_a98rgb_array(coords)
@@ -3,11 +3,11 @@ Din99o class.
 
 https://de.wikipedia.org/wiki/DIN99-Farbraum
 """
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .lab import Lab
-import re
 import math
-from ..util import MutableVector
+from .. import util
+from ..util import MutableVector, Array
 
 KE = 1
 KCH = 1
@@ -90,13 +90,55 @@ def din99o_to_lab(din99o: MutableVector) -> MutableVector:
     ]
 
 
+def lab_to_din99o_array(lab: Array) -> Array:
+    """Lab to Din99o for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, a, b = lab.T
+    val = 1 + C2 * l
+    l99o = C1 * np.copysign(np.log(np.abs(val)), val) / KE
+
+    eo = a * math.cos(RADS) + b * math.sin(RADS)
+    fo = FACTOR * (b * math.cos(RADS) - a * math.sin(RADS))
+    go = np.sqrt(eo ** 2 + fo ** 2)
+    val = 1 + C3 * go
+    c99o = np.copysign(np.log(np.abs(val)), val) / (C4 * KE * KCH)
+    h99o = np.arctan2(fo, eo) + RADS
+
+    # Achromatic values have no chroma, so the hue does not affect them.
+    return np.stack([l99o, c99o * np.cos(h99o), c99o * np.sin(h99o)], axis=-1)
+
+
+def din99o_to_lab_array(din99o: Array) -> Array:
+    """Din99o to Lab for NumPy arrays."""
+
+    np = util.load_numpy()
+    l99o, a99o, b99o = din99o.T
+    h99o = np.arctan2(b99o, a99o)
+    c99o = np.sqrt(a99o ** 2 + b99o ** 2)
+
+    val = C4 * c99o * KCH * KE
+    g = (np.copysign(np.exp(np.abs(val)), val) - 1) / C3
+    e = g * np.cos(h99o - RADS)
+    f = g * np.sin(h99o - RADS)
+
+    return np.stack(
+        [
+            (np.exp((l99o * KE) / C1) - 1) / C2,
+            e * math.cos(RADS) - (f / FACTOR) * math.sin(RADS),
+            e * math.sin(RADS) + (f / FACTOR) * math.cos(RADS)
+        ],
+        axis=-1
+    )
+
+
 class Din99o(Lab):
     """Din99o class."""
 
     BASE = 'xyz-d65'
     NAME = "din99o"
     SERIALIZE = ("--din99o",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     @classmethod
@@ -110,3 +152,15 @@ class Din99o(Lab):
         """From XYZ to Din99o."""
 
         return lab_to_din99o(super().from_base(coords))
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from Din99o."""
+
+        return super().to_base_array(din99o_to_lab_array(coords))
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to Din99o."""
+
+        return lab_to_din99o_array(super().from_base_array(coords))
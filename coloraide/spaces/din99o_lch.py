@@ -1,10 +1,9 @@
 """Din99o Lch class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .lch import Lch
 from .. import util
 import math
-import re
-from ..util import MutableVector
+from ..util import MutableVector, Array
 
 ACHROMATIC_THRESHOLD = 0.0000000002
 
@@ -42,13 +41,40 @@ def lab_to_lch(lab: MutableVector) -> MutableVector:
     return [l, c, util.constrain_hue(h)]
 
 
+def lch_to_lab_array(lch: Array) -> Array:
+    """Din99o Lch to Lab for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, c, h = lch.T
+    h = np.radians(util.no_nans_array(h))
+
+    # If chroma is less than zero, clamp to zero.
+    c = np.maximum(c, 0.0)
+
+    return np.stack([l, c * np.cos(h), c * np.sin(h)], axis=-1)
+
+
+def lab_to_lch_array(lab: Array) -> Array:
+    """Din99o Lab to Lch for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, a, b = lab.T
+    h = np.degrees(np.arctan2(b, a))
+    c = np.sqrt(a ** 2 + b ** 2)
+
+    # Achromatic colors will often get extremely close, but not quite hit zero.
+    h = np.where(c <= ACHROMATIC_THRESHOLD, util.NaN, h)
+
+    return np.stack([l, c, np.mod(h, 360)], axis=-1)
+
+
 class Din99oLch(Lch):
     """Din99o Lch class."""
 
     BASE = 'din99o'
     NAME = "din99o-lch"
     SERIALIZE = ("--din99o-lch",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     @classmethod
@@ -62,3 +88,15 @@ class Din99oLch(Lch):
         """From Din99o to Din99o Lch."""
 
         return lab_to_lch(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To Din99o from Din99o Lch."""
+
+        return lch_to_lab_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From Din99o to Din99o Lch."""
+
+        return lab_to_lch_array(coords)
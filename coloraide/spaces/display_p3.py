@@ -1,10 +1,8 @@
 """Display-p3 color class."""
-from ..spaces import RE_DEFAULT_MATCH
-from .srgb import SRGB, lin_srgb, gam_srgb
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
+from .srgb import SRGB, lin_srgb, gam_srgb, lin_srgb_array, gam_srgb_array
 from .. import util
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 RGB_TO_XYZ = [
     [4.8657094864821610e-01, 2.6566769316909306e-01, 1.9821728523436244e-01],
@@ -27,13 +25,13 @@ def lin_p3_to_xyz(rgb: MutableVector) -> MutableVector:
     """
 
     # 0 was computed as -3.972075516933488e-17
-    return cast(MutableVector, util.dot(RGB_TO_XYZ, rgb))
+    return util.matvec3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_p3(xyz: MutableVector) -> MutableVector:
     """Convert XYZ to linear-light P3."""
 
-    return cast(MutableVector, util.dot(XYZ_TO_RGB, xyz))
+    return util.matvec3(XYZ_TO_RGB, xyz)
 
 
 def lin_p3(rgb: MutableVector) -> MutableVector:
@@ -48,13 +46,27 @@ def gam_p3(rgb: MutableVector) -> MutableVector:
     return gam_srgb(rgb)  # same as sRGB
 
 
+def lin_p3_array(rgb: Array) -> Array:
+    """Convert a NumPy array of image-p3 RGB values to linear light (un-corrected) form."""
+
+    return lin_srgb_array(rgb)  # same as sRGB
+
+
+def gam_p3_array(rgb: Array) -> Array:
+    """Convert a NumPy array of linear-light image-p3 RGB values to gamma corrected form."""
+
+    return gam_srgb_array(rgb)  # same as sRGB
+
+
 class DisplayP3(SRGB):
     """Display-p3 class."""
 
     BASE = "xyz-d65"
     NAME = "display-p3"
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = RGB_TO_XYZ
+    LINEAR_FROM_BASE = XYZ_TO_RGB
 
     @classmethod
     def to_base(cls, coords: MutableVector) -> MutableVector:
@@ -67,3 +79,39 @@ class DisplayP3(SRGB):
         """From XYZ to Display P3."""
 
         return gam_p3(xyz_to_lin_p3(coords))
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """To linear light."""
+
+        return lin_p3(coords)
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """From linear light."""
+
+        return gam_p3(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from Display P3."""
+
+        return util.dot_array(RGB_TO_XYZ, lin_p3_array(coords))
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to Display P3."""
+
+        return gam_p3_array(util.dot_array(XYZ_TO_RGB, coords))
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """To linear light."""
+
+        return lin_p3_array(coords)
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """From linear light."""
+
+        return gam_p3_array(coords)
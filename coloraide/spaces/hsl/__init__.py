@@ -1,8 +1,7 @@
 """HSL class."""
-from ...spaces import Space, RE_DEFAULT_MATCH, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
 from ... import util
-import re
-from ...util import MutableVector
+from ...util import MutableVector, Array
 from typing import Tuple
 
 
@@ -24,7 +23,7 @@ def srgb_to_hsl(rgb: MutableVector) -> MutableVector:
             h = (b - r) / c + 2.0
         else:
             h = (r - g) / c + 4.0
-        s = 0 if l == 0 or l == 1 else (mx - l) / min(l, 1 - l)
+        s = 0.0 if l == 0 or l == 1 else (mx - l) / min(l, 1 - l)
         h *= 60.0
         if s == 0:
             h = util.NaN
@@ -52,6 +51,45 @@ def hsl_to_srgb(hsl: MutableVector) -> MutableVector:
     return [f(0), f(8), f(4)]
 
 
+def srgb_to_hsl_array(rgb: Array) -> Array:
+    """SRGB to HSL for NumPy arrays."""
+
+    np = util.load_numpy()
+    r, g, b = rgb.T
+    mx = np.max(rgb, axis=-1)
+    mn = np.min(rgb, axis=-1)
+    l = (mn + mx) / 2
+    c = mx - mn
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.where(
+            mx == r,
+            (g - b) / c,
+            np.where(mx == g, (b - r) / c + 2.0, (r - g) / c + 4.0)
+        ) * 60.0
+        s = np.where((l == 0) | (l == 1), 0.0, (mx - l) / np.minimum(l, 1 - l))
+    s = np.where(c != 0.0, s, 0.0)
+    h = np.where(s == 0, util.NaN, h)
+
+    return np.stack([np.mod(h, 360), s, l], axis=-1)
+
+
+def hsl_to_srgb_array(hsl: Array) -> Array:
+    """HSL to RGB for NumPy arrays."""
+
+    np = util.load_numpy()
+    h, s, l = hsl.T
+    h = np.mod(util.no_nans_array(h), 360)
+    a = s * np.minimum(l, 1 - l)
+
+    def f(n: int) -> Array:
+        """Calculate the channels."""
+        k = np.mod(n + h / 30, 12)
+        return l - a * np.maximum(-1, np.minimum(np.minimum(k - 3, 9 - k), 1))
+
+    return np.stack([f(0), f(8), f(4)], axis=-1)
+
+
 class HSL(Cylindrical, Space):
     """HSL class."""
 
@@ -64,7 +102,7 @@ class HSL(Cylindrical, Space):
         "saturation": "s",
         "lightness": "l"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
     GAMUT_CHECK = "srgb"
 
@@ -130,3 +168,15 @@ class HSL(Cylindrical, Space):
         """From sRGB to HSL."""
 
         return srgb_to_hsl(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To sRGB from HSL."""
+
+        return hsl_to_srgb_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From sRGB to HSL."""
+
+        return srgb_to_hsl_array(coords)
@@ -1,6 +1,6 @@
 """HSL class."""
-import re
 from .. import hsl as base
+from ...spaces import LazyPattern
 from ... import parse
 from ... import util
 from ...util import MutableVector
@@ -14,7 +14,8 @@ class HSL(base.HSL):
     """HSL class."""
 
     DEF_VALUE = "hsl(0 0% 0% / 1)"
-    MATCH = re.compile(
+    MATCH_TOKENS = ('hsl(', 'hsla(')
+    MATCH = LazyPattern(
         r"""(?xi)
         \bhsla?\(\s*
         (?:
@@ -49,7 +50,7 @@ class HSL(base.HSL):
         a = util.no_nan(self.alpha) if not none else self.alpha
         alpha = alpha is not False and (alpha is True or a < 1.0 or util.is_nan(a))
         method = None if not isinstance(fit, str) else fit
-        coords = parent.fit(method=method).coords() if fit else self.coords()
+        coords = parent.fit(method=method).coords_view() if fit else self.coords_view()
         if not none:
             coords = util.no_nans(coords)
 
@@ -1,8 +1,7 @@
 """HSV class."""
-from ..spaces import Space, RE_DEFAULT_MATCH, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
 from .. import util
-import re
-from ..util import MutableVector
+from ..util import MutableVector, Array
 from typing import Tuple
 
 
@@ -41,6 +40,33 @@ def hsl_to_hsv(hsl: MutableVector) -> MutableVector:
     return [util.constrain_hue(h), s, v]
 
 
+def hsv_to_hsl_array(hsv: Array) -> Array:
+    """HSV to HSL for NumPy arrays."""
+
+    np = util.load_numpy()
+    h, s, v = hsv.T
+    l = v * (1.0 - s / 2.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where((l == 0.0) | (l == 1.0), 0.0, (v - l) / np.minimum(l, 1.0 - l))
+    h = np.where(s == 0, util.NaN, h)
+
+    return np.stack([np.mod(h, 360), s, l], axis=-1)
+
+
+def hsl_to_hsv_array(hsl: Array) -> Array:
+    """HSL to HSV for NumPy arrays."""
+
+    np = util.load_numpy()
+    h, s, l = hsl.T
+
+    v = l + s * np.minimum(l, 1.0 - l)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(v == 0.0, 0.0, 2 * (1.0 - l / v))
+    h = np.where(s == 0, util.NaN, h)
+
+    return np.stack([np.mod(h, 360), s, v], axis=-1)
+
+
 class HSV(Cylindrical, Space):
     """HSL class."""
 
@@ -53,7 +79,7 @@ class HSV(Cylindrical, Space):
         "saturation": "s",
         "value": "v"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     GAMUT_CHECK = "srgb"
     WHITE = "D65"
 
@@ -119,3 +145,15 @@ class HSV(Cylindrical, Space):
         """From HSL to HSV."""
 
         return hsl_to_hsv(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To HSL from HSV."""
+
+        return hsv_to_hsl_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From HSL to HSV."""
+
+        return hsl_to_hsv_array(coords)
@@ -1,8 +1,7 @@
 """HWB class."""
-from ...spaces import Space, RE_DEFAULT_MATCH, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
 from ... import util
-import re
-from ...util import MutableVector
+from ...util import MutableVector, Array
 from typing import Tuple
 
 
@@ -32,6 +31,31 @@ def hsv_to_hwb(hsv: MutableVector) -> MutableVector:
     return [h, w, b]
 
 
+def hwb_to_hsv_array(hwb: Array) -> Array:
+    """HWB to HSV for NumPy arrays."""
+
+    np = util.load_numpy()
+    h, w, b = hwb.T
+
+    wb = w + b
+    gray = wb >= 1
+    v = 1 - b
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = np.where(v == 0, 0.0, 1 - w / v)
+        v = np.where(gray, w / wb, v)
+    return np.stack([np.where(gray, util.NaN, h), np.where(gray, 0.0, s), v], axis=-1)
+
+
+def hsv_to_hwb_array(hsv: Array) -> Array:
+    """HSV to HWB for NumPy arrays."""
+
+    np = util.load_numpy()
+    h, s, v = hsv.T
+    w = v * (1 - s)
+    b = 1 - v
+    return np.stack([np.where(w + b >= 1, util.NaN, h), w, b], axis=-1)
+
+
 class HWB(Cylindrical, Space):
     """HWB class."""
 
@@ -44,7 +68,7 @@ class HWB(Cylindrical, Space):
         "whiteness": "w",
         "blackness": "b"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     GAMUT_CHECK = "srgb"
     WHITE = "D65"
 
@@ -109,3 +133,15 @@ class HWB(Cylindrical, Space):
         """From HSV to HWB."""
 
         return hsv_to_hwb(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To HSV from HWB."""
+
+        return hwb_to_hsv_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From HSV to HWB."""
+
+        return hsv_to_hwb_array(coords)
@@ -3,11 +3,9 @@ ICtCp class.
 
 https://professional.dolby.com/siteassets/pdfs/ictcp_dolbywhitepaper_v071.pdf
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_OPT_PERCENT, Labish
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_OPT_PERCENT, Labish
 from .. import util
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 # All PQ Values are equivalent to defaults as stated in link below:
 # https://en.wikipedia.org/wiki/High-dynamic-range_video#Perceptual_quantizer
@@ -53,13 +51,13 @@ def ictcp_to_xyz_d65(ictcp: MutableVector) -> MutableVector:
     """From ICtCp to XYZ."""
 
     # Convert to LMS prime
-    pqlms = cast(MutableVector, util.dot(ictcp_to_lms_p_mi, ictcp))
+    pqlms = util.matvec3(ictcp_to_lms_p_mi, ictcp)
 
     # Decode PQ LMS to LMS
     lms = util.pq_st2084_eotf(pqlms)
 
     # Convert back to absolute XYZ D65
-    absxyz = cast(MutableVector, util.dot(lms_to_xyz_mi, lms))
+    absxyz = util.matvec3(lms_to_xyz_mi, lms)
 
     # Convert back to normal XYZ D65
     return util.absxyzd65_to_xyz_d65(absxyz)
@@ -72,13 +70,45 @@ def xyz_d65_to_ictcp(xyzd65: MutableVector) -> MutableVector:
     absxyz = util.xyz_d65_to_absxyzd65(xyzd65)
 
     # Convert to LMS
-    lms = cast(MutableVector, util.dot(xyz_to_lms_m, absxyz))
+    lms = util.matvec3(xyz_to_lms_m, absxyz)
 
     # PQ encode the LMS
     pqlms = util.pq_st2084_inverse_eotf(lms)
 
     # Calculate Izazbz
-    return cast(MutableVector, util.dot(lms_p_to_ictcp_m, pqlms))
+    return util.matvec3(lms_p_to_ictcp_m, pqlms)
+
+
+def ictcp_to_xyz_d65_array(ictcp: Array) -> Array:
+    """From ICtCp to XYZ for NumPy arrays."""
+
+    # Convert to LMS prime
+    pqlms = util.dot_array(ictcp_to_lms_p_mi, ictcp)
+
+    # Decode PQ LMS to LMS
+    lms = util.pq_st2084_eotf_array(pqlms)
+
+    # Convert back to absolute XYZ D65
+    absxyz = util.dot_array(lms_to_xyz_mi, lms)
+
+    # Convert back to normal XYZ D65
+    return util.absxyzd65_to_xyz_d65_array(absxyz)
+
+
+def xyz_d65_to_ictcp_array(xyzd65: Array) -> Array:
+    """From XYZ to ICtCp for NumPy arrays."""
+
+    # Convert from XYZ D65 to an absolute XYZ D5
+    absxyz = util.xyz_d65_to_absxyzd65_array(xyzd65)
+
+    # Convert to LMS
+    lms = util.dot_array(xyz_to_lms_m, absxyz)
+
+    # PQ encode the LMS
+    pqlms = util.pq_st2084_inverse_eotf_array(lms)
+
+    # Calculate Izazbz
+    return util.dot_array(lms_p_to_ictcp_m, pqlms)
 
 
 class ICtCp(Labish, Space):
@@ -88,7 +118,7 @@ class ICtCp(Labish, Space):
     NAME = "ictcp"
     SERIALIZE = ("--ictcp",)
     CHANNEL_NAMES = ("i", "ct", "cp")
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     BOUNDS = (
@@ -144,3 +174,15 @@ class ICtCp(Labish, Space):
         """From XYZ to ICtCp."""
 
         return xyz_d65_to_ictcp(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from ICtCp."""
+
+        return ictcp_to_xyz_d65_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to ICtCp."""
+
+        return xyz_d65_to_ictcp_array(coords)
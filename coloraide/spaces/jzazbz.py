@@ -3,11 +3,9 @@ Jzazbz class.
 
 https://www.osapublishing.org/oe/fulltext.cfm?uri=oe-25-13-15131&id=368272
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_OPT_PERCENT, Labish
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_OPT_PERCENT, Labish
 from .. import util
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 B = 1.15
 G = 0.66
@@ -65,13 +63,13 @@ def jzazbz_to_xyz_d65(jzazbz: MutableVector) -> MutableVector:
     iz = (jz + D0) / (1 + D - D * (jz + D0))
 
     # Convert to LMS prime
-    pqlms = cast(MutableVector, util.dot(izazbz_to_lms_p_mi, [iz, az, bz]))
+    pqlms = util.matvec3(izazbz_to_lms_p_mi, [iz, az, bz])
 
     # Decode PQ LMS to LMS
     lms = util.pq_st2084_eotf(pqlms, m2=M2)
 
     # Convert back to absolute XYZ D65
-    xm, ym, za = cast(MutableVector, util.dot(lms_to_xyz_mi, lms))
+    xm, ym, za = util.matvec3(lms_to_xyz_mi, lms)
     xa = (xm + ((B - 1) * za)) / B
     ya = (ym + ((G - 1) * xa)) / G
 
@@ -88,19 +86,67 @@ def xyz_d65_to_jzazbz(xyzd65: MutableVector) -> MutableVector:
     ym = (G * ya) - ((G - 1) * xa)
 
     # Convert to LMS
-    lms = cast(MutableVector, util.dot(xyz_to_lms_m, [xm, ym, za]))
+    lms = util.matvec3(xyz_to_lms_m, [xm, ym, za])
 
     # PQ encode the LMS
     pqlms = util.pq_st2084_inverse_eotf(lms, m2=M2)
 
     # Calculate Izazbz
-    iz, az, bz = cast(MutableVector, util.dot(lms_p_to_izazbz_m, pqlms))
+    iz, az, bz = util.matvec3(lms_p_to_izazbz_m, pqlms)
 
     # Calculate Jz
     jz = ((1 + D) * iz) / (1 + (D * iz)) - D0
     return [jz, az, bz]
 
 
+def jzazbz_to_xyz_d65_array(jzazbz: Array) -> Array:
+    """From Jzazbz to XYZ for NumPy arrays."""
+
+    np = util.load_numpy()
+    jz, az, bz = jzazbz.T
+
+    # Calculate Iz
+    iz = (jz + D0) / (1 + D - D * (jz + D0))
+
+    # Convert to LMS prime
+    pqlms = util.dot_array(izazbz_to_lms_p_mi, np.stack([iz, az, bz], axis=-1))
+
+    # Decode PQ LMS to LMS
+    lms = util.pq_st2084_eotf_array(pqlms, m2=M2)
+
+    # Convert back to absolute XYZ D65
+    xm, ym, za = util.dot_array(lms_to_xyz_mi, lms).T
+    xa = (xm + ((B - 1) * za)) / B
+    ya = (ym + ((G - 1) * xa)) / G
+
+    # Convert back to normal XYZ D65
+    return util.absxyzd65_to_xyz_d65_array(np.stack([xa, ya, za], axis=-1))
+
+
+def xyz_d65_to_jzazbz_array(xyzd65: Array) -> Array:
+    """From XYZ to Jzazbz for NumPy arrays."""
+
+    np = util.load_numpy()
+
+    # Convert from XYZ D65 to an absolute XYZ D5
+    xa, ya, za = util.xyz_d65_to_absxyzd65_array(xyzd65).T
+    xm = (B * xa) - ((B - 1) * za)
+    ym = (G * ya) - ((G - 1) * xa)
+
+    # Convert to LMS
+    lms = util.dot_array(xyz_to_lms_m, np.stack([xm, ym, za], axis=-1))
+
+    # PQ encode the LMS
+    pqlms = util.pq_st2084_inverse_eotf_array(lms, m2=M2)
+
+    # Calculate Izazbz
+    iz, az, bz = util.dot_array(lms_p_to_izazbz_m, pqlms).T
+
+    # Calculate Jz
+    jz = ((1 + D) * iz) / (1 + (D * iz)) - D0
+    return np.stack([jz, az, bz], axis=-1)
+
+
 class Jzazbz(Labish, Space):
     """Jzazbz class."""
 
@@ -113,7 +159,7 @@ class Jzazbz(Labish, Space):
         "a": 'az',
         "b": 'bz'
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     BOUNDS = (
@@ -169,3 +215,15 @@ class Jzazbz(Labish, Space):
         """From XYZ to Jzazbz."""
 
         return xyz_d65_to_jzazbz(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from Jzazbz."""
+
+        return jzazbz_to_xyz_d65_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to Jzazbz."""
+
+        return xyz_d65_to_jzazbz_array(coords)
@@ -3,11 +3,10 @@ JzCzhz class.
 
 https://www.osapublishing.org/oe/fulltext.cfm?uri=oe-25-13-15131&id=368272
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, Lchish, FLG_ANGLE, FLG_OPT_PERCENT
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, Lchish, FLG_ANGLE, FLG_OPT_PERCENT
 from .. import util
-import re
 import math
-from ..util import MutableVector
+from ..util import MutableVector, Array
 from typing import Tuple
 
 ACHROMATIC_THRESHOLD = 0.0003
@@ -47,6 +46,34 @@ def jzczhz_to_jzazbz(jzczhz: MutableVector) -> MutableVector:
     ]
 
 
+def jzazbz_to_jzczhz_array(jzazbz: Array) -> Array:
+    """Jzazbz to JzCzhz for NumPy arrays."""
+
+    np = util.load_numpy()
+    jz, az, bz = jzazbz.T
+
+    cz = np.sqrt(az ** 2 + bz ** 2)
+    hz = np.degrees(np.arctan2(bz, az))
+
+    # Achromatic colors will often get extremely close, but not quite hit zero.
+    hz = np.where(cz < ACHROMATIC_THRESHOLD, util.NaN, hz)
+
+    return np.stack([jz, cz, np.mod(hz, 360)], axis=-1)
+
+
+def jzczhz_to_jzazbz_array(jzczhz: Array) -> Array:
+    """JzCzhz to Jzazbz for NumPy arrays."""
+
+    np = util.load_numpy()
+    jz, cz, hz = jzczhz.T
+    hz = np.radians(util.no_nans_array(hz))
+
+    # If chroma is less than zero, clamp to zero.
+    cz = np.maximum(cz, 0.0)
+
+    return np.stack([jz, cz * np.cos(hz), cz * np.sin(hz)], axis=-1)
+
+
 class JzCzhz(Lchish, Space):
     """
     JzCzhz class.
@@ -63,7 +90,7 @@ class JzCzhz(Lchish, Space):
         "chroma": "cz",
         "hue": "hz"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     BOUNDS = (
@@ -134,3 +161,15 @@ class JzCzhz(Lchish, Space):
         """From Jzazbz to JzCzhz."""
 
         return jzazbz_to_jzczhz(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To Jzazbz from JzCzhz."""
+
+        return jzczhz_to_jzazbz_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From Jzazbz to JzCzhz."""
+
+        return jzazbz_to_jzczhz_array(coords)
@@ -1,9 +1,7 @@
 """Lab class."""
-from ...spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_PERCENT, Labish
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_PERCENT, Labish
 from ... import util
-import re
-from ...util import Vector, MutableVector
-from typing import cast
+from ...util import Vector, MutableVector, Array
 
 EPSILON = 216 / 24389  # `6^3 / 29^3`
 EPSILON3 = 6 / 29  # Cube root of EPSILON
@@ -36,7 +34,8 @@ def lab_to_xyz(lab: MutableVector, white: Vector) -> MutableVector:
     ]
 
     # Compute XYZ by scaling `xyz` by reference `white`
-    return cast(MutableVector, util.multiply(xyz, util.xy_to_xyz(white)))
+    x, y, z = util.xy_to_xyz(white)
+    return [xyz[0] * x, xyz[1] * y, xyz[2] * z]
 
 
 def xyz_to_lab(xyz: MutableVector, white: Vector) -> MutableVector:
@@ -50,7 +49,8 @@ def xyz_to_lab(xyz: MutableVector, white: Vector) -> MutableVector:
     """
 
     # compute `xyz`, which is XYZ scaled relative to reference white
-    xyz = cast(MutableVector, util.divide(xyz, util.xy_to_xyz(white)))
+    x, y, z = util.xy_to_xyz(white)
+    xyz = [xyz[0] / x, xyz[1] / y, xyz[2] / z]
     # Compute `fx`, `fy`, and `fz`
     fx, fy, fz = [util.cbrt(i) if i > EPSILON else (KAPPA * i + 16) / 116 for i in xyz]
 
@@ -61,6 +61,44 @@ def xyz_to_lab(xyz: MutableVector, white: Vector) -> MutableVector:
     ]
 
 
+def lab_to_xyz_array(lab: Array, white: Vector) -> Array:
+    """Convert a NumPy array of Lab values to D50-adapted XYZ."""
+
+    np = util.load_numpy()
+    l, a, b = lab.T
+
+    # compute `f`, starting with the luminance-related term
+    fy = (l + 16) / 116
+    fx = a / 500 + fy
+    fz = fy - b / 200
+
+    # compute `xyz`
+    xyz = np.stack(
+        [
+            np.where(fx > EPSILON3, fx ** 3, (116 * fx - 16) / KAPPA),
+            np.where(l > KE, fy ** 3, l / KAPPA),
+            np.where(fz > EPSILON3, fz ** 3, (116 * fz - 16) / KAPPA)
+        ],
+        axis=-1
+    )
+
+    # Compute XYZ by scaling `xyz` by reference `white`
+    return xyz * np.asarray(util.xy_to_xyz(white), dtype=xyz.dtype)
+
+
+def xyz_to_lab_array(xyz: Array, white: Vector) -> Array:
+    """Assuming a NumPy array of XYZ values is relative to D50, convert to CIE Lab."""
+
+    np = util.load_numpy()
+
+    # compute `xyz`, which is XYZ scaled relative to reference white
+    xyz = xyz / np.asarray(util.xy_to_xyz(white), dtype=xyz.dtype)
+    # Compute `fx`, `fy`, and `fz`
+    fx, fy, fz = np.where(xyz > EPSILON, util.cbrt_array(xyz), (KAPPA * xyz + 16) / 116).T
+
+    return np.stack([(116.0 * fy) - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)], axis=-1)
+
+
 class Lab(Labish, Space):
     """Lab class."""
 
@@ -71,7 +109,7 @@ class Lab(Labish, Space):
     CHANNEL_ALIASES = {
         "lightness": "l"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D50"
     BOUNDS = (
         GamutUnbound(0.0, 100.0, FLG_PERCENT),  # Technically we could/should clamp the zero side.
@@ -126,3 +164,15 @@ class Lab(Labish, Space):
         """From XYZ D50 to Lab."""
 
         return xyz_to_lab(coords, cls.white())
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ D50 from Lab."""
+
+        return lab_to_xyz_array(coords, cls.white())
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ D50 to Lab."""
+
+        return xyz_to_lab_array(coords, cls.white())
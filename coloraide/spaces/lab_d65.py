@@ -1,7 +1,6 @@
 """Lab D65 class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .lab import Lab
-import re
 
 
 class LabD65(Lab):
@@ -10,5 +9,5 @@ class LabD65(Lab):
     BASE = 'xyz-d65'
     NAME = "lab-d65"
     SERIALIZE = ("--lab-d65",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
@@ -1,9 +1,8 @@
 """Lch class."""
-from ...spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, Lchish, FLG_ANGLE, FLG_PERCENT
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, Lchish, FLG_ANGLE, FLG_PERCENT
 from ... import util
-import re
 import math
-from ...util import MutableVector
+from ...util import MutableVector, Array
 from typing import Tuple
 
 ACHROMATIC_THRESHOLD = 0.0000000002
@@ -44,6 +43,34 @@ def lch_to_lab(lch: MutableVector) -> MutableVector:
     ]
 
 
+def lab_to_lch_array(lab: Array) -> Array:
+    """Lab to Lch for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, a, b = lab.T
+
+    c = np.sqrt(a ** 2 + b ** 2)
+    h = np.degrees(np.arctan2(b, a))
+
+    # Achromatic colors will often get extremely close, but not quite hit zero.
+    h = np.where(c < ACHROMATIC_THRESHOLD, util.NaN, h)
+
+    return np.stack([l, c, np.mod(h, 360)], axis=-1)
+
+
+def lch_to_lab_array(lch: Array) -> Array:
+    """Lch to Lab for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, c, h = lch.T
+    h = np.radians(util.no_nans_array(h))
+
+    # If chroma is less than zero, clamp to zero.
+    c = np.maximum(c, 0.0)
+
+    return np.stack([l, c * np.cos(h), c * np.sin(h)], axis=-1)
+
+
 class Lch(Lchish, Space):
     """Lch class."""
 
@@ -56,7 +83,7 @@ class Lch(Lchish, Space):
         "chroma": "c",
         "hue": "h"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D50"
     BOUNDS = (
         # I think chroma, specifically should be clamped.
@@ -123,3 +150,15 @@ class Lch(Lchish, Space):
         """From Lab to Lch."""
 
         return lab_to_lch(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To Lab from Lch."""
+
+        return lch_to_lab_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From Lab to Lch."""
+
+        return lab_to_lch_array(coords)
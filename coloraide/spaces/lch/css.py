@@ -1,6 +1,6 @@
 """Lch class."""
-import re
 from .. import lch as base
+from ...spaces import LazyPattern
 from ... import parse
 from ... import util
 from ...util import MutableVector
@@ -13,7 +13,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class Lch(base.Lch):
     """Lch class."""
 
-    MATCH = re.compile(
+    MATCH_TOKENS = ('lch(',)
+    MATCH = LazyPattern(
         r"""(?xi)
         \blch\(\s*
         (?:
@@ -48,7 +49,7 @@ class Lch(base.Lch):
         a = util.no_nan(self.alpha) if not none else self.alpha
         alpha = alpha is not False and (alpha is True or a < 1.0 or util.is_nan(a))
         method = None if not isinstance(fit, str) else fit
-        coords = parent.fit(method=method).coords() if fit else self.coords()
+        coords = parent.fit(method=method).coords_view() if fit else self.coords_view()
         if not none:
             coords = util.no_nans(coords)
 
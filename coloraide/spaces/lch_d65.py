@@ -1,7 +1,6 @@
 """Lch D65 class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .lch import Lch
-import re
 
 
 class LchD65(Lch):
@@ -10,5 +9,5 @@ class LchD65(Lch):
     BASE = "lab-d65"
     NAME = "lch-d65"
     SERIALIZE = ("--lch-d65",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
@@ -1,10 +1,9 @@
 """LCH class."""
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_ANGLE, FLG_PERCENT
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_ANGLE, FLG_PERCENT
 from .lch import Lch, ACHROMATIC_THRESHOLD
 from .. import util
-import re
 import math
-from ..util import MutableVector
+from ..util import MutableVector, Array
 
 
 def luv_to_lchuv(luv: MutableVector) -> MutableVector:
@@ -41,13 +40,41 @@ def lchuv_to_luv(lchuv: MutableVector) -> MutableVector:
     ]
 
 
+def luv_to_lchuv_array(luv: Array) -> Array:
+    """Luv to Lch(uv) for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, u, v = luv.T
+
+    c = np.sqrt(u ** 2 + v ** 2)
+    h = np.degrees(np.arctan2(v, u))
+
+    # Achromatic colors will often get extremely close, but not quite hit zero.
+    h = np.where(c < ACHROMATIC_THRESHOLD, util.NaN, h)
+
+    return np.stack([l, c, np.mod(h, 360)], axis=-1)
+
+
+def lchuv_to_luv_array(lchuv: Array) -> Array:
+    """Lch(uv) to Luv for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, c, h = lchuv.T
+    h = np.radians(util.no_nans_array(h))
+
+    # If chroma is less than zero, clamp to zero.
+    c = np.maximum(c, 0.0)
+
+    return np.stack([l, c * np.cos(h), c * np.sin(h)], axis=-1)
+
+
 class Lchuv(Lch, Space):
     """Lch(uv) class."""
 
     BASE = "luv"
     NAME = "lchuv"
     SERIALIZE = ("--lchuv",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D50"
 
     BOUNDS = (
@@ -67,3 +94,15 @@ class Lchuv(Lch, Space):
         """From Luv to Lch(uv)."""
 
         return luv_to_lchuv(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To Luv from Lch(uv)."""
+
+        return lchuv_to_luv_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From Luv to Lch(uv)."""
+
+        return luv_to_lchuv_array(coords)
@@ -1,7 +1,6 @@
 """LCH class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .lchuv import Lchuv
-import re
 
 
 class LchuvD65(Lchuv):
@@ -10,5 +9,5 @@ class LchuvD65(Lchuv):
     BASE = "luv-d65"
     NAME = "lchuv-d65"
     SERIALIZE = ("--lchuv-d65",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
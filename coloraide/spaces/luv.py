@@ -3,11 +3,10 @@ Luv class.
 
 https://en.wikipedia.org/wiki/CIELUV
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_PERCENT, WHITES, Labish
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_PERCENT, WHITES, Labish
 from .lab import KAPPA, EPSILON, KE
 from .. import util
-import re
-from ..util import MutableVector
+from ..util import MutableVector, Array
 
 
 def xyz_to_luv(xyz: MutableVector, white: str) -> MutableVector:
@@ -38,7 +37,7 @@ def luv_to_xyz(luv: MutableVector, white: str) -> MutableVector:
         up = (u / (13 * l)) + ur
         vp = (v / (13 * l)) + vr
     else:
-        up = vp = 0
+        up = vp = 0.0
 
     y = xyz[1] * (((l + 16) / 116) ** 3 if l > KE else l / KAPPA)
 
@@ -46,11 +45,49 @@ def luv_to_xyz(luv: MutableVector, white: str) -> MutableVector:
         x = y * ((9 * up) / (4 * vp))
         z = y * ((12 - 3 * up - 20 * vp) / (4 * vp))
     else:
-        x = z = 0
+        x = z = 0.0
 
     return [x, y, z]
 
 
+def xyz_to_luv_array(xyz: Array, white: str) -> Array:
+    """XYZ to Luv for NumPy arrays."""
+
+    np = util.load_numpy()
+    x, y, z = xyz.T
+    denom = x + 15 * y + 3 * z
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = np.where(denom != 0, (4 * x) / denom, 0)
+        v = np.where(denom != 0, (9 * y) / denom, 0)
+    w_xyz = util.xy_to_xyz(WHITES[white])
+    ur, vr = util.xyz_to_uv(w_xyz)
+
+    yr = y / w_xyz[1]
+    l = np.where(yr > EPSILON, 116 * util.cbrt_array(yr) - 16, KAPPA * yr)
+
+    return np.stack([l, 13 * l * (u - ur), 13 * l * (v - vr)], axis=-1)
+
+
+def luv_to_xyz_array(luv: Array, white: str) -> Array:
+    """Luv to XYZ for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, u, v = luv.T
+    xyz = util.xy_to_xyz(WHITES[white])
+    ur, vr = util.xyz_to_uv(xyz)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        up = np.where(l != 0, (u / (13 * l)) + ur, 0)
+        vp = np.where(l != 0, (v / (13 * l)) + vr, 0)
+
+        y = xyz[1] * np.where(l > KE, ((l + 16) / 116) ** 3, l / KAPPA)
+
+        x = np.where(vp != 0, y * ((9 * up) / (4 * vp)), 0)
+        z = np.where(vp != 0, y * ((12 - 3 * up - 20 * vp) / (4 * vp)), 0)
+
+    return np.stack([x, y, z], axis=-1)
+
+
 class Luv(Labish, Space):
     """Luv class."""
 
@@ -61,7 +98,7 @@ class Luv(Labish, Space):
     CHANNEL_ALIASES = {
         "lightness": "l"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D50"
 
     BOUNDS = (
@@ -117,3 +154,15 @@ class Luv(Labish, Space):
         """From XYZ D50 to Luv."""
 
         return xyz_to_luv(coords, cls.WHITE)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ D50 from Luv."""
+
+        return luv_to_xyz_array(coords, cls.WHITE)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ D50 to Luv."""
+
+        return xyz_to_luv_array(coords, cls.WHITE)
@@ -25,17 +25,26 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
-from .oklab import oklab_to_linear_srgb
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
+from .oklab import oklab_to_linear_srgb, oklab_to_linear_srgb_array
 from .. import util
-import re
 import math
 import sys
-from ..util import MutableVector
+from ..util import MutableVector, Array
 from typing import Tuple, Optional
 
 FLT_MAX = sys.float_info.max
 
+# Coefficients used by `compute_max_saturation` depending on which component goes below zero first:
+# `k0`, `k1`, `k2`, `k3`, `k4`, `wl`, `wm`, and `ws`.
+MAX_SAT_RED = [1.19086277, 1.76576728, 0.59662641, 0.75515197, 0.56771245, 4.0767416621, -3.3077115913, 0.2309699292]
+MAX_SAT_GREEN = [
+    0.73956515, -0.45954404, 0.08285427, 0.12541070, 0.14503204, -1.2684380046, 2.6097574011, -0.3413193965
+]
+MAX_SAT_BLUE = [
+    1.35733652, -0.00915799, -1.15130210, -0.50559606, 0.00692167, -0.0041960863, -0.7034186147, 1.7076147010
+]
+
 K_1 = 0.206
 K_2 = 0.03
 K_3 = (1.0 + K_1) / (1.0 + K_2)
@@ -413,6 +422,238 @@ def oklab_to_okhsl(lab: MutableVector) -> MutableVector:
     return [util.constrain_hue(h * 360), s, l]
 
 
+def toe_array(x: Array) -> Array:
+    """Toe function for L_r for NumPy arrays."""
+
+    np = util.load_numpy()
+    return 0.5 * (K_3 * x - K_1 + np.sqrt((K_3 * x - K_1) * (K_3 * x - K_1) + 4 * K_2 * K_3 * x))
+
+
+def compute_max_saturation_array(a: Array, b: Array) -> Array:
+    """
+    Finds the maximum saturation possible for each hue in a NumPy array that fits in sRGB.
+
+    `toe_inv`, `to_st`, and `get_st_mid` are plain arithmetic and work on arrays as is.
+    """
+
+    np = util.load_numpy()
+
+    # Select different coefficients depending on which component goes below zero first.
+    red = ((-1.88170328 * a - 0.80936493 * b) > 1)[:, np.newaxis]
+    green = ((1.81444104 * a - 1.19445276 * b) > 1)[:, np.newaxis]
+    k0, k1, k2, k3, k4, wl, wm, ws = np.where(
+        red,
+        MAX_SAT_RED,
+        np.where(green, MAX_SAT_GREEN, MAX_SAT_BLUE)
+    ).T
+
+    # Approximate max saturation using a polynomial:
+    sat = k0 + k1 * a + k2 * b + k3 * (a ** 2) + k4 * a * b
+
+    # Do one step Halley's method to get closer.
+    k_l = 0.3963377774 * a + 0.2158037573 * b
+    k_m = -0.1055613458 * a - 0.0638541728 * b
+    k_s = -0.0894841775 * a - 1.2914855480 * b
+
+    l_ = 1.0 + sat * k_l
+    m_ = 1.0 + sat * k_m
+    s_ = 1.0 + sat * k_s
+
+    f = wl * l_ ** 3 + wm * m_ ** 3 + ws * s_ ** 3
+    f1 = wl * 3.0 * k_l * (l_ ** 2) + wm * 3.0 * k_m * (m_ ** 2) + ws * 3.0 * k_s * (s_ ** 2)
+    f2 = wl * 6.0 * (k_l ** 2) * l_ + wm * 6.0 * (k_m ** 2) * m_ + ws * 6.0 * (k_s ** 2) * s_
+
+    return sat - f * f1 / ((f1 ** 2) - 0.5 * f * f2)
+
+
+def find_cusp_array(a: Array, b: Array) -> MutableVector:
+    """Finds L_cusp and C_cusp for each hue in a NumPy array."""
+
+    np = util.load_numpy()
+
+    # First, find the maximum saturation (saturation `S = C/L`)
+    s_cusp = compute_max_saturation_array(a, b)
+
+    # Convert to linear sRGB to find the first point where at least one of r, g or b >= 1:
+    rgb = oklab_to_linear_srgb_array(np.stack([np.ones_like(a), s_cusp * a, s_cusp * b], axis=-1))
+    l_cusp = util.cbrt_array(1.0 / np.max(rgb, axis=-1))
+
+    return [l_cusp, l_cusp * s_cusp]
+
+
+def find_gamut_intersection_array(
+    a: Array,
+    b: Array,
+    l1: Array,
+    c1: float,
+    l0: Array,
+    cusp: MutableVector
+) -> Array:
+    """Finds the intersection of the line for each hue in a NumPy array, see `find_gamut_intersection`."""
+
+    np = util.load_numpy()
+
+    # Lower half
+    lower = cusp[1] * l0 / (c1 * cusp[0] + cusp[1] * (l0 - l1))
+
+    # Upper half, first intersect with triangle
+    t = cusp[1] * (l0 - 1.0) / (c1 * (cusp[0] - 1.0) + cusp[1] * (l0 - l1))
+
+    # Then one step Halley's method
+    dl = l1 - l0
+    dc = c1
+
+    k_l = +0.3963377774 * a + 0.2158037573 * b
+    k_m = -0.1055613458 * a - 0.0638541728 * b
+    k_s = -0.0894841775 * a - 1.2914855480 * b
+
+    l_dt = dl + dc * k_l
+    m_dt = dl + dc * k_m
+    s_dt = dl + dc * k_s
+
+    L = l0 * (1.0 - t) + t * l1
+    C = t * c1
+
+    l_ = L + C * k_l
+    m_ = L + C * k_m
+    s_ = L + C * k_s
+
+    l = l_ ** 3
+    m = m_ ** 3
+    s = s_ ** 3
+
+    ldt = 3 * l_dt * (l_ ** 2)
+    mdt = 3 * m_dt * (m_ ** 2)
+    sdt = 3 * s_dt * (s_ ** 2)
+
+    ldt2 = 6 * (l_dt ** 2) * l_
+    mdt2 = 6 * (m_dt ** 2) * m_
+    sdt2 = 6 * (s_dt ** 2) * s_
+
+    r = 4.0767416621 * l - 3.3077115913 * m + 0.2309699292 * s - 1
+    r1 = 4.0767416621 * ldt - 3.3077115913 * mdt + 0.2309699292 * sdt
+    r2 = 4.0767416621 * ldt2 - 3.3077115913 * mdt2 + 0.2309699292 * sdt2
+
+    u_r = r1 / (r1 * r1 - 0.5 * r * r2)
+    t_r = np.where(u_r >= 0.0, -r * u_r, FLT_MAX)
+
+    g = -1.2684380046 * l + 2.6097574011 * m - 0.3413193965 * s - 1
+    g1 = -1.2684380046 * ldt + 2.6097574011 * mdt - 0.3413193965 * sdt
+    g2 = -1.2684380046 * ldt2 + 2.6097574011 * mdt2 - 0.3413193965 * sdt2
+
+    u_g = g1 / (g1 * g1 - 0.5 * g * g2)
+    t_g = np.where(u_g >= 0.0, -g * u_g, FLT_MAX)
+
+    b = -0.0041960863 * l - 0.7034186147 * m + 1.7076147010 * s - 1
+    b1 = -0.0041960863 * ldt - 0.7034186147 * mdt + 1.7076147010 * sdt
+    b2 = -0.0041960863 * ldt2 - 0.7034186147 * mdt2 + 1.7076147010 * sdt2
+
+    u_b = b1 / (b1 * b1 - 0.5 * b * b2)
+    t_b = np.where(u_b >= 0.0, -b * u_b, FLT_MAX)
+
+    upper = t + np.minimum(t_r, np.minimum(t_g, t_b))
+
+    return np.where(((l1 - l0) * cusp[1] - (cusp[0] - l0) * c1) <= 0.0, lower, upper)
+
+
+def get_cs_array(l: Array, a: Array, b: Array) -> MutableVector:
+    """Get Cs for NumPy arrays."""
+
+    np = util.load_numpy()
+
+    cusp = find_cusp_array(a, b)
+
+    c_max = find_gamut_intersection_array(a, b, l, 1, l, cusp)
+    st_max = to_st(cusp)
+
+    # Scale factor to compensate for the curved part of gamut shape:
+    k = c_max / np.minimum((l * st_max[0]), (1 - l) * st_max[1])
+
+    st_mid = get_st_mid(a, b)
+
+    # Use a soft minimum function, instead of a sharp triangle shape to get a smooth value for chroma.
+    c_a = l * st_mid[0]
+    c_b = (1.0 - l) * st_mid[1]
+    c_mid = 0.9 * k * np.sqrt(np.sqrt(1.0 / (1.0 / (c_a ** 4) + 1.0 / (c_b ** 4))))
+
+    # For `C_0`, the shape is independent of hue, so `ST` are constant.
+    c_a = l * 0.4
+    c_b = (1.0 - l) * 0.8
+
+    # Use a soft minimum function, instead of a sharp triangle shape to get a smooth value for chroma.
+    c_0 = np.sqrt(1.0 / (1.0 / (c_a ** 2) + 1.0 / (c_b ** 2)))
+
+    return [c_0, c_mid, c_max]
+
+
+def okhsl_to_oklab_array(hsl: Array) -> Array:
+    """Convert a NumPy array of Okhsl values to Oklab."""
+
+    np = util.load_numpy()
+    # Finding the gamut cusp is too sensitive for single precision.
+    h, s, l = hsl.astype(np.float64).T
+    h = util.no_nans_array(h) / 360.0
+
+    L = toe_inv(l)
+    a_ = np.cos(2.0 * math.pi * h)
+    b_ = np.sin(2.0 * math.pi * h)
+
+    # Every row is calculated, achromatic rows are masked out at the end.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        c_0, c_mid, c_max = get_cs_array(L, a_, b_)
+
+        # Interpolate the three values for C, see `okhsl_to_oklab`.
+        mid = 0.8
+        mid_inv = 1.25
+
+        k_1 = mid * c_0
+        k_2 = (1.0 - k_1 / c_mid)
+        t = mid_inv * s
+        low = t * k_1 / (1.0 - k_2 * t)
+
+        k_1 = 0.2 * (c_mid ** 2) * (1.25 ** 2) / c_0
+        k_2 = 1.0 - k_1 / (c_max - c_mid)
+        t = 5 * (s - 0.8)
+        high = c_mid + t * k_1 / (1.0 - k_2 * t)
+
+    c = np.where((L != 0) & (L != 1) & (s != 0), np.where(s < mid, low, high), 0.0)
+
+    return np.stack([L, c * a_, c * b_], axis=-1)
+
+
+def oklab_to_okhsl_array(lab: Array) -> Array:
+    """Convert a NumPy array of Oklab values to Okhsl."""
+
+    np = util.load_numpy()
+    # Finding the gamut cusp is too sensitive for single precision.
+    L, a, b = lab.astype(np.float64).T
+    c = np.sqrt(a ** 2 + b ** 2)
+
+    # Every row is calculated, achromatic rows are masked out at the end.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = 0.5 + 0.5 * np.arctan2(-b, -a) / math.pi
+
+        c_0, c_mid, c_max = get_cs_array(L, a / c, b / c)
+
+        # Inverse of the interpolation in `okhsl_to_srgb`:
+        mid = 0.8
+        mid_inv = 1.25
+
+        k_1 = mid * c_0
+        k_2 = 1.0 - k_1 / c_mid
+        low = c / (k_1 + k_2 * c) * mid
+
+        k_0 = c_mid
+        k_1 = 0.2 * (c_mid ** 2) * (mid_inv ** 2) / c_0
+        k_2 = (1.0 - (k_1) / (c_max - c_mid))
+        high = mid + 0.2 * (c - k_0) / (k_1 + k_2 * (c - k_0))
+
+    s = np.where((c != 0) & (L != 0), np.where(c < c_mid, low, high), 0.0)
+    h = np.where(s == 0, util.NaN, h)
+
+    return np.stack([np.mod(h * 360, 360), s, toe_array(L)], axis=-1)
+
+
 class Okhsl(Cylindrical, Space):
     """HSL class."""
 
@@ -425,7 +666,7 @@ class Okhsl(Cylindrical, Space):
         "saturation": "s",
         "lightness": "l"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
     GAMUT_CHECK = "srgb"
 
@@ -490,3 +731,15 @@ class Okhsl(Cylindrical, Space):
         """From Oklab to Okhsl."""
 
         return oklab_to_okhsl(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To Oklab from Okhsl."""
+
+        return okhsl_to_oklab_array(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From Oklab to Okhsl."""
+
+        return oklab_to_okhsl_array(coords)
@@ -25,13 +25,12 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from ..spaces import Space, RE_DEFAULT_MATCH, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, FLG_ANGLE, FLG_OPT_PERCENT, GamutBound, Cylindrical
 from .. import util
-from .oklab import oklab_to_linear_srgb
-from .okhsl import toe, toe_inv, find_cusp, to_st
-import re
+from .oklab import oklab_to_linear_srgb, oklab_to_linear_srgb_array
+from .okhsl import toe, toe_inv, find_cusp, to_st, toe_array, find_cusp_array
 import math
-from ..util import MutableVector
+from ..util import MutableVector, Array
 from typing import Tuple
 
 
@@ -132,6 +131,97 @@ def oklab_to_okhsv(lab: MutableVector) -> MutableVector:
     return [util.constrain_hue(h * 360), s, v]
 
 
+def okhsv_to_oklab_array(hsv: Array) -> Array:
+    """Convert a NumPy array of Okhsv values to Oklab."""
+
+    np = util.load_numpy()
+    # Finding the gamut cusp is too sensitive for single precision.
+    h, s, v = hsv.astype(np.float64).T
+    h = util.no_nans_array(h) / 360.0
+
+    l = toe_inv(v)
+    a_ = np.cos(2.0 * math.pi * h)
+    b_ = np.sin(2.0 * math.pi * h)
+
+    # Every row is calculated, achromatic rows are masked out at the end.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cusp = find_cusp_array(a_, b_)
+        s_max, t_max = to_st(cusp)
+        s_0 = 0.5
+        k = 1 - s_0 / s_max
+
+        # first we compute L and V as if the gamut is a perfect triangle:
+
+        # L, C when v==1:
+        l_v = 1 - s * s_0 / (s_0 + t_max - t_max * k * s)
+        c_v = s * t_max * s_0 / (s_0 + t_max - t_max * k * s)
+
+        lc = v * l_v
+        c = v * c_v
+
+        # then we compensate for both toe and the curved top part of the triangle:
+        l_vt = toe_inv(l_v)
+        c_vt = c_v * l_vt / l_v
+
+        l_new = toe_inv(lc)
+        c = c * l_new / lc
+        lc = l_new
+
+        # RGB scale
+        rgb = oklab_to_linear_srgb_array(np.stack([l_vt, a_ * c_vt, b_ * c_vt], axis=-1))
+        scale_l = util.cbrt_array(1.0 / np.maximum(np.max(rgb, axis=-1), 0.0))
+
+    chromatic = (l != 0) & (s != 0)
+    c = np.where(chromatic, c * scale_l, 0.0)
+
+    return np.stack([np.where(chromatic, lc * scale_l, l), c * a_, c * b_], axis=-1)
+
+
+def oklab_to_okhsv_array(lab: Array) -> Array:
+    """Convert a NumPy array of Oklab values to Okhsv."""
+
+    np = util.load_numpy()
+    # Finding the gamut cusp is too sensitive for single precision.
+    l, a, b = lab.astype(np.float64).T
+    c = np.sqrt(a ** 2 + b ** 2)
+
+    # Every row is calculated, achromatic rows are masked out at the end.
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a_ = a / c
+        b_ = b / c
+
+        h = 0.5 + 0.5 * np.arctan2(-b, -a) / math.pi
+
+        cusp = find_cusp_array(a_, b_)
+        s_max, t_max = to_st(cusp)
+        s_0 = 0.5
+        k = 1 - s_0 / s_max
+
+        # first we find `L_v`, `C_v`, `L_vt` and `C_vt`
+        t = t_max / (c + l * t_max)
+        l_v = t * l
+        c_v = t * c
+
+        l_vt = toe_inv(l_v)
+        c_vt = c_v * l_vt / l_v
+
+        # we can then use these to invert the step that compensates for the toe and the curved top part of the triangle:
+        rgb = oklab_to_linear_srgb_array(np.stack([l_vt, a_ * c_vt, b_ * c_vt], axis=-1))
+        scale_l = util.cbrt_array(1.0 / np.maximum(np.max(rgb, axis=-1), 0.0))
+
+        lc = l / scale_l
+        lt = toe_array(lc)
+
+        # we can now compute v and s:
+        chromatic = (c != 0) & (l != 0) & (l != 1)
+        v = np.where(chromatic, lt / l_v, toe_array(l))
+        s = np.where(chromatic, (s_0 + t_max) * c_v / ((t_max * s_0) + t_max * k * c_v), 0.0)
+
+    h = np.where(s == 0, util.NaN, h)
+
+    return np.stack([np.mod(h * 360, 360), s, v], axis=-1)
+
+
 class Okhsv(Cylindrical, Space):
     """Okhsv class."""
 
@@ -144,7 +234,7 @@ class Okhsv(Cylindrical, Space):
         "saturation": "s",
         "value": "v"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
     GAMUT_CHECK = "srgb"
 
@@ -209,3 +299,15 @@ class Okhsv(Cylindrical, Space):
         """From Oklab to Okhsv."""
 
         return oklab_to_okhsv(oklab)
+
+    @classmethod
+    def to_base_array(cls, okhsv: Array) -> Array:
+        """To Oklab from Okhsv."""
+
+        return okhsv_to_oklab_array(okhsv)
+
+    @classmethod
+    def from_base_array(cls, oklab: Array) -> Array:
+        """From Oklab to Okhsv."""
+
+        return oklab_to_okhsv_array(oklab)
@@ -25,11 +25,9 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from ...spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, FLG_OPT_PERCENT, Labish
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, FLG_OPT_PERCENT, Labish
 from ... import util
-import re
-from ...util import Vector, MutableVector
-from typing import cast
+from ...util import Vector, MutableVector, Array
 
 # sRGB Linear to LMS
 SRGBL_TO_LMS = [
@@ -77,37 +75,67 @@ LMS_TO_XYZD65 = [
 def oklab_to_linear_srgb(lab: Vector) -> MutableVector:
     """Convert from Oklab to linear sRGB."""
 
-    return cast(
-        MutableVector,
-        util.dot(LMS_TO_SRGBL, [c ** 3 for c in cast(MutableVector, util.dot(OKLAB_TO_LMS3, lab))])
-    )
+    return util.matvec3(LMS_TO_SRGBL, [c ** 3 for c in util.matvec3(OKLAB_TO_LMS3, lab)])
 
 
 def linear_srgb_to_oklab(rgb: Vector) -> MutableVector:  # pragma: no cover
     """Linear sRGB to Oklab."""
 
-    return cast(
-        MutableVector,
-        util.dot(LMS3_TO_OKLAB, [util.cbrt(c) for c in cast(MutableVector, util.dot(SRGBL_TO_LMS, rgb))])
-    )
+    return util.matvec3(LMS3_TO_OKLAB, [util.cbrt(c) for c in util.matvec3(SRGBL_TO_LMS, rgb)])
+
+
+def oklab_to_lms(lab: Vector) -> MutableVector:
+    """Convert from Oklab to linear LMS."""
+
+    return [c ** 3 for c in util.matvec3(OKLAB_TO_LMS3, lab)]
+
+
+def lms_to_oklab(lms: Vector) -> MutableVector:
+    """Convert from linear LMS to Oklab."""
+
+    return util.matvec3(LMS3_TO_OKLAB, [util.cbrt(c) for c in lms])
 
 
 def oklab_to_xyz_d65(lab: Vector) -> MutableVector:
     """Convert from Oklab to XYZ D65."""
 
-    return cast(
-        MutableVector,
-        util.dot(LMS_TO_XYZD65, [c ** 3 for c in cast(MutableVector, util.dot(OKLAB_TO_LMS3, lab))])
-    )
+    return util.matvec3(LMS_TO_XYZD65, [c ** 3 for c in util.matvec3(OKLAB_TO_LMS3, lab)])
 
 
 def xyz_d65_to_oklab(xyz: Vector) -> MutableVector:
     """XYZ D65 to Oklab."""
 
-    return cast(
-        MutableVector,
-        util.dot(LMS3_TO_OKLAB, [util.cbrt(c) for c in cast(MutableVector, util.dot(XYZD65_TO_LMS, xyz))])
-    )
+    return util.matvec3(LMS3_TO_OKLAB, [util.cbrt(c) for c in util.matvec3(XYZD65_TO_LMS, xyz)])
+
+
+def oklab_to_linear_srgb_array(lab: Array) -> Array:
+    """Convert a NumPy array of Oklab values to linear sRGB."""
+
+    return util.dot_array(LMS_TO_SRGBL, util.dot_array(OKLAB_TO_LMS3, lab) ** 3)
+
+
+def oklab_to_lms_array(lab: Array) -> Array:
+    """Convert a NumPy array of Oklab values to linear LMS."""
+
+    return util.dot_array(OKLAB_TO_LMS3, lab) ** 3
+
+
+def lms_to_oklab_array(lms: Array) -> Array:
+    """Convert a NumPy array of linear LMS values to Oklab."""
+
+    return util.dot_array(LMS3_TO_OKLAB, util.cbrt_array(lms))
+
+
+def oklab_to_xyz_d65_array(lab: Array) -> Array:
+    """Convert a NumPy array of Oklab values to XYZ D65."""
+
+    return util.dot_array(LMS_TO_XYZD65, oklab_to_lms_array(lab))
+
+
+def xyz_d65_to_oklab_array(xyz: Array) -> Array:
+    """Convert a NumPy array of XYZ D65 values to Oklab."""
+
+    return lms_to_oklab_array(util.dot_array(XYZD65_TO_LMS, xyz))
 
 
 class Oklab(Labish, Space):
@@ -120,8 +148,10 @@ class Oklab(Labish, Space):
     CHANNEL_ALIASES = {
         "lightness": "l"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = LMS_TO_XYZD65
+    LINEAR_FROM_BASE = XYZD65_TO_LMS
 
     BOUNDS = (
         GamutUnbound(0.0, 1.0, FLG_OPT_PERCENT),
@@ -176,3 +206,39 @@ class Oklab(Labish, Space):
         """From XYZ."""
 
         return xyz_d65_to_oklab(xyz)
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """To linear LMS."""
+
+        return oklab_to_lms(coords)
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """From linear LMS."""
+
+        return lms_to_oklab(coords)
+
+    @classmethod
+    def to_base_array(cls, oklab: Array) -> Array:
+        """To XYZ."""
+
+        return oklab_to_xyz_d65_array(oklab)
+
+    @classmethod
+    def from_base_array(cls, xyz: Array) -> Array:
+        """From XYZ."""
+
+        return xyz_d65_to_oklab_array(xyz)
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """To linear LMS."""
+
+        return oklab_to_lms_array(coords)
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """From linear LMS."""
+
+        return lms_to_oklab_array(coords)
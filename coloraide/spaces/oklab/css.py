@@ -1,6 +1,6 @@
 """Oklab class."""
-import re
 from .. import oklab as base
+from ...spaces import LazyPattern
 from ... import parse
 from ... import util
 from ...util import MutableVector
@@ -13,7 +13,8 @@ if TYPE_CHECKING:  # pragma: no cover
 class Oklab(base.Oklab):
     """Oklab class."""
 
-    MATCH = re.compile(
+    MATCH_TOKENS = ('oklab(',)
+    MATCH = LazyPattern(
         r"""(?xi)
         (?:
             \bOklab\(\s*
@@ -50,7 +51,7 @@ class Oklab(base.Oklab):
         a = util.no_nan(self.alpha)
         alpha = alpha is not False and (alpha is True or a < 1.0 or util.is_nan(a))
         method = None if not isinstance(fit, str) else fit
-        coords = parent.fit(method=method).coords() if fit else self.coords()
+        coords = parent.fit(method=method).coords_view() if fit else self.coords_view()
         if not none:
             coords = util.no_nans(coords)
 
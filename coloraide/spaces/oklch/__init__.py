@@ -23,11 +23,10 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
-from ...spaces import Space, RE_DEFAULT_MATCH, GamutUnbound, Lchish, FLG_ANGLE, FLG_OPT_PERCENT
+from ...spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound, Lchish, FLG_ANGLE, FLG_OPT_PERCENT
 from ... import util
-import re
 import math
-from ...util import Vector, MutableVector
+from ...util import Vector, MutableVector, Array
 from typing import Tuple
 
 ACHROMATIC_THRESHOLD = 0.000002
@@ -67,6 +66,34 @@ def oklch_to_oklab(oklch: Vector) -> MutableVector:
     ]
 
 
+def oklab_to_oklch_array(oklab: Array) -> Array:
+    """Oklab to Oklch for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, a, b = oklab.T
+
+    c = np.sqrt(a ** 2 + b ** 2)
+    h = np.degrees(np.arctan2(b, a))
+
+    # Achromatic colors will often get extremely close, but not quite hit zero.
+    h = np.where(c < ACHROMATIC_THRESHOLD, util.NaN, h)
+
+    return np.stack([l, c, np.mod(h, 360)], axis=-1)
+
+
+def oklch_to_oklab_array(oklch: Array) -> Array:
+    """Oklch to Oklab for NumPy arrays."""
+
+    np = util.load_numpy()
+    l, c, h = oklch.T
+    h = np.radians(util.no_nans_array(h))
+
+    # If chroma is less than zero, clamp to zero.
+    c = np.maximum(c, 0.0)
+
+    return np.stack([l, c * np.cos(h), c * np.sin(h)], axis=-1)
+
+
 class Oklch(Lchish, Space):
     """Oklch class."""
 
@@ -79,7 +106,7 @@ class Oklch(Lchish, Space):
         "chroma": "c",
         "hue": "h"
     }
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
 
     BOUNDS = (
@@ -144,3 +171,15 @@ class Oklch(Lchish, Space):
         """To Lab."""
 
         return oklab_to_oklch(oklab)
+
+    @classmethod
+    def to_base_array(cls, oklch: Array) -> Array:
+        """To Lab."""
+
+        return oklch_to_oklab_array(oklch)
+
+    @classmethod
+    def from_base_array(cls, oklab: Array) -> Array:
+        """To Lab."""
+
+        return oklab_to_oklch_array(oklab)
@@ -1,10 +1,8 @@
 """Pro Photo RGB color class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .srgb import SRGB
 from .. import util
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 ET = 1 / 512
 ET2 = 16 / 512
@@ -30,13 +28,13 @@ def lin_prophoto_to_xyz(rgb: MutableVector) -> MutableVector:
     http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
     """
 
-    return cast(MutableVector, util.dot(RGB_TO_XYZ, rgb))
+    return util.matvec3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_prophoto(xyz: MutableVector) -> MutableVector:
     """Convert XYZ to linear-light prophoto-rgb."""
 
-    return cast(MutableVector, util.dot(XYZ_TO_RGB, xyz))
+    return util.matvec3(XYZ_TO_RGB, xyz)
 
 
 def lin_prophoto(rgb: MutableVector) -> MutableVector:
@@ -77,13 +75,29 @@ def gam_prophoto(rgb: MutableVector) -> MutableVector:
     return result
 
 
+def lin_prophoto_array(rgb: Array) -> Array:
+    """Convert a NumPy array of prophoto-rgb values to linear light (un-corrected) form."""
+
+    np = util.load_numpy()
+    return np.where(np.abs(rgb) < ET2, rgb / 16.0, util.npow_array(rgb, 1.8))
+
+
+def gam_prophoto_array(rgb: Array) -> Array:
+    """Convert a NumPy array of linear-light prophoto-rgb values to gamma corrected form."""
+
+    np = util.load_numpy()
+    return np.where(np.abs(rgb) < ET, 16.0 * rgb, util.npow_array(rgb, 1.8 ** -1))
+
+
 class ProPhotoRGB(SRGB):
     """Pro Photo RGB class."""
 
     BASE = "xyz-d50"
     NAME = "prophoto-rgb"
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
     WHITE = "D50"
+    LINEAR_TO_BASE = RGB_TO_XYZ
+    LINEAR_FROM_BASE = XYZ_TO_RGB
 
     @classmethod
     def to_base(cls, coords: MutableVector) -> MutableVector:
@@ -96,3 +110,39 @@ class ProPhotoRGB(SRGB):
         """From XYZ to Pro Photo RGB."""
 
         return gam_prophoto(xyz_to_lin_prophoto(coords))
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """To linear light."""
+
+        return lin_prophoto(coords)
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """From linear light."""
+
+        return gam_prophoto(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from ProPhoto RGB."""
+
+        return util.dot_array(RGB_TO_XYZ, lin_prophoto_array(coords))
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to ProPhoto RGB."""
+
+        return gam_prophoto_array(util.dot_array(XYZ_TO_RGB, coords))
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """To linear light."""
+
+        return lin_prophoto_array(coords)
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """From linear light."""
+
+        return gam_prophoto_array(coords)
@@ -1,11 +1,9 @@
 """Rec 2020 color class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .srgb import SRGB
 from .. import util
-import re
 import math
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 
 ALPHA = 1.09929682680944
 BETA = 0.018053968510807
@@ -68,13 +66,33 @@ def lin_2020_to_xyz(rgb: MutableVector) -> MutableVector:
     http://www.brucelindbloom.com/index.html?Eqn_RGB_XYZ_Matrix.html
     """
 
-    return cast(MutableVector, util.dot(RGB_TO_XYZ, rgb))
+    return util.matvec3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_2020(xyz: MutableVector) -> MutableVector:
     """Convert XYZ to linear-light rec-2020."""
 
-    return cast(MutableVector, util.dot(XYZ_TO_RGB, xyz))
+    return util.matvec3(XYZ_TO_RGB, xyz)
+
+
+def lin_2020_array(rgb: Array) -> Array:
+    """Convert a NumPy array of rec-2020 RGB values to linear light (un-corrected) form."""
+
+    np = util.load_numpy()
+    abs_rgb = np.abs(rgb)
+    return np.where(
+        abs_rgb < BETA45,
+        rgb / 4.5,
+        np.copysign(((abs_rgb + ALPHA - 1) / ALPHA) ** (0.45 ** -1), rgb)
+    )
+
+
+def gam_2020_array(rgb: Array) -> Array:
+    """Convert a NumPy array of linear-light rec-2020 RGB values to gamma corrected form."""
+
+    np = util.load_numpy()
+    abs_rgb = np.abs(rgb)
+    return np.where(abs_rgb < BETA, 4.5 * rgb, np.copysign(ALPHA * (abs_rgb ** 0.45) - (ALPHA - 1), rgb))
 
 
 class Rec2020(SRGB):
@@ -82,8 +100,10 @@ class Rec2020(SRGB):
 
     BASE = "xyz-d65"
     NAME = "rec2020"
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = RGB_TO_XYZ
+    LINEAR_FROM_BASE = XYZ_TO_RGB
 
     @classmethod
     def to_base(cls, coords: MutableVector) -> MutableVector:
@@ -96,3 +116,39 @@ class Rec2020(SRGB):
         """From XYZ to Rec 2020."""
 
         return gam_2020(xyz_to_lin_2020(coords))
+
+    @classmethod
+    def to_linear(cls, coords: MutableVector) -> MutableVector:
+        """To linear light."""
+
+        return lin_2020(coords)
+
+    @classmethod
+    def from_linear(cls, coords: MutableVector) -> MutableVector:
+        """From linear light."""
+
+        return gam_2020(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from Rec 2020."""
+
+        return util.dot_array(RGB_TO_XYZ, lin_2020_array(coords))
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to Rec 2020."""
+
+        return gam_2020_array(util.dot_array(XYZ_TO_RGB, coords))
+
+    @classmethod
+    def to_linear_array(cls, coords: Array) -> Array:
+        """To linear light."""
+
+        return lin_2020_array(coords)
+
+    @classmethod
+    def from_linear_array(cls, coords: Array) -> Array:
+        """From linear light."""
+
+        return gam_2020_array(coords)
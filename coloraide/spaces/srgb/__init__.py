@@ -1,8 +1,7 @@
 """SRGB color class."""
-from ...spaces import RE_DEFAULT_MATCH, Space, GamutBound, FLG_OPT_PERCENT
+from ...spaces import RE_DEFAULT_MATCH, LazyPattern, Space, GamutBound, FLG_OPT_PERCENT
 from ... import util
-from ...util import MutableVector
-import re
+from ...util import MutableVector, Array
 import math
 
 
@@ -42,6 +41,22 @@ def gam_srgb(rgb: MutableVector) -> MutableVector:
     return result
 
 
+def lin_srgb_array(rgb: Array) -> Array:
+    """Convert a NumPy array of sRGB values to linear light (un-corrected) form."""
+
+    np = util.load_numpy()
+    abs_rgb = np.abs(rgb)
+    return np.where(abs_rgb > 0.04045, np.copysign(((abs_rgb + 0.055) / 1.055) ** 2.4, rgb), rgb / 12.92)
+
+
+def gam_srgb_array(rgb: Array) -> Array:
+    """Convert a NumPy array of linear-light sRGB values to gamma corrected form."""
+
+    np = util.load_numpy()
+    abs_rgb = np.abs(rgb)
+    return np.where(abs_rgb > 0.0031308, np.copysign(1.055 * (abs_rgb ** (2.4 ** -1)) - 0.055, rgb), 12.92 * rgb)
+
+
 class SRGB(Space):
     """SRGB class."""
 
@@ -50,7 +65,7 @@ class SRGB(Space):
     # In addition to the current gamut, check HSL as it is much more sensitive to small
     # gamut changes. This is mainly for a better user experience. Colors will still be
     # mapped/clipped in the current space, unless specified otherwise.
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space=NAME, channels=3))
     CHANNEL_NAMES = ("r", "g", "b")
     CHANNEL_ALIASES = {
         "red": 'r',
@@ -112,3 +127,15 @@ class SRGB(Space):
         """To sRGB Linear from sRGB."""
 
         return lin_srgb(coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From sRGB Linear to sRGB."""
+
+        return gam_srgb_array(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To sRGB Linear from sRGB."""
+
+        return lin_srgb_array(coords)
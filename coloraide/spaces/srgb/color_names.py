@@ -5,7 +5,7 @@ A simple name to hex and hex to name map of CSS3 colors.
 
 http://www.w3.org/TR/SVG/types.html#ColorKeywords
 """
-from typing import Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 name2hex_map = {
     'aliceblue': '#f0f8ff',
@@ -163,6 +163,24 @@ name2hex_map = {
 
 hex2name_map = dict([(v, k) for k, v in name2hex_map.items()])
 
+# A trie of lowercase characters. The hex value of a name is stored under `''` in the node that ends it.
+NameTrie = Dict[str, Any]
+
+
+def build_name_trie(names: Mapping[str, str]) -> NameTrie:
+    """Build a trie of names."""
+
+    trie = {}  # type: NameTrie
+    for name, value in names.items():
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[''] = value
+    return trie
+
+
+name_trie = build_name_trie(name2hex_map)
+
 
 def hex2name(value: str) -> Optional[str]:
     """Convert CSS hex to webcolor name."""
@@ -174,3 +192,22 @@ def name2hex(name: str) -> Optional[str]:
     """Convert CSS hex to webcolor name."""
 
     return name2hex_map.get(name.lower(), None)
+
+
+def match_name(string: str, start: int = 0) -> Tuple[Optional[str], int]:
+    """
+    Follow the characters of a string through the name trie, ignoring case.
+
+    Returns the hex value of the name if the characters followed form one, and where they stopped.
+    """
+
+    node = name_trie
+    end = start
+    length = len(string)
+    while end < length:
+        child = node.get(string[end].lower())
+        if child is None:
+            break
+        node = child
+        end += 1
+    return node.get(''), end
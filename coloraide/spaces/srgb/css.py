@@ -1,7 +1,9 @@
 """SRGB color class."""
 import re
+from functools import lru_cache
 from . import color_names
 from .. import srgb as base
+from ...spaces import LazyPattern
 from ... import parse
 from ... import util
 from typing import Optional, Union, Any, Tuple, TYPE_CHECKING
@@ -12,11 +14,169 @@ if TYPE_CHECKING:  # pragma: no cover
 
 RE_COMPRESS = re.compile(r'(?i)^#({hex})\1({hex})\2({hex})\3(?:({hex})\4)?$'.format(**parse.COLOR_PARTS))
 
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+DIGITS = frozenset('0123456789')
+
+# Result of matching a color: the coordinates and alpha, and the end of the match.
+MatchResult = Tuple[Tuple[MutableVector, float], int]
+
+
+def is_word_char(char: str) -> bool:
+    """Check if a character is a regular expression word character."""
+
+    return char.isalnum() or char == '_'
+
+
+def skip_space(string: str, index: int) -> int:
+    """Skip whitespace."""
+
+    length = len(string)
+    while index < length and string[index].isspace():
+        index += 1
+    return index
+
+
+def scan_number(string: str, index: int) -> int:
+    """Scan a number without an exponent, returning its end, or the start if there is none."""
+
+    length = len(string)
+    end = index
+    if end < length and string[end] in '+-':
+        end += 1
+    digits = end
+    while end < length and string[end] in DIGITS:
+        end += 1
+    if end < length and string[end] == '.':
+        fraction = end + 1
+        while fraction < length and string[fraction] in DIGITS:
+            fraction += 1
+        if fraction > end + 1:
+            end = fraction
+    return end if end > digits else index
+
+
+def match_hex(string: str, start: int) -> Optional[MatchResult]:
+    """
+    Match a hex color without regular expressions.
+
+    Only colors that the `MATCH` pattern would match in the same way are matched.
+    """
+
+    length = len(string)
+    end = start + 1
+    while end < length and end - start <= 8 and string[end] in HEX_DIGITS:
+        end += 1
+    if end - start - 1 not in (3, 4, 6, 8) or (end < length and is_word_char(string[end])):
+        return None
+    return hex_channels(string, start, end), end
+
+
+def hex_channels(string: str, start: int, end: int) -> Tuple[MutableVector, float]:
+    """Get the channels of a valid hex color."""
+
+    size = end - start - 1
+    if size > 4:
+        channels = [int(string[i:i + 2], 16) * parse.RGB_CHANNEL_SCALE for i in range(start + 1, end, 2)]
+    else:
+        channels = [int(string[i], 16) * 17 * parse.RGB_CHANNEL_SCALE for i in range(start + 1, end)]
+    alpha = channels.pop() if size in (4, 8) else 1.0
+    return channels, alpha
+
+
+def match_name(string: str, start: int) -> Optional[MatchResult]:
+    """
+    Match a color name with the name trie, rejecting other words as soon as they stop matching a name.
+
+    Only names that the `MATCH` pattern would match are matched: whole words not preceded by `#`
+    and not followed by `(`.
+    """
+
+    if start and (string[start - 1] == '#' or is_word_char(string[start - 1])):
+        return None
+    value, end = color_names.match_name(string, start)
+    if value is None or (end < len(string) and (string[end] == '(' or is_word_char(string[end]))):
+        return None
+    channels, alpha = name_channels(value)
+    return (list(channels), alpha), end
+
+
+@lru_cache(maxsize=None)
+def name_channels(value: str) -> Tuple[Tuple[float, ...], float]:
+    """Get the channels of a color name's hex value."""
+
+    channels, alpha = hex_channels(value, 0, len(value))
+    return tuple(channels), alpha
+
+
+def match_rgb(string: str, start: int) -> Optional[MatchResult]:
+    """
+    Match a simple `rgb()` or `rgba()` color without regular expressions.
+
+    Values with exponents or `none` are not matched and are left to the `MATCH` pattern.
+    Only colors that the `MATCH` pattern would match in the same way are matched.
+    """
+
+    length = len(string)
+    index = start + 3
+    if string[start:index].lower() != 'rgb' or (start and is_word_char(string[start - 1])):
+        return None
+    if index < length and string[index] in 'aA':
+        index += 1
+    if index >= length or string[index] != '(':
+        return None
+    index = skip_space(string, index + 1)
+
+    # All channels must be numbers or all percentages, separated by either commas or whitespace.
+    channels = []
+    percent = False
+    comma = False
+    for channel in range(3):
+        if channel:
+            sep = skip_space(string, index)
+            if channel == 1:
+                comma = sep < length and string[sep] == ','
+            if comma:
+                if sep >= length or string[sep] != ',':
+                    return None
+                sep = skip_space(string, sep + 1)
+            elif sep == index:
+                return None
+            index = sep
+        end = scan_number(string, index)
+        if end == index:
+            return None
+        is_percent = end < length and string[end] == '%'
+        if not channel:
+            percent = is_percent
+        elif is_percent != percent:
+            return None
+        value = float(string[index:end])
+        channels.append(value / 100.0 if is_percent else value * parse.RGB_CHANNEL_SCALE)
+        index = end + 1 if is_percent else end
+
+    alpha = 1.0
+    index = skip_space(string, index)
+    if index < length and string[index] == (',' if comma else '/'):
+        index = skip_space(string, index + 1)
+        end = scan_number(string, index)
+        if end == index:
+            return None
+        alpha = float(string[index:end])
+        if end < length and string[end] == '%':
+            alpha /= 100.0
+            end += 1
+        alpha = util.clamp(alpha, 0.0, 1.0)
+        index = skip_space(string, end)
+    if index >= length or string[index] != ')':
+        return None
+    return (channels, alpha), index + 1
+
 
 class SRGB(base.SRGB):
     """SRGB class."""
 
-    MATCH = re.compile(
+    MATCH_TOKENS = ('rgb(', 'rgba(', '#', '<ident>')
+    MATCH = LazyPattern(
         r"""(?xi)
         (?:
             # RGB syntax
@@ -95,7 +255,7 @@ class SRGB(base.SRGB):
             factor = 100.0 if percent else 255.0
 
             method = None if not isinstance(fit, str) else fit
-            coords = parent.fit(method=method).coords() if fit else self.coords()
+            coords = parent.fit(method=method).coords_view() if fit else self.coords_view()
             if not none:
                 coords = util.no_nans(coords)
 
@@ -129,7 +289,7 @@ class SRGB(base.SRGB):
         """Get the hex `RGB` value."""
 
         method = None if not isinstance(fit, str) else fit
-        coords = util.no_nans(parent.fit(method=method).coords())
+        coords = util.no_nans(parent.fit(method=method).coords_view())
 
         template = "#{:02x}{:02x}{:02x}{:02x}" if alpha else "#{:02x}{:02x}{:02x}"
         if upper:
@@ -212,6 +372,24 @@ class SRGB(base.SRGB):
     ) -> Optional[Tuple[Tuple[MutableVector, float], int]]:
         """Match a CSS color string."""
 
+        # Most colors are hex, simple `rgb()`, or names, which are matched without regular expressions.
+        fast = None
+        if start < len(string):
+            char = string[start]
+            if char == '#':
+                fast = match_hex(string, start)
+            elif char.isalpha():
+                head = string[start:start + 6].lower()
+                if head.startswith(('rgb(', 'rgba(')):
+                    fast = match_rgb(string, start)
+                elif not head.startswith('color('):
+                    # Any other word can only be a color name.
+                    fast = match_name(string, start)
+                    if fast is None or (fullmatch and fast[1] != len(string)):
+                        return None
+        if fast is not None and (not fullmatch or fast[1] == len(string)):
+            return cls.null_adjust(*fast[0]), fast[1]
+
         match = super().match(string, start, fullmatch)
         if match is not None:
             return match
@@ -1,9 +1,7 @@
 """SRGB Linear color class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .srgb import SRGB
-import re
-from ..util import MutableVector
-from typing import cast
+from ..util import MutableVector, Array
 from ..import util
 
 
@@ -27,13 +25,13 @@ def lin_srgb_to_xyz(rgb: MutableVector) -> MutableVector:
     D65 (no chromatic adaptation)
     """
 
-    return cast(MutableVector, util.dot(RGB_TO_XYZ, rgb))
+    return util.matvec3(RGB_TO_XYZ, rgb)
 
 
 def xyz_to_lin_srgb(xyz: MutableVector) -> MutableVector:
     """Convert XYZ to linear-light sRGB."""
 
-    return cast(MutableVector, util.dot(XYZ_TO_RGB, xyz))
+    return util.matvec3(XYZ_TO_RGB, xyz)
 
 
 class SRGBLinear(SRGB):
@@ -42,8 +40,10 @@ class SRGBLinear(SRGB):
     BASE = 'xyz-d65'
     NAME = "srgb-linear"
     SERIALIZE = ("srgb-linear",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = RGB_TO_XYZ
+    LINEAR_FROM_BASE = XYZ_TO_RGB
 
     @classmethod
     def to_base(cls, coords: MutableVector) -> MutableVector:
@@ -56,3 +56,15 @@ class SRGBLinear(SRGB):
         """From XYZ to SRGB Linear."""
 
         return xyz_to_lin_srgb(coords)
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ from SRGB Linear."""
+
+        return util.dot_array(RGB_TO_XYZ, coords)
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ to SRGB Linear."""
+
+        return util.dot_array(XYZ_TO_RGB, coords)
@@ -1,7 +1,6 @@
 """XYZ class."""
-from ..spaces import RE_DEFAULT_MATCH
+from ..spaces import RE_DEFAULT_MATCH, LazyPattern
 from .xyz_d65 import XYZD65
-import re
 
 
 class XYZD50(XYZD65):
@@ -10,5 +9,5 @@ class XYZD50(XYZD65):
     BASE = "xyz-d65"
     NAME = "xyz-d50"
     SERIALIZE = ("xyz-d50",)
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D50"
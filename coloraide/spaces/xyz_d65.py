@@ -1,9 +1,14 @@
 """XYZ D65 class."""
-from ..spaces import Space, RE_DEFAULT_MATCH, GamutUnbound
-import re
-from ..util import MutableVector
+from ..spaces import Space, RE_DEFAULT_MATCH, LazyPattern, GamutUnbound
+from ..util import MutableVector, Array
 from typing import Tuple
 
+IDENTITY = [
+    [1.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [0.0, 0.0, 1.0]
+]
+
 
 class XYZD65(Space):
     """XYZ D65 class."""
@@ -12,8 +17,10 @@ class XYZD65(Space):
     NAME = "xyz-d65"
     SERIALIZE = ("xyz-d65", 'xyz')  # type: Tuple[str, ...]
     CHANNEL_NAMES = ("x", "y", "z")
-    DEFAULT_MATCH = re.compile(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
+    DEFAULT_MATCH = LazyPattern(RE_DEFAULT_MATCH.format(color_space='|'.join(SERIALIZE), channels=3))
     WHITE = "D65"
+    LINEAR_TO_BASE = IDENTITY
+    LINEAR_FROM_BASE = IDENTITY
 
     BOUNDS = (
         GamutUnbound(0.0, 1.0),
@@ -76,3 +83,15 @@ class XYZD65(Space):
         """
 
         return coords
+
+    @classmethod
+    def to_base_array(cls, coords: Array) -> Array:
+        """To XYZ (no change)."""
+
+        return coords
+
+    @classmethod
+    def from_base_array(cls, coords: Array) -> Array:
+        """From XYZ (no change)."""
+
+        return coords
@@ -0,0 +1,251 @@
+"""
+Match colors with a single tokenizer.
+
+Instead of trying every registered color space's patterns at a position, one precompiled
+pattern recognizes how a color at the position starts: `color(` and the color space name,
+a function name such as `rgb(`, `#`, or an identifier. Only the color spaces that can match
+colors starting with that token are tried, so the cost of scanning a string does not grow
+with the number of registered color spaces.
+
+Color spaces always match `color(` followed by one of their serialized names, and can declare
+additional tokens with `MATCH_TOKENS`. Color spaces that customize `match` without declaring
+any tokens themselves are tried for every token, as tokens inherited from a parent may not
+describe the custom `match`.
+
+When searching a buffer, colors are only matched where a token can start: at `#`, `color(`,
+and the start of a word. When color spaces that match anything are registered, every position is tried.
+"""
+import re
+from .spaces import Space
+from typing import Dict, Iterator, IO, Optional, Sequence, Set, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .color import Color
+
+# Tokens for hex colors and identifiers, such as color names.
+TOKEN_HEX = '#'
+TOKEN_IDENT = '<ident>'
+
+RE_TOKEN = re.compile(
+    r"""(?xi)
+    (?:
+        # The color space name of `color()`
+        color\(\s*([^\s(),/]+) |
+        # Function name
+        ([-\w]+)\( |
+        # Hex
+        (\#) |
+        # Identifier
+        [-\w]+
+    )
+    """
+)
+
+# Positions where a token can start.
+RE_CANDIDATE = re.compile(r'\#|\b\w|(?<![-\w])-|(?i:color\()')
+
+# Characters that must be read after a position in a stream before it is matched,
+# and characters kept before it so lookbehinds still see them.
+STREAM_LOOKAHEAD = 1024
+STREAM_LOOKBEHIND = 16
+
+# Color spaces to try for each token, in registration order. Colors that do not start with
+# a known token, and the `None` key, are tried with the color spaces that match anything.
+MatchTable = Dict[Optional[str], Tuple[Type[Space], ...]]
+
+# Parse cache key: the allowed color spaces and the color string. Entries are the color space,
+# the coordinates, and the alpha of the parsed color, `None` if the string is not a valid color.
+ParseKey = Tuple[Optional[Tuple[str, ...]], str]
+ParseEntry = Optional[Tuple[str, Tuple[float, ...], float]]
+
+
+def get_tokens(space: Type[Space]) -> Optional[Set[str]]:
+    """
+    Get the tokens a color space matches, `None` if it may match anything.
+
+    Like linear declarations, tokens are only trusted if they are declared by the same class,
+    or a subclass of the class, that defines `match`.
+    """
+
+    mro = space.mro()
+    method_owner = next(i for i, c in enumerate(mro) if 'match' in vars(c))
+    attr_owner = next(i for i, c in enumerate(mro) if 'MATCH_TOKENS' in vars(c))
+    if attr_owner > method_owner:
+        return None
+
+    tokens = set('color(' + name.lower() for name in space._serialize())
+    if space.MATCH_TOKENS is not None:
+        tokens.update(token.lower() for token in space.MATCH_TOKENS)
+    elif getattr(space.match, '__func__', None) is not getattr(Space.match, '__func__', None):
+        return None
+    return tokens
+
+
+def get_match_table(color_cls: Type['Color']) -> MatchTable:
+    """
+    Get the color spaces to try for each token.
+
+    Tables are cached per `Color` class and are replaced whenever plugins are registered or deregistered.
+    A table is built completely before it is published, so other threads never see a partial table.
+    """
+
+    table = color_cls._MATCH_TABLE
+    if not table:
+        spaces = [(space, get_tokens(space)) for space in color_cls.CS_MAP.values()]
+        keys = set()  # type: Set[str]
+        for _, tokens in spaces:
+            if tokens is not None:
+                keys.update(tokens)
+        table = {key: tuple(s for s, tokens in spaces if tokens is None or key in tokens) for key in keys}
+        table[None] = tuple(space for space, tokens in spaces if tokens is None)
+        color_cls._MATCH_TABLE = table
+    return table
+
+
+def get_token(string: str, start: int) -> Optional[str]:
+    """Get the token at the start of a color, `None` if there is none."""
+
+    m = RE_TOKEN.match(string, start)
+    if m is None:
+        return None
+    if m.group(1) is not None:
+        return 'color(' + m.group(1).lower()
+    if m.group(2) is not None:
+        return m.group(2).lower() + '('
+    if m.group(3) is not None:
+        return TOKEN_HEX
+    return TOKEN_IDENT
+
+
+def match(
+    color_cls: Type['Color'],
+    string: str,
+    start: int = 0,
+    fullmatch: bool = False,
+    filters: Optional[Sequence[str]] = None
+) -> Optional[Tuple[Space, int, int]]:
+    """
+    Match a color at the given position, trying only the color spaces that can match its token.
+
+    An unknown function name may still start with an identifier, such as `red-ish(`, so the
+    color spaces that match identifiers are tried.
+    """
+
+    table = get_match_table(color_cls)
+    token = get_token(string, start)
+    candidates = table.get(token)
+    if candidates is None and token is not None and token.endswith('(') and not token.startswith('color('):
+        candidates = table.get(TOKEN_IDENT)
+    if candidates is None:
+        candidates = table[None]
+
+    for space_class in candidates:
+        if filters and space_class.NAME not in filters:
+            continue
+        m = space_class.match(string, start, fullmatch)
+        if m is not None:
+            return space_class(*m[0]), start, m[1]
+    return None
+
+
+def cached_parse(
+    color_cls: Type['Color'],
+    string: str,
+    filters: Optional[Sequence[str]] = None
+) -> Optional[Space]:
+    """
+    Fully match a color string using the class's least recently used parse cache.
+
+    Like `functools.lru_cache`, the cache is guarded by a lock, but strings are matched outside of it.
+    """
+
+    cache = color_cls._PARSE_CACHE
+    stats = color_cls._PARSE_CACHE_STATS
+    key = (tuple(filters) if filters else None, string)
+    with color_cls._PARSE_CACHE_LOCK:
+        if key in cache:
+            stats[0] += 1
+            cache.move_to_end(key)
+            entry = cache[key]
+            if entry is None:
+                return None
+            return color_cls.CS_MAP[entry[0]]._new(list(entry[1]), entry[2])
+        stats[1] += 1
+
+    m = color_cls._match(string, fullmatch=True, filters=filters)
+    obj = m[0] if m is not None else None
+    with color_cls._PARSE_CACHE_LOCK:
+        cache[key] = (obj.NAME, tuple(obj.coords_view()), obj.alpha) if obj is not None else None
+        while len(cache) > color_cls.PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+    return obj
+
+
+def finditer(
+    color_cls: Type['Color'],
+    string: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    filters: Optional[Sequence[str]] = None
+) -> Iterator[Tuple[Space, int, int]]:
+    """
+    Find all colors in a buffer.
+
+    Only colors starting before `end` are matched, but matches may extend past it.
+    """
+
+    if end is None:
+        end = len(string)
+    anywhere = bool(get_match_table(color_cls)[None])
+    pos = start
+    while pos < end:
+        if not anywhere:
+            m = RE_CANDIDATE.search(string, pos)
+            if m is None or m.start() >= end:
+                break
+            pos = m.start()
+        found = match(color_cls, string, pos, False, filters)
+        if found is None:
+            pos += 1
+        else:
+            yield found
+            pos = found[2] if found[2] > pos else pos + 1
+
+
+def finditer_stream(
+    color_cls: Type['Color'],
+    stream: IO[str],
+    filters: Optional[Sequence[str]] = None,
+    chunk_size: int = 65536
+) -> Iterator[Tuple[Space, int, int]]:
+    """
+    Find all colors in a stream, reading it in chunks.
+
+    A position is only matched once `STREAM_LOOKAHEAD` characters after it have been read, or the
+    stream is exhausted, so colors shorter than that are never split by a chunk boundary.
+    Positions are offsets from the start of the stream.
+    """
+
+    buffer = ''
+    offset = 0
+    pos = 0
+    eof = False
+    while not eof:
+        data = stream.read(chunk_size)
+        if data:
+            buffer += data
+        else:
+            eof = True
+        end = len(buffer) if eof else len(buffer) - STREAM_LOOKAHEAD
+        if pos >= end:
+            continue
+        for space, s, e in finditer(color_cls, buffer, pos, end, filters):
+            yield space, s + offset, e + offset
+            pos = e
+        pos = max(pos, end)
+
+        # Drop what has been scanned, keeping enough context for lookbehinds.
+        cut = max(0, pos - STREAM_LOOKBEHIND)
+        buffer = buffer[cut:]
+        offset += cut
+        pos -= cut
@@ -2,17 +2,19 @@
 import math
 import numbers
 import warnings
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Optional, Sequence, List, Union, Any, Callable, Mapping, cast, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
-    from .color import Color
+    from .color import Color, FrozenColor
 
 Vector = Sequence[float]
 Matrix = Sequence[Sequence[float]]
 MutableVector = List[float]
 MutableMatrix = List[List[float]]
-ColorInput = Union['Color', str, Mapping[str, Any]]
+ColorInput = Union['Color', 'FrozenColor', str, Mapping[str, Any]]
+# NumPy is an optional dependency, so arrays are loosely typed.
+Array = Any
 
 NaN = float('nan')
 INF = float('inf')
@@ -58,6 +60,21 @@ C2 = 2413 / 128
 C3 = 2392 / 128
 
 
+@lru_cache(maxsize=None)
+def load_numpy() -> Any:
+    """
+    Get the NumPy module if it is installed, `None` if it is not.
+
+    NumPy is only imported on first use so that it does not add to the import time of the library.
+    """
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
 def xy_to_xyz(xy: Vector, Y: float = 1) -> MutableVector:
     """Convert `xyY` to `xyz`."""
 
@@ -168,6 +185,43 @@ def pq_st2084_eotf(
     return adjusted
 
 
+def pq_st2084_inverse_eotf_array(
+    values: Array,
+    c1: float = C1,
+    c2: float = C2,
+    c3: float = C3,
+    m1: float = M1,
+    m2: float = M2
+) -> Array:
+    """
+    Perceptual quantizer (SMPTE ST 2084) - inverse EOTF for NumPy arrays.
+
+    The steep curve loses too much precision in single precision, so it is always calculated,
+    and returned, in double precision.
+    """
+
+    np = load_numpy()
+    c = npow_array(values.astype(np.float64) / 10000, m1)
+    r = (c1 + c2 * c) / (1 + c3 * c)
+    return npow_array(r, m2)
+
+
+def pq_st2084_eotf_array(
+    values: Array,
+    c1: float = C1,
+    c2: float = C2,
+    c3: float = C3,
+    m1: float = M1,
+    m2: float = M2
+) -> Array:
+    """Perceptual quantizer (SMPTE ST 2084) - EOTF for NumPy arrays, calculated in double precision."""
+
+    np = load_numpy()
+    c = npow_array(values.astype(np.float64), 1 / m2)
+    r = (c - c1) / (c2 - c3 * c)
+    return 10000 * npow_array(r, 1 / m1)
+
+
 def xyz_d65_to_absxyzd65(xyzd65: Vector) -> MutableVector:
     """XYZ D65 to Absolute XYZ D65."""
 
@@ -180,12 +234,40 @@ def absxyzd65_to_xyz_d65(absxyzd65: Vector) -> MutableVector:
     return [max(c / YW, 0) for c in absxyzd65]
 
 
+def xyz_d65_to_absxyzd65_array(xyzd65: Array) -> Array:
+    """XYZ D65 to Absolute XYZ D65 for NumPy arrays."""
+
+    np = load_numpy()
+    return np.maximum(xyzd65 * YW, 0)
+
+
+def absxyzd65_to_xyz_d65_array(absxyzd65: Array) -> Array:
+    """Absolute XYZ D65 XYZ D65 for NumPy arrays."""
+
+    np = load_numpy()
+    return np.maximum(absxyzd65 / YW, 0)
+
+
 def npow(base: float, exp: float) -> float:
     """Perform `pow` with a negative number."""
 
     return math.copysign(abs(base) ** exp, base)
 
 
+def npow_array(base: Array, exp: float) -> Array:
+    """Perform `pow` with negative numbers on a NumPy array."""
+
+    np = load_numpy()
+    return np.copysign(np.abs(base) ** exp, base)
+
+
+def no_nans_array(value: Array, default: float = 0.0) -> Array:
+    """Ensure there are no `NaN` values in a NumPy array."""
+
+    np = load_numpy()
+    return np.where(np.isnan(value), default, value)
+
+
 def constrain_hue(hue: float) -> float:
     """Constrain hue to 0 - 360."""
 
@@ -255,6 +337,53 @@ def dot(a: Union[float, Vector, Matrix], b: Union[float, Vector, Matrix]) -> Uni
         )
 
 
+def matvec3(m: Matrix, v: Vector) -> MutableVector:
+    """
+    Get the dot product of a 3x3 matrix and a 3 element vector.
+
+    This is unrolled as it is the most common operation when converting colors.
+    """
+
+    x, y, z = v
+    r0, r1, r2 = m
+    return [
+        r0[0] * x + r0[1] * y + r0[2] * z,
+        r1[0] * x + r1[1] * y + r1[2] * z,
+        r2[0] * x + r2[1] * y + r2[2] * z
+    ]
+
+
+def matmul3(a: Matrix, b: Matrix) -> MutableMatrix:
+    """Get the dot product of two 3x3 matrices."""
+
+    (a00, a01, a02), (a10, a11, a12), (a20, a21, a22) = a
+    (b00, b01, b02), (b10, b11, b12), (b20, b21, b22) = b
+    return [
+        [
+            a00 * b00 + a01 * b10 + a02 * b20,
+            a00 * b01 + a01 * b11 + a02 * b21,
+            a00 * b02 + a01 * b12 + a02 * b22
+        ],
+        [
+            a10 * b00 + a11 * b10 + a12 * b20,
+            a10 * b01 + a11 * b11 + a12 * b21,
+            a10 * b02 + a11 * b12 + a12 * b22
+        ],
+        [
+            a20 * b00 + a21 * b10 + a22 * b20,
+            a20 * b01 + a21 * b11 + a22 * b21,
+            a20 * b02 + a21 * b12 + a22 * b22
+        ]
+    ]
+
+
+def dot_array(matrix: Matrix, coords: Array) -> Array:
+    """Get the dot product of a matrix and each row of an `(N, channels)` NumPy array."""
+
+    np = load_numpy()
+    return coords @ np.transpose(np.asarray(matrix, dtype=coords.dtype))
+
+
 def multiply(
     a: Union[float, Vector, Matrix],
     b: Union[float, Vector, Matrix]
@@ -443,6 +572,34 @@ def inv(matrix: Matrix) -> MutableMatrix:
     return im
 
 
+def inv3(matrix: Matrix) -> MutableMatrix:
+    """Invert a 3x3 matrix using the adjugate and the determinant."""
+
+    (a, b, c), (d, e, f), (g, h, i) = matrix
+
+    # Cofactors of the first row
+    c00 = e * i - f * h
+    c01 = f * g - d * i
+    c02 = d * h - e * g
+
+    det = a * c00 + b * c01 + c * c02
+    if det == 0:
+        raise ValueError('Matrix is not invertable')
+    idet = 1.0 / det
+
+    return [
+        [c00 * idet, (c * h - b * i) * idet, (b * f - c * e) * idet],
+        [c01 * idet, (a * i - c * g) * idet, (c * d - a * f) * idet],
+        [c02 * idet, (b * g - a * h) * idet, (a * e - b * d) * idet]
+    ]
+
+
+def cbrt_array(n: Array) -> Array:
+    """Calculate cube root of a NumPy array."""
+
+    return npow_array(n, 1 / 3)
+
+
 def cbrt(n: float) -> float:
     """Calculate cube root."""
 
@@ -1,12 +1,29 @@
 """Test API."""
 import unittest
+import pickle
+import coloraide
 from coloraide import Color, NaN, Piecewise
 from . import util
 import math
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 PERCENT_SKIP = "Skipping as we currently do not perform any percent restrictions."
 
 
+class ParseColor(Color):
+    """Color class whose plugins are changed at runtime, importable by worker processes."""
+
+
+class Derived(Color):
+    """Color class that remembers converted coordinates."""
+
+    DERIVED_CACHE_SIZE = 4
+
+
 class TestAPI(util.ColorAsserts, unittest.TestCase):
     """Test API."""
 
@@ -180,6 +197,176 @@ class TestAPI(util.ColorAsserts, unittest.TestCase):
         c2 = c1.clone()
         self.assertEqual(c1, c2)
 
+    def test_clone_independent(self):
+        """Test that a clone does not share coordinates with the original."""
+
+        c1 = Color('purple')
+        c2 = c1.clone()
+        c2.set('red', 0.5)
+        self.assertNotEqual(c1, c2)
+        self.assertEqual(c1, Color('purple'))
+
+    def test_convert_independent(self):
+        """Test that converting to the same space does not share coordinates with the original."""
+
+        c1 = Color('purple')
+        c2 = c1.convert('srgb')
+        c2.set('red', 0.5)
+        self.assertEqual(c1, Color('purple'))
+
+    def test_new_space_case(self):
+        """Test that space names are case insensitive when creating from data."""
+
+        self.assertEqual(Color('DISPLAY-P3', [0.5, 0.2, 0.1]), Color('display-p3', [0.5, 0.2, 0.1]))
+
+    def test_new_validates_data(self):
+        """Test that data provided by the user is still validated."""
+
+        self.assertEqual(Color('srgb', [1, 0, 0], 2).alpha, 1.0)
+        with self.assertRaises(TypeError):
+            Color('srgb', ['red', 0, 0])
+
+    def test_slots(self):
+        """Test that colors and the built-in color spaces do not have an instance dictionary."""
+
+        class Custom(Color):
+            __slots__ = ()
+
+        for color in (Color('red').convert('lch'), Custom('red').convert('okhsl')):
+            self.assertFalse(hasattr(color, '__dict__'))
+            self.assertFalse(hasattr(color._space, '__dict__'))
+
+    def test_slots_subclass(self):
+        """Test that subclasses defined outside the library keep an instance dictionary."""
+
+        from coloraide.spaces.srgb.css import SRGB
+
+        class Custom(Color):
+            pass
+
+        class Custom2(Color):
+            __slots__ = ()
+
+        class MySRGB(SRGB):
+            NAME = 'my-srgb'
+            SERIALIZE = ('--my-srgb',)
+
+        Custom.register(MySRGB)
+        c = Custom('red')
+        c.foo = 1
+        self.assertEqual(c.foo, 1)
+        c.red = 0.5
+        self.assertEqual(c.get('red'), 0.5)
+        self.assertNotIn('red', c.__dict__)
+        self.assertTrue(hasattr(Custom('my-srgb', [1, 0, 0])._space, '__dict__'))
+        with self.assertRaises(AttributeError):
+            Custom2('red').foo = 1
+
+    def test_unknown_attribute(self):
+        """Test that attributes that are not channels cannot be set."""
+
+        c = Color('red')
+        with self.assertRaises(AttributeError):
+            c.unknown = 1
+        with self.assertRaises(AttributeError):
+            c.unknown
+
+    def test_channel_attributes(self):
+        """Test getting and setting channels and aliases as attributes."""
+
+        c = Color('red').convert('hsl')
+        c.hue = 120
+        c.s = 0.5
+        c.alpha = 2
+        self.assertEqual([c.h, c.saturation, c.alpha], [120, 0.5, 1.0])
+        with self.assertRaises(TypeError):
+            c.h = 'red'
+
+    def test_coords_view(self):
+        """Test that coordinate views are not copies, while coordinates are."""
+
+        c1 = Color('red')
+        view = c1.coords_view()
+        self.assertEqual(list(view), [1, 0, 0])
+        self.assertIs(view, c1.coords_view())
+        c1.set('green', 0.5)
+        self.assertEqual(list(view), [1, 0.5, 0])
+        coords = c1.coords()
+        coords[0] = 0
+        self.assertEqual(c1.coords(), [1, 0.5, 0])
+        self.assertIsNot(c1.coords(), c1.coords())
+
+    def test_freeze(self):
+        """Test frozen colors."""
+
+        c1 = Color('color(srgb 1 0.5 0 / 0.5)')
+        f = c1.freeze()
+        self.assertEqual(f.space(), 'srgb')
+        self.assertEqual(f.coords(), [1, 0.5, 0])
+        self.assertEqual(f.alpha, 0.5)
+        self.assertEqual(f.get('green'), 0.5)
+        self.assertEqual(f.to_string(), c1.to_string())
+        self.assertEqual(f.thaw(), c1)
+        self.assertEqual(Color(f), c1)
+        self.assertEqual(c1.convert('hsl').update(f), c1.convert('hsl'))
+
+    def test_freeze_immutable(self):
+        """Test that frozen colors cannot be changed."""
+
+        c1 = Color('red')
+        f = c1.freeze()
+        c1.set('red', 0)
+        self.assertEqual(f.thaw(), Color('red'))
+        with self.assertRaises(AttributeError):
+            f.alpha = 0.5
+        with self.assertRaises(AttributeError):
+            f._space = 'lab'
+        f.thaw().set('red', 0)
+        self.assertEqual(f.thaw(), Color('red'))
+
+    def test_freeze_hash(self):
+        """Test that frozen colors can be used as keys."""
+
+        c1 = Color('hsl', [NaN, 0, 0.5])
+        c2 = Color('hsl', [float('nan'), 0, 0.5])
+        self.assertEqual(c1, c2)
+        self.assertEqual(c1.freeze(), c2.freeze())
+        self.assertEqual(hash(c1.freeze()), hash(c2.freeze()))
+        self.assertEqual(len({c1.freeze(), c2.freeze(), Color('red').freeze()}), 2)
+        self.assertNotEqual(Color('red').freeze(), Color('red').convert('hsl').freeze())
+        self.assertNotEqual(Color('red').freeze(), Color('red'))
+
+    def test_freeze_class(self):
+        """Test that frozen colors of different classes are not equal."""
+
+        class Custom(Color):
+            pass
+
+        f = Custom('red').freeze()
+        self.assertNotEqual(f, Color('red').freeze())
+        self.assertIsInstance(f.thaw(), Custom)
+
+    def test_freeze_pickle(self):
+        """Test pickling frozen colors."""
+
+        f = Color('hsl', [NaN, 0, 0.5]).freeze()
+        self.assertEqual(pickle.loads(pickle.dumps(f)), f)
+
+    def test_freeze_input(self):
+        """Test that frozen colors are accepted as color inputs."""
+
+        self.assertEqual(Color('red').delta_e(Color('blue').freeze()), Color('red').delta_e('blue'))
+
+    def test_freeze_mix(self):
+        """Test that frozen colors can be mixed and interpolated."""
+
+        frozen = Color('blue').freeze()
+        self.assertColorEqual(Color('red').mix(frozen), Color('red').mix('blue'))
+        self.assertColorEqual(
+            Color('red').interpolate(frozen, stop=0.5)(0.25),
+            Color('red').interpolate('blue', stop=0.5)(0.25)
+        )
+
     def test_update(self):
         """Test update."""
 
@@ -219,6 +406,74 @@ class TestAPI(util.ColorAsserts, unittest.TestCase):
         c2 = c1.convert('hsl')
         self.assertColorEqual(c2, Color('hsl(39, 100%, 50%)'), precision=0)
 
+    def test_convert_many(self):
+        """Test converting many coordinates at once."""
+
+        colors = [Color('red'), Color('green'), Color('blue'), Color('srgb', [0.2, 0.4, 0.6])]
+        results = Color.convert_many('srgb', 'oklch', [c.coords() for c in colors])
+        for color, coords in zip(colors, results):
+            self.assertColorEqual(Color('oklch', coords), color.convert('oklch'))
+
+    def test_convert_many_same_space(self):
+        """Test converting many coordinates when the spaces are the same."""
+
+        coords = [[1, 0, 0], [0, 0.5, 1]]
+        results = Color.convert_many('srgb', 'SRGB', coords)
+        self.assertEqual(results, coords)
+        self.assertIsNot(results[0], coords[0])
+
+    def test_convert_many_nan(self):
+        """Test that undefined channels are treated as zero when converting many coordinates."""
+
+        self.assertEqual(
+            Color.convert_many('hsl', 'srgb', [[NaN, 0, 0.5]]),
+            [Color('hsl', [NaN, 0, 0.5]).convert('srgb').coords()]
+        )
+
+    def test_convert_many_bad_space(self):
+        """Test converting many coordinates with bad spaces."""
+
+        with self.assertRaises(ValueError):
+            Color.convert_many('bad', 'srgb', [[1, 0, 0]])
+
+        with self.assertRaises(ValueError):
+            Color.convert_many('srgb', 'bad', [[1, 0, 0]])
+
+    def test_converter(self):
+        """Test getting a converter between two spaces."""
+
+        converter = Color.converter('srgb', 'OkLCh')
+        for coords in ([1, 0, 0], [0.2, 0.4, 0.6], [1, 1, 1]):
+            color = Color('srgb', coords)
+            self.assertColorEqual(Color('oklch', converter(coords)), color.convert('oklch'))
+        self.assertIs(Color.converter('srgb', 'oklch'), converter)
+
+    def test_converter_same_space(self):
+        """Test a converter when the spaces are the same."""
+
+        coords = [1, NaN, 0]
+        result = Color.converter('srgb', 'srgb')(coords)
+        self.assertEqual(result[0], 1)
+        self.assertTrue(math.isnan(result[1]))
+        self.assertIsNot(result, coords)
+
+    def test_converter_nan(self):
+        """Test that a converter treats undefined channels as zero."""
+
+        self.assertEqual(
+            Color.converter('hsl', 'srgb')([NaN, 0, 0.5]),
+            Color('hsl', [NaN, 0, 0.5]).convert('srgb').coords()
+        )
+
+    def test_converter_bad_space(self):
+        """Test a converter with bad spaces."""
+
+        with self.assertRaises(ValueError):
+            Color.converter('bad', 'srgb')
+
+        with self.assertRaises(ValueError):
+            Color.converter('srgb', 'bad')
+
     def test_convert_fit(self):
         """Test convert fit."""
 
@@ -337,6 +592,58 @@ class TestAPI(util.ColorAsserts, unittest.TestCase):
         with self.assertRaises(TypeError):
             c1.set("red", "bad")
 
+    def test_set_many(self):
+        """Test setting multiple channels."""
+
+        c1 = Color('orange')
+        c2 = Color('orange').set('oklch.l', 0.5).set('oklch.c', lambda c: c / 2).set('oklch.h', 30)
+        c1.set_many({'oklch.l': 0.5, 'oklch.c': lambda c: c / 2, 'oklch.h': 30})
+        self.assertColorEqual(c1, c2)
+        self.assertEqual(c1.space(), 'srgb')
+
+    def test_set_many_mixed(self):
+        """Test setting channels of multiple color spaces in order."""
+
+        c1 = Color('orange').set_many({'red': 0.2, 'hsl.lightness': 0.8, 'hsl.hue': 200, 'alpha': 0.5})
+        c2 = Color('orange').set('red', 0.2).set('hsl.lightness', 0.8).set('hsl.hue', 200).set('alpha', 0.5)
+        self.assertColorEqual(c1, c2)
+
+    def test_set_many_converts_once(self):
+        """Test that consecutive channels of a color space convert once each way."""
+
+        with coloraide.profile() as stats:
+            Color('orange').set_many({'oklch.l': 0.5, 'oklch.c': 0.1, 'oklch.h': 30})
+        self.assertEqual(stats.calls['Color.convert'][0], 2)
+
+    def test_set_many_bad_chain(self):
+        """Test bad set."""
+
+        with self.assertRaises(ValueError):
+            Color('orange').set_many({'hsl.hue.wrong': 0.5})
+
+    def test_edit(self):
+        """Test editing in another color space."""
+
+        c1 = Color('orange')
+        with c1.edit('oklch') as c:
+            self.assertEqual(c.space(), 'oklch')
+            c.lightness = 0.5
+            c.chroma /= 2
+            c.hue = 30
+        c2 = Color('orange').set('oklch.l', 0.5).set('oklch.c', lambda c: c / 2).set('oklch.h', 30)
+        self.assertColorEqual(c1, c2)
+        self.assertEqual(c1.space(), 'srgb')
+
+    def test_edit_exception(self):
+        """Test that edits are discarded on an exception."""
+
+        c1 = Color('orange')
+        with self.assertRaises(ValueError):
+            with c1.edit('oklch') as c:
+                c.lightness = 0.5
+                raise ValueError('bad')
+        self.assertEqual(c1, Color('orange'))
+
     def test_blend(self):
         """Test blend logic."""
 
@@ -699,6 +1006,258 @@ class TestAPI(util.ColorAsserts, unittest.TestCase):
         self.assertIsNotNone(Color.match('lab(100% 0 0)'))
         self.assertIsNone(Color.match('lab(100% 0 0)', filters=['srgb']))
 
+    def test_match_table(self):
+        """Test that only the color spaces that can match a token are tried."""
+
+        from coloraide import tokenizer
+        from coloraide.spaces.srgb.css import SRGB
+
+        class Custom(Color):
+            pass
+
+        table = tokenizer.get_match_table(Custom)
+        self.assertEqual(table['rgb('], (SRGB,))
+        self.assertEqual(table[tokenizer.TOKEN_HEX], (SRGB,))
+        self.assertEqual(table[None], ())
+        self.assertEqual([s.NAME for s in table['color(--okhsv']], ['okhsv'])
+
+    def test_match_table_cleared(self):
+        """Test that the match table is rebuilt when plugins are registered."""
+
+        from coloraide import tokenizer
+
+        class Custom(Color):
+            pass
+
+        self.assertIsNotNone(Custom.match('color(--jzazbz 0.1 0 0)'))
+        self.assertIn('color(--jzazbz', Custom._MATCH_TABLE)
+        Custom.deregister('space:jzazbz')
+        self.assertEqual(Custom._MATCH_TABLE, {})
+        self.assertIsNone(Custom.match('color(--jzazbz 0.1 0 0)'))
+        self.assertNotIn('color(--jzazbz', tokenizer.get_match_table(Custom))
+
+    def test_match_table_threads(self):
+        """Test that threads never match against a partially built table."""
+
+        import sys
+        import threading
+
+        class Custom(Color):
+            pass
+
+        strings = ['red', 'hsl(1 2% 3%)', '#fff', 'lab(1% 2 3)']
+        errors = []
+
+        def worker(barrier):
+            """Parse every string as soon as all threads are ready."""
+
+            barrier.wait()
+            for string in strings:
+                try:
+                    Custom(string)
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(200):
+                Custom._clear_caches()
+                barrier = threading.Barrier(6)
+                threads = [threading.Thread(target=worker, args=(barrier,)) for _ in range(6)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
+
+    def test_match_tokens(self):
+        """Test color spaces that declare their own tokens."""
+
+        from coloraide.spaces.hsl.css import HSL
+
+        class Hsx(HSL):
+            NAME = 'hsx'
+            SERIALIZE = ('--hsx',)
+            MATCH_TOKENS = ('hsx(',)
+
+            @classmethod
+            def match(cls, string, start=0, fullmatch=True):
+                """Match `hsx()` as `hsl()`."""
+
+                if string[start:start + 4].lower() != 'hsx(':
+                    return None
+                return super().match(string[:start] + 'hsl(' + string[start + 4:], start, fullmatch)
+
+        class Custom(Color):
+            pass
+
+        Custom.register(Hsx)
+        self.assertEqual(Custom.match('hsx(0 100% 50%)').color.space(), 'hsx')
+        self.assertEqual(Custom.match('hsl(0 100% 50%)').color.space(), 'hsl')
+        self.assertIsNone(Color.match('hsx(0 100% 50%)'))
+
+    def test_match_custom_without_tokens(self):
+        """Test that color spaces customizing `match` without tokens are tried for any token."""
+
+        from coloraide import tokenizer
+        from coloraide.spaces.srgb import SRGB
+
+        class Named(SRGB):
+            NAME = 'named'
+            SERIALIZE = ('--named',)
+
+            @classmethod
+            def match(cls, string, start=0, fullmatch=True):
+                """Match `@red`."""
+
+                if string.startswith('@red', start) and (not fullmatch or len(string) == start + 4):
+                    return ([1.0, 0.0, 0.0], 1.0), start + 4
+                return None
+
+        class Custom(Color):
+            pass
+
+        Custom.register(Named)
+        table = tokenizer.get_match_table(Custom)
+        self.assertIn(Named, table[None])
+        self.assertIn(Named, table['rgb('])
+        obj = Custom.match('@red', fullmatch=True)
+        self.assertEqual(obj.color.space(), 'named')
+        self.assertEqual(obj.end, 4)
+        self.assertEqual(Custom.match('red').color.space(), 'srgb')
+        self.assertEqual(
+            [m.color.space() for m in Custom.finditer('a @red and red')],
+            ['named', 'srgb']
+        )
+
+    def test_match_custom_inherited_tokens(self):
+        """Test that tokens inherited from a parent are not trusted when a subclass customizes `match`."""
+
+        from coloraide import tokenizer
+        from coloraide.spaces.srgb.css import SRGB
+
+        class MyRGB(SRGB):
+            NAME = 'myrgb'
+            SERIALIZE = ('--myrgb',)
+
+            @classmethod
+            def match(cls, string, start=0, fullmatch=True):
+                """Match `myrgb(r, g, b)`."""
+
+                if string.startswith('myrgb(1, 0, 0)', start):
+                    return ([1.0, 0.0, 0.0], 1.0), start + 14
+                return super().match(string, start, fullmatch)
+
+        class Custom(Color):
+            pass
+
+        Custom.register(MyRGB)
+        self.assertIsNone(tokenizer.get_tokens(MyRGB))
+        self.assertIsNotNone(tokenizer.get_tokens(SRGB))
+        self.assertEqual(Custom('myrgb(1, 0, 0)').space(), 'myrgb')
+
+    def test_match_unknown_function(self):
+        """Test that an unknown function name still matches a leading identifier."""
+
+        obj = Color.match('red-ish(')
+        self.assertEqual(obj.color, Color('red'))
+        self.assertEqual(obj.end, 3)
+        self.assertEqual(Color.match('transparent-re(').end, 11)
+        self.assertIsNone(Color.match('red-ish(', fullmatch=True))
+
+    def test_lazy_pattern(self):
+        """Test that patterns are compiled on first use and then replace themselves."""
+
+        import re
+        from coloraide.spaces import LazyPattern
+        from coloraide.spaces.srgb import SRGB
+
+        class Custom(SRGB):
+            NAME = 'custom'
+            SERIALIZE = ('--custom',)
+            DEFAULT_MATCH = LazyPattern(r'(?i)custom')
+
+        class Sub(Custom):
+            NAME = 'sub'
+
+        self.assertIsInstance(Custom.__dict__['DEFAULT_MATCH'], LazyPattern)
+        pattern = Sub.DEFAULT_MATCH
+        self.assertIsInstance(pattern, type(re.compile('')))
+        self.assertIs(Custom.__dict__['DEFAULT_MATCH'], pattern)
+        self.assertIs(Custom.DEFAULT_MATCH, pattern)
+        self.assertIsNotNone(pattern.match('CUSTOM'))
+
+    def test_lazy_import(self):
+        """Test that importing does not compile color patterns or import process pools."""
+
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, coloraide\n"
+            "from coloraide.spaces import LazyPattern\n"
+            "from coloraide.spaces.srgb.css import SRGB\n"
+            "spaces = coloraide.Color.CS_MAP.values()\n"
+            "print(all(isinstance(s.__dict__.get('DEFAULT_MATCH', LazyPattern('')), LazyPattern) for s in spaces))\n"
+            "print(isinstance(SRGB.__dict__['MATCH'], LazyPattern))\n"
+            "print('concurrent.futures' in sys.modules)\n"
+        )
+        out = subprocess.run(
+            [sys.executable, '-c', code], stdout=subprocess.PIPE, universal_newlines=True, check=True
+        ).stdout
+        self.assertEqual(out.split(), ['True', 'True', 'False'])
+
+    def test_finditer(self):
+        """Test finding all colors in a buffer."""
+
+        text = 'a { color: red; background: #00ff00; border: 1px solid rgb(0 0 255 / 50%) } xcolor(srgb 1 1 0) re'
+        matches = list(Color.finditer(text))
+        self.assertEqual(
+            [text[m.start:m.end] for m in matches],
+            ['red', '#00ff00', 'rgb(0 0 255 / 50%)', 'color(srgb 1 1 0)']
+        )
+        self.assertColorEqual(matches[2].color, Color('rgb(0 0 255 / 50%)'))
+
+        # Same matches as matching at every position.
+        expected = []
+        start = 0
+        while start < len(text):
+            m = Color.match(text, start)
+            if m is None:
+                start += 1
+            else:
+                expected.append((m.start, m.end))
+                start = m.end
+        self.assertEqual([(m.start, m.end) for m in matches], expected)
+
+    def test_finditer_start(self):
+        """Test finding colors from an offset."""
+
+        self.assertEqual([m.start for m in Color.finditer('red blue', 1)], [4])
+
+    def test_finditer_filters(self):
+        """Test finding colors with filters."""
+
+        text = 'red lab(50% 0 0) hsl(0 50% 50%)'
+        self.assertEqual([m.color.space() for m in Color.finditer(text, filters=['lab', 'hsl'])], ['lab', 'hsl'])
+
+    def test_finditer_stream(self):
+        """Test that chunks do not split matches when finding colors in a stream."""
+
+        import io
+
+        text = 'red #abcdef color(display-p3 0.1 0.2 0.3) hsl(120 50% 50%) green ' * 50
+        expected = [(m.start, m.end, m.color) for m in Color.finditer(text)]
+        self.assertEqual(len(expected), 250)
+        for size in (1, 7, 100, 4096):
+            self.assertEqual(
+                [(m.start, m.end, m.color) for m in Color.finditer_stream(io.StringIO(text), chunk_size=size)],
+                expected
+            )
+
     def test_mix(self):
         """Test interpolation via mixing."""
 
@@ -1668,3 +2227,825 @@ class TestCustom(util.ColorAsserts, unittest.TestCase):
 
         with self.assertRaises(ValueError):
             Custom.deregister('fit:clip')
+
+    def test_convert_chain_cached(self):
+        """Test that conversion chains are cached per class."""
+
+        class Custom(Color):
+            pass
+
+        self.assertEqual(Custom._CONVERT_CHAINS, {})
+        Custom('red').convert('lab')
+        self.assertIn(('srgb', 'lab', 'bradford'), Custom._CONVERT_CHAINS)
+        self.assertIsNot(Custom._CONVERT_CHAINS, Color._CONVERT_CHAINS)
+        self.assertColorEqual(Custom('red').convert('lab'), Color('red').convert('lab'))
+
+    def test_convert_chain_cleared(self):
+        """Test that conversion chains are cleared when plugins change."""
+
+        class Custom(Color):
+            pass
+
+        Custom('red').convert('jzazbz')
+        self.assertIn(('srgb', 'jzazbz', 'bradford'), Custom._CONVERT_CHAINS)
+        self.assertIn(('srgb', 'jzazbz', 'bradford'), Custom._CONVERTERS)
+
+        Custom.deregister('space:jzazbz')
+        self.assertEqual(Custom._CONVERT_CHAINS, {})
+        self.assertEqual(Custom._CONVERTERS, {})
+        with self.assertRaises(ValueError):
+            Custom('red').convert('jzazbz')
+
+    def test_convert_cache(self):
+        """Test the conversion cache."""
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 2
+
+        self.assertEqual(tuple(Custom.convert_cache_info()), (0, 0, 2, 0))
+        c1 = Custom('red').convert('lab')
+        c2 = Custom('red').convert('lab')
+        self.assertColorEqual(c1, c2)
+        self.assertColorEqual(c1, Color('red').convert('lab'))
+        self.assertEqual(tuple(Custom.convert_cache_info()), (1, 1, 2, 1))
+
+        # Results are copies and can be modified without affecting the cache
+        c2.set('lightness', 0)
+        self.assertColorEqual(Custom('red').convert('lab'), c1)
+
+        # Undefined channels are the same as zero
+        Custom('hsl', [NaN, 0, 0.5]).convert('srgb')
+        Custom('hsl', [0, 0, 0.5]).convert('srgb')
+        self.assertEqual(tuple(Custom.convert_cache_info()), (3, 2, 2, 2))
+
+        # Least recently used is evicted
+        Custom('blue').convert('lab')
+        self.assertEqual(Custom.convert_cache_info().currsize, 2)
+        self.assertNotIn(('srgb', 'lab', 'bradford', (1.0, 0.0, 0.0)), Custom._CONVERT_CACHE)
+
+        Custom.convert_cache_clear()
+        self.assertEqual(tuple(Custom.convert_cache_info()), (0, 0, 2, 0))
+
+    def test_convert_cache_threads(self):
+        """Test that the conversion cache can be used by many threads at once."""
+
+        import threading
+        import time
+        from collections import OrderedDict
+
+        class YieldingDict(OrderedDict):
+            """Let other threads run between looking up an entry and reordering or evicting entries."""
+
+            def move_to_end(self, key, last=True):
+                """Move to end."""
+
+                time.sleep(0)
+                super().move_to_end(key, last)
+
+            def popitem(self, last=True):
+                """Pop item."""
+
+                time.sleep(0)
+                return super().popitem(last)
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 8
+
+        Custom._CONVERT_CACHE = YieldingDict()
+        errors = []
+
+        def worker(barrier, offset):
+            """Convert colors that keep evicting each other from the cache."""
+
+            barrier.wait()
+            for i in range(200):
+                try:
+                    Custom('srgb', [(i + offset) % 12 / 12, 0.5, 0.5]).convert('lab')
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+
+        barrier = threading.Barrier(8)
+        threads = [threading.Thread(target=worker, args=(barrier, i)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        info = Custom.convert_cache_info()
+        self.assertEqual(info.hits + info.misses, 1600)
+        self.assertEqual(info.currsize, 8)
+
+    def test_convert_cache_disabled(self):
+        """Test that the conversion cache is disabled by default and per class."""
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 10
+
+        Color('red').convert('lab')
+        self.assertEqual(tuple(Color.convert_cache_info()), (0, 0, 0, 0))
+        Custom('red').convert('lab')
+        self.assertEqual(Custom.convert_cache_info().currsize, 1)
+        self.assertEqual(len(Color._CONVERT_CACHE), 0)
+
+    def test_convert_cache_cleared(self):
+        """Test that the conversion cache is cleared when plugins change."""
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 10
+
+        Custom('red').convert('jzazbz')
+        self.assertEqual(Custom.convert_cache_info().currsize, 1)
+        Custom.deregister('space:jzazbz')
+        self.assertEqual(Custom.convert_cache_info().currsize, 0)
+
+    def test_parse_cache(self):
+        """Test the parse cache."""
+
+        class Custom(Color):
+            PARSE_CACHE_SIZE = 2
+
+        self.assertEqual(tuple(Custom.parse_cache_info()), (0, 0, 2, 0))
+        c1 = Custom('#ff0000')
+        c2 = Custom('#ff0000')
+        self.assertColorEqual(c1, c2)
+        self.assertColorEqual(c1, Color('#ff0000'))
+        self.assertEqual(tuple(Custom.parse_cache_info()), (1, 1, 2, 1))
+
+        # Each hit is a new color that can be modified without affecting the cache
+        self.assertIsNot(c1, c2)
+        c2.red = 0
+        self.assertColorEqual(Custom('#ff0000'), c1)
+
+        # Filters are part of the key and failures are remembered too
+        with self.assertRaises(ValueError):
+            Custom('#ff0000', filters=['lab'])
+        with self.assertRaises(ValueError):
+            Custom('#ff0000', filters=['lab'])
+        self.assertEqual(tuple(Custom.parse_cache_info()), (3, 2, 2, 2))
+
+        # Least recently used is evicted
+        Custom('rebeccapurple')
+        self.assertEqual(Custom.parse_cache_info().currsize, 2)
+        self.assertNotIn((None, '#ff0000'), Custom._PARSE_CACHE)
+
+        Custom.parse_cache_clear()
+        self.assertEqual(tuple(Custom.parse_cache_info()), (0, 0, 2, 0))
+
+    def test_parse_cache_threads(self):
+        """Test that the parse cache can be used by many threads at once."""
+
+        import threading
+        import time
+        from collections import OrderedDict
+
+        class YieldingDict(OrderedDict):
+            """Let other threads run between looking up an entry and reordering or evicting entries."""
+
+            def move_to_end(self, key, last=True):
+                """Move to end."""
+
+                time.sleep(0)
+                super().move_to_end(key, last)
+
+            def popitem(self, last=True):
+                """Pop item."""
+
+                time.sleep(0)
+                return super().popitem(last)
+
+        class Custom(Color):
+            PARSE_CACHE_SIZE = 8
+
+        Custom._PARSE_CACHE = YieldingDict()
+        errors = []
+
+        def worker(barrier, offset):
+            """Parse colors that keep evicting each other from the cache."""
+
+            barrier.wait()
+            for i in range(200):
+                string = '#{:06x}'.format((i + offset) % 12)
+                try:
+                    self.assertEqual(Custom(string).to_string(hex=True), string)
+                except Exception as e:  # pragma: no cover
+                    errors.append(e)
+
+        barrier = threading.Barrier(8)
+        threads = [threading.Thread(target=worker, args=(barrier, i)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        info = Custom.parse_cache_info()
+        self.assertEqual(info.hits + info.misses, 1600)
+        self.assertEqual(info.currsize, 8)
+
+    def test_parse_cache_disabled(self):
+        """Test that the parse cache is disabled by default and per class."""
+
+        class Custom(Color):
+            PARSE_CACHE_SIZE = 10
+
+        Color('red')
+        self.assertEqual(tuple(Color.parse_cache_info()), (0, 0, 0, 0))
+        Custom('red')
+        Custom('srgb', [1, 0, 0])
+        self.assertEqual(Custom.parse_cache_info().currsize, 1)
+        self.assertEqual(len(Color._PARSE_CACHE), 0)
+
+    def test_parse_cache_cleared(self):
+        """Test that the parse cache is cleared when plugins change."""
+
+        class Custom(Color):
+            PARSE_CACHE_SIZE = 10
+
+        Custom('color(--jzazbz 0.1 0 0)')
+        self.assertEqual(Custom.parse_cache_info().currsize, 1)
+        Custom.deregister('space:jzazbz')
+        self.assertEqual(Custom.parse_cache_info().currsize, 0)
+        with self.assertRaises(ValueError):
+            Custom('color(--jzazbz 0.1 0 0)')
+
+    def test_parse_many(self):
+        """Test parsing many color strings."""
+
+        strings = ['red', 'nope', '#00ff00', 'lab(50% 10 -20 / 0.5)', None, 'color(srgb 0 0 1)']
+        result = Color.parse_many(strings, workers=1)
+        self.assertEqual(result.invalid, [1, 4])
+        self.assertIsNone(result.colors[1])
+        self.assertIsNone(result.colors[4])
+        for i in (0, 2, 3, 5):
+            self.assertColorEqual(result.colors[i], Color(strings[i]))
+
+        result = Color.parse_many(strings, filters=['lab'], workers=1)
+        self.assertEqual(result.invalid, [0, 1, 2, 4, 5])
+
+    def test_parse_many_workers(self):
+        """Test parsing many color strings with worker processes."""
+
+        strings = ['red', 'nope', '#00ff00', 'hsl(120 50% 50%)', 'color(--okhsv 0.1 0.2 0.3)'] * 3
+        result = Color.parse_many(strings, workers=2, chunksize=4)
+        self.assertEqual(result.invalid, [1, 6, 11])
+        self.assertEqual(len(result.colors), len(strings))
+        for string, color in zip(strings, result.colors):
+            if color is not None:
+                self.assertColorEqual(color, Color(string))
+
+    def test_parse_many_custom(self):
+        """Test that parsing many color strings uses the class's plugins."""
+
+        class Custom(Color):
+            pass
+
+        Custom.deregister('space:hsl')
+        result = Custom.parse_many(['red', 'hsl(120 50% 50%)'], workers=1)
+        self.assertEqual(result.invalid, [1])
+        self.assertIsInstance(result.colors[0], Custom)
+
+    def test_parse_many_spawn(self):
+        """Test that spawned workers only parse the color spaces registered in the parent."""
+
+        import functools
+        import multiprocessing
+        from concurrent import futures
+        from unittest import mock
+        from coloraide.spaces.hsl.css import HSL
+        from coloraide.spaces.okhsv import Okhsv
+
+        class Named(Okhsv):
+            NAME = 'named-okhsv'
+            SERIALIZE = ('--named-okhsv',)
+
+        executor = functools.partial(futures.ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn'))
+        ParseColor.deregister('space:hsl')
+        ParseColor.register(Named)
+        try:
+            strings = ['red', 'hsl(120 50% 50%)', 'color(--named-okhsv 0.1 0.2 0.3)', '#00ff00']
+            with mock.patch.object(futures, 'ProcessPoolExecutor', executor):
+                result = ParseColor.parse_many(strings, workers=2, chunksize=2)
+        finally:
+            ParseColor.deregister('space:named-okhsv')
+            ParseColor.register(HSL)
+        self.assertEqual(result.invalid, [1, 2])
+        self.assertColorEqual(result.colors[0], Color('red'))
+        self.assertColorEqual(result.colors[3], Color('#00ff00'))
+
+    def test_parse_many_bad_args(self):
+        """Test parsing many color strings with bad arguments."""
+
+        with self.assertRaises(ValueError):
+            Color.parse_many(['red'], workers=0)
+        with self.assertRaises(ValueError):
+            Color.parse_many(['red'], chunksize=0)
+
+    def test_derived_cache(self):
+        """Test that a color converts to a given space once until it is changed."""
+
+        ref = Derived('orange')
+        samples = [Derived('lab', [50, i, -i]) for i in range(10)]
+        with coloraide.profile() as stats:
+            for sample in samples:
+                ref.delta_e(sample, method='2000')
+            ref.get('lab.lightness')
+        # Remembered conversions are still recorded as routes, but the stages only run once.
+        self.assertEqual(stats.routes['srgb -> lab'][0], 11)
+        self.assertEqual(stats.stages['lab.from_base'][0], 1)
+
+        # Results are copies and can be modified without affecting the cache
+        c1 = ref.convert('lab')
+        c1.lightness = 0
+        self.assertColorEqual(ref.convert('lab'), Color('orange').convert('lab'))
+
+    def test_derived_cache_default(self):
+        """Test that colors do not remember conversions by default."""
+
+        c1 = Color('orange')
+        c1.convert('lab')
+        self.assertIsNone(c1._derived)
+
+    def test_derived_cache_mutation(self):
+        """Test that any change to a color invalidates its converted coordinates."""
+
+        c1 = Derived('orange')
+        changes = [
+            lambda c: c.set('red', 0.5),
+            lambda c: setattr(c, 'green', 0.1),
+            lambda c: c.set('hsl.hue', 90),
+            lambda c: c.update('blue'),
+            lambda c: c.mutate('hsl', [30, 0.5, 0.5]),
+            lambda c: c.convert('srgb', in_place=True),
+            lambda c: c.set('blue', 2).fit(in_place=True),
+            lambda c: c.set('blue', 2).clip(in_place=True)
+        ]
+        for change in changes:
+            c1.convert('lab')
+            change(c1)
+            self.assertColorEqual(c1.convert('lab'), Color(c1.to_string(precision=-1)).convert('lab'))
+
+    def test_derived_cache_alpha(self):
+        """Test that a remembered conversion uses the current alpha."""
+
+        c1 = Derived('orange')
+        c1.convert('lab')
+        c1.alpha = 0.5
+        self.assertEqual(c1.convert('lab').alpha, 0.5)
+
+    def test_derived_cache_plugins(self):
+        """Test that converted coordinates are invalidated when plugins change."""
+
+        class Custom(Derived):
+            pass
+
+        c1 = Custom('red')
+        c1.convert('jzazbz')
+        Custom.deregister('space:jzazbz')
+        with self.assertRaises(ValueError):
+            c1.convert('jzazbz')
+
+    def test_derived_cache_size(self):
+        """Test the number of remembered conversions."""
+
+        class Custom(Color):
+            DERIVED_CACHE_SIZE = 2
+
+        c1 = Custom('red')
+        for space in ('lab', 'lch', 'oklab'):
+            c1.convert(space)
+        self.assertEqual(list(c1._derived), ['lch', 'oklab'])
+
+        class Disabled(Color):
+            DERIVED_CACHE_SIZE = 0
+
+        c2 = Disabled('red')
+        c2.convert('lab')
+        self.assertIsNone(c2._derived)
+
+    def test_convert_fused_linear(self):
+        """Test that adjacent linear conversion stages are combined into a single matrix."""
+
+        from coloraide import convert
+
+        class Custom(Color):
+            pass
+
+        c = Custom('display-p3', [0.3, 0.2, 0.1])
+        lab = c.convert('lab')
+        stages = convert.get_convert_chain(Custom, type(c._space), 'lab')
+        self.assertEqual([s[0] for s in stages], [convert.STAGE_FUNC, convert.STAGE_MATRIX, convert.STAGE_FUNC])
+
+        # Compare against the unfused path
+        xyz = Custom.chromatic_adaptation(c, 'D65', 'D50', type(c._space).to_base(c.coords()))
+        expected = Custom.CS_MAP['lab'].from_base(xyz)
+        for a, b in zip(lab.coords(), expected):
+            self.assertCompare(a, b, 12)
+
+    def test_convert_adaptation_changed(self):
+        """Test that changing the chromatic adaptation method is honored after conversions are cached."""
+
+        class Custom(Color):
+            CONVERT_CACHE_SIZE = 10
+
+        c = Custom('red')
+        self.assertColorEqual(c.convert('lab'), Color('red').convert('lab'))
+        Custom.CHROMATIC_ADAPTATION = 'cat02'
+        self.assertColorEqual(c.convert('lab'), Color('lab', [54.215, 80.962, 70.264]))
+        self.assertColorEqual(Custom('red').convert('lab'), Color('lab', [54.215, 80.962, 70.264]))
+
+    def test_convert_adaptation_override(self):
+        """Test that an overridden chromatic adaptation is used when converting."""
+
+        from coloraide import cat
+
+        calls = []
+
+        class Custom(Color):
+            def chromatic_adaptation(self, w1, w2, xyz):
+                """Chromatic adaptation."""
+
+                calls.append((w1, w2))
+                return cat.chromatic_adaptation(w1, w2, xyz, method='cat02')
+
+        lab = Custom('red').convert('lab')
+        self.assertColorEqual(lab, Color('lab', [54.215, 80.962, 70.264]))
+        self.assertIn(('D65', 'D50'), calls)
+        self.assertColorEqual(lab.convert('srgb'), Color('red'))
+        self.assertIn(('D50', 'D65'), calls)
+
+    def test_convert_adaptation_instance(self):
+        """Test that an overridden chromatic adaptation can use the state of the color being converted."""
+
+        from coloraide import cat
+
+        class Custom(Color):
+            def chromatic_adaptation(self, w1, w2, xyz):
+                """Use CAT02 for sRGB colors."""
+
+                method = 'cat02' if self.space() == 'srgb' else 'bradford'
+                return cat.chromatic_adaptation(w1, w2, xyz, method=method)
+
+        cat02 = Color('lab', [54.215, 80.962, 70.264])
+        self.assertColorEqual(Custom('red').convert('lab'), cat02)
+        p3 = Color('red').convert('display-p3')
+        self.assertColorEqual(Custom(p3).convert('lab'), p3.convert('lab'))
+        self.assertColorEqual(Color('lab', Custom.converter('srgb', 'lab')([1, 0, 0])), cat02)
+        self.assertColorEqual(Color('lab', Custom.convert_many('srgb', 'lab', [[1, 0, 0]])[0]), cat02)
+        with coloraide.profile() as stats:
+            Custom('red').convert('lab')
+        self.assertEqual(stats.routes['srgb -> lab'][0], 1)
+
+    def test_convert_linear_not_inherited(self):
+        """Test that a space overriding `to_base` does not inherit a linear declaration."""
+
+        from coloraide import convert
+        from coloraide.spaces.srgb_linear import SRGBLinear
+
+        class Scaled(SRGBLinear):
+            NAME = 'scaled-srgb-linear'
+
+            @classmethod
+            def to_base(cls, coords):
+                """To base."""
+
+                return super().to_base([c / 2 for c in coords])
+
+            @classmethod
+            def from_base(cls, coords):
+                """From base."""
+
+                return [c * 2 for c in super().from_base(coords)]
+
+        class Custom(Color):
+            pass
+
+        Custom.register(Scaled)
+        c = Custom('scaled-srgb-linear', [0.5, 0.5, 0.5])
+        self.assertEqual(
+            [s[0] for s in convert.get_convert_chain(Custom, Scaled, 'srgb-linear')],
+            [convert.STAGE_FUNC, convert.STAGE_MATRIX]
+        )
+        for a, b in zip(c.convert('srgb-linear').coords(), [0.25, 0.25, 0.25]):
+            self.assertCompare(a, b, 12)
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestNumPy(util.ColorAsserts, unittest.TestCase):
+    """Test the NumPy conversion path."""
+
+    COLORS = [
+        [1, 0, 0], [0, 0.5, 0], [0, 0, 1], [1, 1, 1], [0, 0, 0], [0.5, 0.5, 0.5],
+        [0.2, 0.4, 0.6], [0.9, 0.1, 0.5], [1.2, -0.1, 0.3]
+    ]
+
+    def test_all_spaces(self):
+        """Test that every space pair matches the pure Python path."""
+
+        for space in Color.CS_MAP:
+            coords = Color.convert_many('srgb', space, self.COLORS)
+            for rgb, c in zip(self.COLORS, coords):
+                color = Color('srgb', rgb).convert(space)
+                self.assertColorEqual(Color(space, c), color)
+                self.assertColorEqual(
+                    Color('srgb', Color.convert_many(space, 'srgb', [color.coords()])[0]),
+                    color.convert('srgb')
+                )
+
+    def test_array_chain_used(self):
+        """Test that built-in spaces are vectorized."""
+
+        from coloraide import convert
+
+        class Custom(Color):
+            pass
+
+        Custom.convert_many('hwb', 'okhsv', self.COLORS)
+        self.assertIsNotNone(convert.get_convert_array_chain(Custom, Custom.CS_MAP['hwb'], 'okhsv'))
+        Custom.deregister('space:okhsv')
+        self.assertEqual(Custom._CONVERT_ARRAY_CHAINS, {})
+
+    def test_ndarray(self):
+        """Test that NumPy arrays are returned as NumPy arrays."""
+
+        results = Color.convert_many('srgb', 'lab', np.array(self.COLORS))
+        self.assertIsInstance(results, np.ndarray)
+        self.assertEqual(results.shape, (len(self.COLORS), 3))
+        results = Color.convert_many('srgb', 'srgb', np.array(self.COLORS))
+        self.assertIsInstance(results, np.ndarray)
+
+    def test_float32(self):
+        """Test that single precision arrays are converted in single precision."""
+
+        values = np.array(self.COLORS, dtype=np.float32)
+        for space in Color.CS_MAP:
+            results = Color.convert_many('srgb', space, values)
+            self.assertEqual(results.dtype, np.float32)
+            results = Color.convert_many(space, 'srgb', results)
+            self.assertEqual(results.dtype, np.float32)
+            # Saturation is too sensitive near the sRGB gamut boundary, see `tests/test_roundtrip.py`.
+            if space in ('okhsl', 'okhsv'):
+                continue
+            expected = Color.convert_many(space, 'srgb', Color.convert_many('srgb', space, self.COLORS))
+            self.assertTrue(np.allclose(results, expected, atol=1e-5), space)
+        self.assertEqual(Color.convert_many('srgb', 'srgb', values).dtype, np.float32)
+        self.assertEqual(Color.convert_many('srgb', 'lab', np.array(self.COLORS, dtype=np.int64)).dtype, np.float64)
+
+    def test_list(self):
+        """Test that lists are returned as lists."""
+
+        results = Color.convert_many('srgb', 'lab', (c for c in self.COLORS))
+        self.assertIsInstance(results, list)
+        self.assertIsInstance(results[0], list)
+
+    def test_empty(self):
+        """Test empty input."""
+
+        self.assertEqual(Color.convert_many('srgb', 'lab', []), [])
+        self.assertEqual(Color.convert_many('srgb', 'lab', np.zeros((0, 3))).shape, (0, 3))
+
+    def test_nan(self):
+        """Test that undefined channels are treated as zero."""
+
+        result = Color.convert_many('hsl', 'srgb', np.array([[NaN, 0, 0.5]]))
+        self.assertColorEqual(Color('srgb', result[0].tolist()), Color('hsl', [NaN, 0, 0.5]).convert('srgb'))
+
+    def test_no_array_form(self):
+        """Test that spaces without an array form fall back to the pure Python path."""
+
+        from coloraide import convert
+        from coloraide.spaces.hsl import HSL
+
+        class Custom(HSL):
+            NAME = 'custom-hsl'
+
+            @classmethod
+            def to_base(cls, coords):
+                """To base."""
+
+                return super().to_base(coords)
+
+        class Custom2(Color):
+            pass
+
+        Custom2.register(Custom)
+        self.assertIsNone(convert.get_convert_array_chain(Custom2, Custom, 'lab'))
+        results = Custom2.convert_many('custom-hsl', 'lab', np.array([[120, 0.5, 0.5]]))
+        self.assertIsInstance(results, np.ndarray)
+        self.assertColorEqual(Custom2('lab', results[0].tolist()), Custom2('hsl', [120, 0.5, 0.5]).convert('lab'))
+
+
+class TestLUT(util.ColorAsserts, unittest.TestCase):
+    """Test lookup tables."""
+
+    def test_grid_points(self):
+        """Test that colors on the grid are exact."""
+
+        lut = Color.lut('srgb', 'okhsv', 5)
+        for coords in ([1, 0, 0], [0.25, 0.5, 0.75], [0, 1, 0.5]):
+            self.assertColorEqual(Color('okhsv', lut(coords)), Color('srgb', coords).convert('okhsv'))
+
+    def test_interpolation(self):
+        """Test that interpolated colors are close to the exact conversion."""
+
+        for method in ('trilinear', 'tetrahedral'):
+            lut = Color.lut('srgb', 'ictcp', 17, method)
+            self.assertEqual(lut.method, method)
+            expected = Color('srgb', [0.3, 0.6, 0.45]).convert('ictcp').coords()
+            for a, b in zip(lut([0.3, 0.6, 0.45]), expected):
+                self.assertAlmostEqual(a, b, delta=0.001)
+
+    def test_hue(self):
+        """Test that hues interpolate across zero and achromatic colors have no hue."""
+
+        lut = Color.lut('srgb', 'oklch', 9)
+        self.assertTrue(math.isnan(lut([0.5, 0.5, 0.5])[2]))
+        color = Color('srgb', [0.9, 0.2, 0.45])
+        for a, b, delta in zip(lut(color.coords()), color.convert('oklch').coords(), (0.005, 0.005, 0.1)):
+            self.assertAlmostEqual(a, b, delta=delta)
+
+    def test_hue_source(self):
+        """Test a cylindrical source space."""
+
+        lut = Color.lut('hsl', 'srgb', 9)
+        self.assertColorEqual(Color('srgb', lut([400, 1, 0.5])), Color('hsl', [40, 1, 0.5]).convert('srgb'))
+        self.assertColorEqual(Color('srgb', lut([NaN, 0, 0.5])), Color('hsl', [NaN, 0, 0.5]).convert('srgb'))
+
+    def test_out_of_bounds(self):
+        """Test that colors outside the source bounds are converted exactly."""
+
+        lut = Color.lut('srgb', 'okhsl', 3)
+        self.assertEqual(lut([1.2, -0.1, 0.5]), Color('srgb', [1.2, -0.1, 0.5]).convert('okhsl').coords())
+
+    def test_max_error(self):
+        """Test reporting of the max error."""
+
+        errors = Color.lut('srgb', 'lab', 9).max_error()
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(0 < e < 5 for e in errors))
+        self.assertLess(max(Color.lut('srgb', 'srgb-linear', 9).max_error()), 0.01)
+
+    def test_error_bound(self):
+        """Test that Okhsl and Okhsv conversions stay within the documented error in Oklab."""
+
+        import random
+
+        rand = random.Random(0)
+        points = [[rand.random() for _ in range(3)] for _ in range(500)]
+        for space in ('okhsl', 'okhsv'):
+            for method in ('tetrahedral', 'trilinear'):
+                lut = Color.lut('srgb', space, method=method)
+                for point in points:
+                    color = Color(space, lut(point))
+                    self.assertLess(color.delta_e(Color('srgb', point), method='ok'), 0.04)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_convert_many(self):
+        """Test that converting many coordinates matches calling the table."""
+
+        points = [[1, 0, 0], [0.25, 0.5, 0.75], [0.5, 0.5, 0.5], [0.9, 0.2, 0.45], [1.2, -0.1, 0.5], [0, 0, 0]]
+        for space in ('okhsl', 'oklch', 'ictcp'):
+            for method in ('tetrahedral', 'trilinear'):
+                lut = Color.lut('srgb', space, 9, method)
+                results = lut.convert_many(points)
+                self.assertIsInstance(results, list)
+                for point, coords in zip(points, results):
+                    self.assertColorEqual(Color(space, coords), Color(space, lut(point)))
+
+        lut = Color.lut('hsl', 'srgb', 9)
+        results = lut.convert_many(np.array([[400, 1, 0.5], [NaN, 0, 0.5]]))
+        self.assertIsInstance(results, np.ndarray)
+        self.assertColorEqual(Color('srgb', results[0].tolist()), Color('hsl', [40, 1, 0.5]).convert('srgb'))
+        self.assertColorEqual(Color('srgb', results[1].tolist()), Color('hsl', [NaN, 0, 0.5]).convert('srgb'))
+
+    def test_bad_input(self):
+        """Test bad lookup table inputs."""
+
+        with self.assertRaises(ValueError):
+            Color.lut('srgb', 'lab', method='bad')
+
+        with self.assertRaises(ValueError):
+            Color.lut('srgb', 'lab', 1)
+
+        with self.assertRaises(ValueError):
+            Color.lut('bad', 'lab')
+
+        with self.assertRaises(ValueError):
+            Color.lut('srgb', 'bad')
+
+
+class TestProfile(util.ColorAsserts, unittest.TestCase):
+    """Test conversion profiling."""
+
+    def test_profile(self):
+        """Test that calls, routes, and stages are recorded."""
+
+        with coloraide.profile() as stats:
+            Color('red').convert('lch')
+            Color('red').convert('lch')
+
+        self.assertEqual(stats.calls['Color.convert'][0], 2)
+        self.assertEqual(stats.routes['srgb -> lch'][0], 2)
+        self.assertEqual(stats.stages['srgb.to_base'][0], 2)
+        self.assertEqual(stats.stages['lch.from_base'][0], 2)
+        self.assertTrue(all(count == 2 for count, _ in stats.stages.values()))
+        self.assertTrue(all(total >= 0 for _, total in stats.routes.values()))
+
+    def test_results(self):
+        """Test that profiled conversions match unprofiled conversions."""
+
+        with coloraide.profile():
+            color = Color('rebeccapurple').convert('okhsl')
+        self.assertColorEqual(color, Color('rebeccapurple').convert('okhsl'))
+
+    def test_inactive(self):
+        """Test that nothing is recorded outside of the context."""
+
+        with coloraide.profile() as stats:
+            pass
+        Color('red').convert('lab')
+        self.assertEqual(stats.calls, {})
+        self.assertEqual(stats.routes, {})
+        self.assertEqual(stats.stages, {})
+
+    def test_nested(self):
+        """Test that only the innermost context records."""
+
+        with coloraide.profile() as outer:
+            with coloraide.profile() as inner:
+                Color('red').convert('lab')
+            Color('red').convert('hsl')
+
+        self.assertIn('srgb -> lab', inner.routes)
+        self.assertNotIn('srgb -> hsl', inner.routes)
+        self.assertIn('srgb -> hsl', outer.routes)
+        self.assertNotIn('srgb -> lab', outer.routes)
+
+    def test_composed_stages(self):
+        """Test that profiled stages run the same unrolled implementation as unprofiled conversions."""
+
+        from unittest import mock
+        from coloraide import util as cutil
+
+        class Custom(Color):
+            pass
+
+        expected = Custom('display-p3', [0.3, 0.2, 0.1]).convert('lab')
+        with mock.patch.object(cutil, 'dot', side_effect=AssertionError('generic dot product used')):
+            with coloraide.profile() as stats:
+                color = Custom('display-p3', [0.3, 0.2, 0.1]).convert('lab')
+        self.assertColorEqual(color, expected)
+        self.assertEqual(len(stats.stages), 3)
+
+    def test_threads(self):
+        """Test that contexts only record conversions made by their own thread."""
+
+        import threading
+
+        results = {}
+
+        def worker():
+            """Convert in another thread, within and outside of its own context."""
+
+            Color('red').convert('hsl')
+            with coloraide.profile() as stats:
+                Color('red').convert('hwb')
+            results['worker'] = stats
+
+        with coloraide.profile() as stats:
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            Color('red').convert('lab')
+
+        self.assertEqual(list(stats.routes), ['srgb -> lab'])
+        self.assertEqual(list(results['worker'].routes), ['srgb -> hwb'])
+
+    def test_cached(self):
+        """Test that stages are only recorded for cache misses."""
+
+        class Color2(Color):
+            CONVERT_CACHE_SIZE = 8
+
+        with coloraide.profile() as stats:
+            Color2('red').convert('lab')
+            Color2('red').convert('lab')
+
+        self.assertEqual(stats.routes['srgb -> lab'][0], 2)
+        self.assertEqual(stats.stages['srgb.to_base'][0], 1)
+
+    def test_report(self):
+        """Test the report."""
+
+        with coloraide.profile() as stats:
+            Color('red').convert('lab')
+
+        report = str(stats)
+        self.assertIn('Routes', report)
+        self.assertIn('srgb -> lab', report)
+        self.assertIn('srgb.to_base', report)
+
+    def test_bad_space(self):
+        """Test that a bad space still raises."""
+
+        with coloraide.profile():
+            with self.assertRaises(ValueError):
+                Color('red').convert('bad')
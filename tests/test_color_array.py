@@ -0,0 +1,387 @@
+"""Test color arrays."""
+import os
+import tempfile
+import unittest
+from coloraide import Color, ColorArray, NaN
+from . import util
+
+COLORS = [
+    Color('red'),
+    Color('color(srgb 0.2 0.4 0.6 / 0.5)'),
+    Color('white'),
+    Color('color(srgb 1.2 -0.1 0.5)'),
+    Color('hsl(120 50% 30%)').convert('srgb')
+]
+
+
+class TestColorArray(util.ColorAsserts, unittest.TestCase):
+    """Test color arrays."""
+
+    def assertColorsEqual(self, array, colors):
+        """Compare the colors of an array with a list of colors."""
+
+        self.assertEqual(len(array), len(colors))
+        for c1, c2 in zip(array, colors):
+            self.assertEqual(c1.space(), c2.space())
+            self.assertColorEqual(c1, c2)
+
+    def test_create(self):
+        """Test creating an array from coordinates."""
+
+        colors = ColorArray('sRGB', [[1, 0, 0], [0, 0.5, 1]], [1, 0.5])
+        self.assertEqual(colors.space(), 'srgb')
+        self.assertColorsEqual(colors, [Color('red'), Color('srgb', [0, 0.5, 1], 0.5)])
+        self.assertEqual(len(ColorArray('srgb')), 0)
+
+    def test_default_alpha(self):
+        """Test that alpha defaults to opaque and is clamped."""
+
+        self.assertEqual(list(ColorArray('srgb', [[1, 0, 0]]).get('alpha')), [1.0])
+        self.assertEqual(list(ColorArray('srgb', [[1, 0, 0]], [2]).get('alpha')), [1.0])
+
+    def test_create_bad(self):
+        """Test bad inputs."""
+
+        with self.assertRaises(ValueError):
+            ColorArray('bad', [[1, 0, 0]])
+        with self.assertRaises(ValueError):
+            ColorArray('srgb', [[1, 0]])
+        with self.assertRaises(ValueError):
+            ColorArray('srgb', [[1, 0, 0]], [1, 1])
+        with self.assertRaises(TypeError):
+            ColorArray('srgb', [['red', 0, 0]])
+
+    def test_from_colors(self):
+        """Test creating an array from colors."""
+
+        colors = ColorArray.from_colors(['red', Color('blue').convert('lch')])
+        self.assertEqual(colors.space(), 'srgb')
+        self.assertColorsEqual(colors, [Color('red'), Color('blue')])
+        self.assertEqual(ColorArray.from_colors(['red'], 'lab').space(), 'lab')
+        self.assertEqual(len(ColorArray.from_colors([], 'lab')), 0)
+
+    def test_custom_class(self):
+        """Test arrays of a custom color class."""
+
+        class Custom(Color):
+            pass
+
+        colors = ColorArray('srgb', [[1, 0, 0]], color_cls=Custom)
+        self.assertIsInstance(colors[0], Custom)
+        self.assertIsInstance(colors.convert('lab')[0], Custom)
+
+    def test_index(self):
+        """Test indexing and slicing."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertColorEqual(colors[1], COLORS[1])
+        self.assertColorEqual(colors[-1], COLORS[-1])
+        self.assertColorsEqual(colors[1:4], COLORS[1:4])
+        self.assertColorsEqual(colors[::-1], COLORS[::-1])
+
+    def test_index_independent(self):
+        """Test that colors from an array do not modify the array."""
+
+        colors = ColorArray.from_colors(COLORS)
+        colors[0].set('red', 0)
+        self.assertColorEqual(colors[0], COLORS[0])
+
+    def test_set_item(self):
+        """Test setting a color."""
+
+        colors = ColorArray.from_colors(COLORS)
+        colors[0] = Color('blue').convert('lch')
+        colors[1] = 'green'
+        self.assertColorsEqual(colors[:2], [Color('blue'), Color('green')])
+
+    def test_get_set(self):
+        """Test getting and setting channels."""
+
+        colors = ColorArray('srgb', [[1, 0, 0], [0, 0.5, 1]])
+        self.assertEqual(list(colors.get('green')), [0, 0.5])
+        colors.set('g', [0.25, 0.75]).set('alpha', 0.5)
+        self.assertEqual(list(colors.get('g')), [0.25, 0.75])
+        self.assertEqual(list(colors.get('alpha')), [0.5, 0.5])
+
+    def test_get_set_bad(self):
+        """Test getting and setting bad channels."""
+
+        colors = ColorArray('srgb', [[1, 0, 0], [0, 0.5, 1]])
+        with self.assertRaises(AttributeError):
+            colors.get('bad')
+        with self.assertRaises(AttributeError):
+            colors.set('bad', 0)
+        with self.assertRaises(ValueError):
+            colors.set('red', [0])
+
+    def test_convert(self):
+        """Test conversion."""
+
+        colors = ColorArray.from_colors(COLORS)
+        for space in ('lab', 'hsl', 'okhsl', 'display-p3'):
+            self.assertColorsEqual(colors.convert(space), [c.convert(space) for c in COLORS])
+
+    def test_convert_fit(self):
+        """Test conversion with gamut mapping."""
+
+        colors = ColorArray.from_colors(COLORS, 'display-p3')
+        self.assertColorsEqual(
+            colors.convert('srgb', fit=True),
+            [c.convert('display-p3').convert('srgb', fit=True) for c in COLORS]
+        )
+        self.assertColorsEqual(
+            colors.convert('srgb', fit='clip'),
+            [c.convert('display-p3').convert('srgb', fit='clip') for c in COLORS]
+        )
+
+    def test_convert_in_place(self):
+        """Test conversion in place."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertIs(colors.convert('lab', in_place=True), colors)
+        self.assertEqual(colors.space(), 'lab')
+
+    def test_convert_bad(self):
+        """Test conversion to a bad space."""
+
+        with self.assertRaises(ValueError):
+            ColorArray.from_colors(COLORS).convert('bad')
+
+    def test_undefined(self):
+        """Test that undefined channels are handled like colors."""
+
+        colors = ColorArray('hsl', [[NaN, 0, 0.5]])
+        self.assertColorEqual(colors.convert('srgb')[0], Color('hsl', [NaN, 0, 0.5]).convert('srgb'))
+
+    def test_in_gamut(self):
+        """Test gamut checks."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertEqual(colors.in_gamut(), [c.in_gamut() for c in COLORS])
+        self.assertEqual(colors.in_gamut('hsl'), [c.in_gamut('hsl') for c in COLORS])
+        hsl = colors.convert('hsl')
+        self.assertEqual(hsl.in_gamut(tolerance=0), [c.convert('hsl').in_gamut(tolerance=0) for c in COLORS])
+
+    def test_clip(self):
+        """Test clipping."""
+
+        colors = ColorArray.from_colors(COLORS, 'lch')
+        lch = [c.convert('lch') for c in COLORS]
+        self.assertColorsEqual(colors.clip('srgb'), [c.clip('srgb') for c in lch])
+        self.assertColorsEqual(colors.clip(), [c.clip() for c in lch])
+
+    def test_fit(self):
+        """Test gamut mapping."""
+
+        colors = ColorArray.from_colors(COLORS, 'lch')
+        lch = [c.convert('lch') for c in COLORS]
+        self.assertColorsEqual(colors.fit('srgb'), [c.fit('srgb') for c in lch])
+        self.assertColorsEqual(
+            colors.fit('srgb', method='lch-chroma'),
+            [c.fit('srgb', method='lch-chroma') for c in lch]
+        )
+        self.assertColorsEqual(colors.fit('srgb', method='clip'), [c.fit('srgb', method='clip') for c in lch])
+        self.assertIs(colors.fit('srgb', in_place=True), colors)
+        self.assertColorsEqual(colors, [c.fit('srgb') for c in lch])
+
+    def test_fit_bad(self):
+        """Test a bad gamut mapping method."""
+
+        with self.assertRaises(ValueError):
+            ColorArray.from_colors(COLORS).fit(method='bad')
+
+    def test_delta_e(self):
+        """Test color distance."""
+
+        colors = ColorArray.from_colors(COLORS)
+        for method in ('76', '2000', 'itp'):
+            expected = [c.delta_e('blue', method=method) for c in COLORS]
+            for d1, d2 in zip(colors.delta_e('blue', method=method), expected):
+                self.assertCompare(d1, d2)
+
+        reverse = colors[::-1]
+        for d1, d2 in zip(colors.delta_e(reverse), [c1.delta_e(c2) for c1, c2 in zip(COLORS, COLORS[::-1])]):
+            self.assertCompare(d1, d2)
+
+    def test_delta_e_bad(self):
+        """Test bad color distance inputs."""
+
+        colors = ColorArray.from_colors(COLORS)
+        with self.assertRaises(ValueError):
+            colors.delta_e('blue', method='bad')
+        with self.assertRaises(ValueError):
+            colors.delta_e(colors[1:])
+
+    def test_mix(self):
+        """Test mixing."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertColorsEqual(colors.mix('blue'), [c.mix('blue') for c in COLORS])
+        self.assertColorsEqual(
+            colors.mix('blue', 0.25, space='lch', hue='longer'),
+            [c.mix('blue', 0.25, space='lch', hue='longer') for c in COLORS]
+        )
+        self.assertColorsEqual(
+            colors.mix('color(srgb 0 0 1 / 0.25)', space='oklch', premultiplied=True),
+            [c.mix('color(srgb 0 0 1 / 0.25)', space='oklch', premultiplied=True) for c in COLORS]
+        )
+        self.assertColorsEqual(
+            colors.mix(colors[::-1], 0.75, out_space='lab'),
+            [c1.mix(c2, 0.75, out_space='lab') for c1, c2 in zip(COLORS, COLORS[::-1])]
+        )
+
+    def test_mix_in_place(self):
+        """Test mixing in place."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertIs(colors.mix('blue', in_place=True), colors)
+        self.assertColorsEqual(colors, [c.mix('blue') for c in COLORS])
+
+    def test_to_string(self):
+        """Test string output."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertEqual(colors.to_string(), [c.to_string() for c in COLORS])
+        self.assertEqual(colors.to_string(hex=True), [c.to_string(hex=True) for c in COLORS])
+
+    def test_float32(self):
+        """Test storing and converting colors in single precision."""
+
+        colors = ColorArray.from_colors(COLORS, dtype='float32')
+        self.assertEqual(colors.dtype(), 'float32')
+        self.assertEqual(colors.get('red').itemsize, 4)
+        for result in (
+            colors.convert('lab'), colors.convert('display-p3', fit=True), colors.clip(), colors.fit(),
+            colors.mix('blue'), colors[1:3]
+        ):
+            self.assertEqual(result.dtype(), 'float32')
+        for c1, c2 in zip(colors.convert('lab'), COLORS):
+            self.assertColorEqual(c1, c2.convert('lab'), precision=4)
+        self.assertEqual(ColorArray('srgb', dtype='float32').dtype(), 'float32')
+        self.assertEqual(ColorArray.from_colors([], dtype='float32').dtype(), 'float32')
+
+    def test_astype(self):
+        """Test changing the precision of an array."""
+
+        colors = ColorArray.from_colors(COLORS)
+        self.assertEqual(colors.dtype(), 'float64')
+        single = colors.astype('float32')
+        self.assertEqual(single.dtype(), 'float32')
+        self.assertEqual(colors.dtype(), 'float64')
+        double = single.astype('float64')
+        self.assertEqual(double.dtype(), 'float64')
+        for c1, c2 in zip(double, COLORS):
+            self.assertColorEqual(c1, c2, precision=6)
+
+    def test_bad_dtype(self):
+        """Test an unsupported dtype."""
+
+        with self.assertRaises(ValueError):
+            ColorArray('srgb', [[1, 0, 0]], dtype='float16')
+        with self.assertRaises(ValueError):
+            ColorArray.from_colors(COLORS).astype('int8')
+
+
+class TestColorArrayFile(util.ColorAsserts, unittest.TestCase):
+    """Test saving and loading color arrays."""
+
+    def setUp(self):
+        """Setup."""
+
+        fd, self.path = tempfile.mkstemp(suffix='.colors')
+        os.close(fd)
+
+    def tearDown(self):
+        """Tear down."""
+
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        """Test saving and loading."""
+
+        colors = ColorArray.from_colors(COLORS, 'lch')
+        colors.save(self.path)
+        for memory_map in (True, False):
+            loaded = ColorArray.load(self.path, memory_map=memory_map)
+            self.assertEqual(loaded.space(), 'lch')
+            self.assertEqual(loaded.to_string(precision=17), colors.to_string(precision=17))
+
+    def test_float32(self):
+        """Test saving as single precision floats."""
+
+        colors = ColorArray.from_colors(COLORS, 'lch')
+        colors.save(self.path)
+        size = os.path.getsize(self.path)
+        colors.save(self.path, 'float32')
+        self.assertEqual(size - os.path.getsize(self.path), 4 * 4 * len(COLORS))
+        for memory_map in (True, False):
+            loaded = ColorArray.load(self.path, memory_map=memory_map)
+            self.assertEqual(loaded.dtype(), 'float32')
+            for c1, c2 in zip(loaded, colors):
+                self.assertColorEqual(c1, c2, precision=4)
+
+        # Arrays are saved in their own precision by default.
+        colors.astype('float32').save(self.path)
+        self.assertEqual(size - os.path.getsize(self.path), 4 * 4 * len(COLORS))
+        loaded = ColorArray.load(self.path)
+        loaded[0] = 'blue'
+        self.assertEqual(loaded.dtype(), 'float32')
+
+    def test_empty(self):
+        """Test saving an empty array."""
+
+        ColorArray('lab').save(self.path)
+        loaded = ColorArray.load(self.path)
+        self.assertEqual(loaded.space(), 'lab')
+        self.assertEqual(len(loaded), 0)
+
+    def test_memory_mapped_operations(self):
+        """Test operations on memory mapped colors."""
+
+        colors = ColorArray.from_colors(COLORS)
+        colors.save(self.path)
+        loaded = ColorArray.load(self.path)
+        self.assertEqual(loaded.convert('lab').to_string(), colors.convert('lab').to_string())
+        self.assertEqual(loaded.clip().to_string(), colors.clip().to_string())
+        self.assertEqual(loaded[1:3].to_string(), colors[1:3].to_string())
+        self.assertEqual(list(loaded.get('red')), list(colors.get('red')))
+
+        # Writes copy the colors and do not modify the file.
+        loaded[0] = 'blue'
+        loaded.clip(in_place=True)
+        self.assertColorEqual(loaded[0], Color('blue'))
+        self.assertColorEqual(ColorArray.load(self.path)[0], COLORS[0])
+
+    def test_bad_dtype(self):
+        """Test saving with a bad dtype."""
+
+        with self.assertRaises(ValueError):
+            ColorArray.from_colors(COLORS).save(self.path, 'int8')
+
+    def test_bad_file(self):
+        """Test loading a file that is not a color array."""
+
+        with open(self.path, 'wb') as f:
+            f.write(b'not colors')
+        with self.assertRaises(ValueError):
+            ColorArray.load(self.path)
+
+    def test_truncated(self):
+        """Test loading a truncated file."""
+
+        ColorArray.from_colors(COLORS).save(self.path)
+        with open(self.path, 'rb+') as f:
+            f.truncate(100)
+        with self.assertRaises(ValueError):
+            ColorArray.load(self.path)
+
+    def test_unknown_space(self):
+        """Test loading colors of an unregistered color space."""
+
+        class Custom(Color):
+            pass
+
+        Custom.deregister('space:lch')
+        ColorArray.from_colors(COLORS, 'lch').save(self.path)
+        with self.assertRaises(ValueError):
+            ColorArray.load(self.path, color_cls=Custom)
@@ -1,8 +1,18 @@
 """Sanity check that ensures all colors round trip back."""
-from coloraide import Color
+import itertools
+from coloraide import Color, ColorArray
+from coloraide.spaces import Cylindrical
 import pytest
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 SPACES = Color.CS_MAP.keys()
+# Spaces whose `float32` results are not stable near the sRGB gamut boundary, see `TestFloat32RoundTrip`.
+FLOAT32_UNSTABLE = ('okhsl', 'okhsv')
+FLOAT32_SPACES = [space for space in SPACES if space not in FLOAT32_UNSTABLE]
 
 
 class TestRoundTrip:
@@ -56,3 +66,74 @@ class TestRoundTrip:
 
         for c in self.COLORS:
             self.assert_round_trip(c, space)
+
+
+@pytest.mark.skipif(np is None, reason="NumPy is not installed")
+class TestFloat32RoundTrip:
+    """
+    Test `float32` color arrays against the `float64` path.
+
+    8 bit and 10 bit code values of the RGB spaces must land on the same code values after a
+    round trip through every color space as they do in `float64`. Conversions must also stay
+    within the documented bounds, relative to each channel's range. Hues are only compared
+    when the color has some chroma.
+
+    Okhsl and Okhsv saturation is very sensitive to its input near the sRGB gamut boundary
+    of blue hues, so colors there can differ by a code value or more and are not tested.
+    """
+
+    RGB = ('srgb', 'display-p3', 'rec2020')
+    BOUND = 1e-6
+    HUE_BOUND = 5e-6
+
+    @staticmethod
+    def code_values(bits, step):
+        """Get a grid of RGB code values as normalized coordinates."""
+
+        top = 2 ** bits - 1
+        values = list(range(0, top + 1, step))
+        if values[-1] != top:
+            values.append(top)
+        return [[r / top, g / top, b / top] for r, g, b in itertools.product(values, repeat=3)]
+
+    @staticmethod
+    def columns(colors):
+        """Get the channels of a color array as a NumPy array."""
+
+        names = Color.CS_MAP[colors.space()].CHANNEL_NAMES
+        return np.column_stack([np.asarray(colors.get(name), dtype=np.float64) for name in names])
+
+    @pytest.mark.parametrize('space', FLOAT32_SPACES)
+    @pytest.mark.parametrize('rgb', RGB)
+    @pytest.mark.parametrize('bits,step', [(8, 15), (10, 62)])
+    def test_code_values(self, space, rgb, bits, step):
+        """Test that code values round trip the same in `float32` and `float64`."""
+
+        top = 2 ** bits - 1
+        grid = self.code_values(bits, step)
+        colors64 = ColorArray(rgb, grid)
+        colors32 = ColorArray(rgb, grid, dtype='float32')
+        result64 = np.rint(self.columns(colors64.convert(space).convert(rgb)) * top)
+        result32 = np.rint(self.columns(colors32.convert(space).convert(rgb)) * top)
+        assert colors32.convert(space).dtype() == 'float32'
+        assert np.array_equal(result32, result64)
+
+    @pytest.mark.parametrize('space', FLOAT32_SPACES)
+    def test_bounds(self, space):
+        """Test that `float32` conversions of sRGB colors are within the documented bounds of `float64`."""
+
+        obj = Color.CS_MAP[space]
+        hue = obj.hue_index() if issubclass(obj, Cylindrical) else -1
+        grid = self.code_values(8, 15)
+        result64 = self.columns(ColorArray('srgb', grid).convert(space))
+        result32 = self.columns(ColorArray('srgb', grid, dtype='float32').convert(space))
+        for i, bounds in enumerate(obj.BOUNDS):
+            diff = np.abs(result64[:, i] - result32[:, i])
+            if i == hue:
+                diff = np.minimum(diff, 360 - diff)
+                # Compare hues of colors whose chroma, or saturation, is at least 1% of its range.
+                chroma = obj.BOUNDS[1]
+                diff = diff[np.abs(result64[:, 1]) >= 0.01 * (chroma.upper - chroma.lower)]
+            diff = diff[~np.isnan(diff)]
+            limit = (self.HUE_BOUND if i == hue else self.BOUND) * (bounds.upper - bounds.lower)
+            assert diff.max() <= limit, '{} {}'.format(space, obj.CHANNEL_NAMES[i])
@@ -2,6 +2,8 @@
 import unittest
 from . import util
 from coloraide import Color
+from coloraide.spaces.srgb import css, color_names
+from coloraide.spaces.srgb.css import SRGB
 
 
 class TestSRGBInputOutput(util.ColorAsserts, unittest.TestCase):
@@ -313,6 +315,91 @@ class TestSRGBInputOutput(util.ColorAsserts, unittest.TestCase):
         )
 
 
+class TestSRGBMatch(util.ColorAsserts, unittest.TestCase):
+    """Test matching hex and `rgb()` colors without regular expressions."""
+
+    def regex_match(self, string, start=0):
+        """Match with the `MATCH` pattern."""
+
+        m = SRGB.MATCH.match(string, start)
+        return SRGB.split_channels(m.group(0).lower()), m.end(0)
+
+    def test_hex(self):
+        """Test hex colors match like the pattern."""
+
+        for string in ('#f00', '#F00a', '#ff0000', '#FF000080', '#abc def', '#abcdef;', 'x #abc'):
+            start = string.index('#')
+            self.assertEqual(css.match_hex(string, start), self.regex_match(string, start))
+
+    def test_hex_invalid(self):
+        """Test invalid hex colors do not match."""
+
+        for string in ('#', '#ff', '#fffff', '#fffffff', '#fffffffff', '#abcg', '#abc_', '#abcé'):
+            self.assertIsNone(css.match_hex(string, 0))
+            self.assertIsNone(SRGB.MATCH.match(string))
+
+    def test_rgb(self):
+        """Test simple `rgb()` colors match like the pattern."""
+
+        for string in (
+            'rgb(255 0 0)', 'RGB(255 0 0)', 'rgba(10 20 30)', 'rgb( 10.5 .5 +1 )', 'rgb(1 2 3/50%)',
+            'rgb(1 2 3 / 0.25)', 'rgb(10% 20% 30% / 2)', 'rgb(1,2,3)', 'rgba(1 , 2 ,3, -1)',
+            'rgb(1%, 2%, 3%, 40%) text', 'rgb(\n1\t2\n3\n)'
+        ):
+            self.assertEqual(css.match_rgb(string, 0), self.regex_match(string))
+
+    def test_rgb_fallback(self):
+        """Test `rgb()` colors that are left to the pattern."""
+
+        for string in ('rgb(1e2 0 0)', 'rgb(none 0 0)', 'rgb(1 2 3 / none)'):
+            self.assertIsNone(css.match_rgb(string, 0))
+            self.assertColorEqual(
+                Color(string), Color('srgb', *SRGB.split_channels(SRGB.MATCH.match(string).group(0)))
+            )
+
+    def test_rgb_invalid(self):
+        """Test invalid `rgb()` colors do not match."""
+
+        for string in (
+            'rgb(1 2)', 'rgb(1 2 3', 'rgb(1 2% 3)', 'rgb(1, 2 3)', 'rgb(1 2, 3)', 'rgb(1 2 3, 4)',
+            'rgb(1, 2, 3 / 4)', 'rgb(1 2 3 / )', 'rgb(1. 2 3)', 'rgb(123)', 'xrgb(1 2 3)', 'rgb (1 2 3)'
+        ):
+            start = 1 if string.startswith('x') else 0
+            self.assertIsNone(css.match_rgb(string, start))
+            self.assertIsNone(Color.match(string, start, fullmatch=True))
+
+    def test_name(self):
+        """Test color names match like the pattern."""
+
+        for string, start in (
+            ('red', 0), ('RebeccaPurple', 0), ('transparent', 0), ('white-smoke', 0), ('gray.', 0), ('x blue', 2),
+            ('(navy)', 1)
+        ):
+            m = SRGB.MATCH.match(string, start)
+            expected = SRGB.split_channels(color_names.name2hex(m.group(0)))
+            self.assertEqual(css.match_name(string, start), (expected, m.end(0)))
+
+    def test_name_rejected(self):
+        """Test that words that are not color names do not match."""
+
+        for string, start in (
+            ('reds', 0), ('redish', 0), ('re', 0), ('xred', 1), ('_red', 1), ('#red', 1), ('red2', 0),
+            ('red_', 0), ('red(', 0), ('redé', 0), ('documentation', 0), ('rgba', 0), ('color', 0)
+        ):
+            self.assertIsNone(css.match_name(string, start))
+            self.assertIsNone(SRGB.match(string, start, False))
+
+    def test_name_trie(self):
+        """Test the color name trie."""
+
+        trie = color_names.build_name_trie({'red': '#ff0000', 'redder': '#ee0000'})
+        self.assertEqual(trie['r']['e']['d'][''], '#ff0000')
+        self.assertEqual(trie['r']['e']['d']['d']['e']['r'][''], '#ee0000')
+        self.assertEqual(color_names.match_name('RED!'), ('#ff0000', 3))
+        self.assertEqual(color_names.match_name('rebel'), (None, 4))
+        self.assertEqual(color_names.match_name('x'), (None, 0))
+
+
 class TestSRGBProperties(util.ColorAsserts, unittest.TestCase):
     """Test sRGB."""
 
@@ -111,6 +111,42 @@ class TestUtil(unittest.TestCase):
             [[48, 60, 72], [8, 10, 12], [42, 51, 60]]
         )
 
+    def test_matvec3(self):
+        """Test 3x3 matrix and vector dot product."""
+
+        self.assertEqual(
+            util.matvec3(
+                [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+                [1, 2, 3]
+            ),
+            [14, 32, 50]
+        )
+
+    def test_matmul3(self):
+        """Test 3x3 matrix dot product."""
+
+        self.assertEqual(
+            util.matmul3(
+                [[4, 4, 4], [1, 0, 1], [2, 3, 4]],
+                [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+            ),
+            [[48, 60, 72], [8, 10, 12], [42, 51, 60]]
+        )
+
+    def test_inv3(self):
+        """Test 3x3 matrix inversion."""
+
+        m = [[2, 0, 1], [1, 3, 2], [1, 1, 2]]
+        for r1, r2 in zip(util.inv3(m), util.inv(m)):
+            for a, b in zip(r1, r2):
+                self.assertAlmostEqual(a, b, places=12)
+        for r1, r2 in zip(util.matmul3(m, util.inv3(m)), [[1, 0, 0], [0, 1, 0], [0, 0, 1]]):
+            for a, b in zip(r1, r2):
+                self.assertAlmostEqual(a, b, places=12)
+
+        with self.assertRaises(ValueError):
+            util.inv3([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
     def test_multiply(self):
         """Test multiply."""
 
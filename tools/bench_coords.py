@@ -0,0 +1,102 @@
+"""
+Benchmark coordinate views against coordinate copies.
+
+Common operations are timed, and the coordinate lists they copy are counted, with
+`coords_view` returning the color's own coordinates, and again with it replaced by
+the copying `coords` that it supersedes.
+"""
+import sys
+import argparse
+import os
+import timeit
+
+sys.path.insert(0, os.getcwd())
+
+from coloraide import Color  # noqa: E402
+from coloraide.spaces import Space  # noqa: E402
+
+OPERATIONS = {
+    'convert': lambda c: c.convert('lab'),
+    'in_gamut': lambda c: c.in_gamut('srgb'),
+    'fit': lambda c: c.fit('srgb'),
+    'to_string': lambda c: c.to_string(),
+    'delta_e_2000': lambda c: c.delta_e('blue', method='2000'),
+    'delta_e_itp': lambda c: c.delta_e('blue', method='itp'),
+    'mix': lambda c: c.mix('blue'),
+    'equal': lambda c: c == c
+}
+
+COPIES = [0]
+
+
+def space_coords(self):
+    """Copy the coordinates, counting the copies."""
+
+    COPIES[0] += 1
+    return self._coords[:]
+
+
+def copy_space_view(self):
+    """Copying view of the space's coordinates."""
+
+    return self.coords()
+
+
+def copy_color_view(self):
+    """Copying view of the color's coordinates."""
+
+    return self._space.coords()
+
+
+def measure(func, color, number):
+    """Count copies per call and time the operation."""
+
+    COPIES[0] = 0
+    func(color)
+    copies = COPIES[0]
+    return copies, min(timeit.repeat(lambda: func(color), number=number, repeat=3)) / number
+
+
+def main():
+    """Main."""
+
+    parser = argparse.ArgumentParser(
+        prog='bench_coords.py', description='Benchmark coordinate views against coordinate copies.'
+    )
+    parser.add_argument(
+        '--number', '-n', type=int, default=2000, help="Number of calls per measurement, default is 2000."
+    )
+    args = parser.parse_args()
+
+    return run(args.number)
+
+
+def run(number):
+    """Run."""
+
+    color = Color('color(display-p3 1 0.2 0.1)')
+    original = Space.coords, Space.coords_view, Color.coords_view
+    Space.coords = space_coords
+    print(
+        '{:<14} {:>8} {:>8} {:>12} {:>12} {:>8}'.format(
+            'operation', 'copies', 'views', 'copy (us)', 'view (us)', 'speedup'
+        )
+    )
+    try:
+        for name, func in OPERATIONS.items():
+            Space.coords_view, Color.coords_view = original[1:]
+            view_copies, view = measure(func, color, number)
+            Space.coords_view, Color.coords_view = copy_space_view, copy_color_view
+            copy_copies, copy = measure(func, color, number)
+            print(
+                '{:<14} {:>8d} {:>8d} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(
+                    name, copy_copies, view_copies, copy * 1e6, view * 1e6, copy / view
+                )
+            )
+    finally:
+        Space.coords, Space.coords_view, Color.coords_view = original
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
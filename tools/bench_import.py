@@ -0,0 +1,83 @@
+"""
+Measure the time it takes to import `coloraide`.
+
+The import is timed in fresh interpreters with `-X importtime`, after a first import writes the
+bytecode cache, and the median is reported along with the slowest modules. A budget can be given,
+in which case the exit code is `1` if the median exceeds it.
+"""
+import sys
+import argparse
+import os
+import statistics
+import subprocess
+import tempfile
+
+
+def import_times(env):
+    """Import `coloraide` in a new interpreter and get the cumulative time of each module in microseconds."""
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import coloraide'],
+        cwd=os.getcwd(),
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    """Main."""
+
+    parser = argparse.ArgumentParser(
+        prog='bench_import.py', description='Measure the time it takes to import coloraide.'
+    )
+    parser.add_argument(
+        '--number', '-n', type=int, default=15, help="Number of imports to measure, default is 15."
+    )
+    parser.add_argument(
+        '--budget', '-b', type=float, default=None, help="Fail if the median import time exceeds this in milliseconds."
+    )
+    parser.add_argument(
+        '--top', '-t', type=int, default=10, help="Number of slowest coloraide modules to show, default is 10."
+    )
+    args = parser.parse_args()
+
+    return run(args.number, args.budget, args.top)
+
+
+def run(number, budget, top):
+    """Run."""
+
+    with tempfile.TemporaryDirectory() as cache:
+        env = dict(os.environ)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)
+        env['PYTHONPYCACHEPREFIX'] = cache
+        import_times(env)
+        samples = [import_times(env) for _ in range(number)]
+
+    total = statistics.median(s['coloraide'] for s in samples) / 1000
+    modules = {
+        name: statistics.median(s.get(name, 0) for s in samples) / 1000
+        for name in samples[0] if name.startswith('coloraide.')
+    }
+    print('{:<40} {:>10}'.format('module', 'ms'))
+    for name, ms in sorted(modules.items(), key=lambda item: -item[1])[:top]:
+        print('{:<40} {:>10.2f}'.format(name, ms))
+    print('{:<40} {:>10.2f}'.format('coloraide', total))
+
+    if budget is not None and total > budget:
+        print('Import time of {:.2f} ms exceeds the budget of {:.2f} ms'.format(total, budget))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""
+Benchmark the fixed-size 3x3 linear algebra against the generic `util.dot`.
+
+Each color space's `to_base` and `from_base` is timed with the unrolled 3x3 routines,
+and then again with them replaced by the generic routines they supersede.
+"""
+import sys
+import argparse
+import os
+import timeit
+
+sys.path.insert(0, os.getcwd())
+
+from coloraide import Color  # noqa: E402
+from coloraide import util  # noqa: E402
+
+
+def generic_matvec3(m, v):
+    """Matrix and vector dot product using the generic `dot`."""
+
+    return util.dot(m, v)
+
+
+def generic_matmul3(a, b):
+    """Matrix dot product using the generic `dot`."""
+
+    return util.dot(a, b)
+
+
+def time_space(space, coords, number):
+    """Time a round trip through the color space's base."""
+
+    base = space.to_base(list(coords))
+
+    def run():
+        """Convert to and from the base."""
+
+        space.to_base(list(coords))
+        space.from_base(list(base))
+
+    return min(timeit.repeat(run, number=number, repeat=3)) / number
+
+
+def main():
+    """Main."""
+
+    parser = argparse.ArgumentParser(
+        prog='bench_linalg.py', description='Benchmark 3x3 linear algebra against the generic routines.'
+    )
+    parser.add_argument(
+        '--number', '-n', type=int, default=20000, help="Number of round trips per measurement, default is 20000."
+    )
+    args = parser.parse_args()
+
+    return run(args.number)
+
+
+def run(number):
+    """Run."""
+
+    color = Color('srgb', [0.2, 0.4, 0.6])
+    fast = util.matvec3, util.matmul3
+    print('{:<14} {:>12} {:>12} {:>8}'.format('space', 'generic (us)', 'unrolled (us)', 'speedup'))
+    for name, space in Color.CS_MAP.items():
+        coords = color.convert(name).coords()
+        unrolled = time_space(space, coords, number)
+        util.matvec3, util.matmul3 = generic_matvec3, generic_matmul3
+        try:
+            generic = time_space(space, coords, number)
+        finally:
+            util.matvec3, util.matmul3 = fast
+        print(
+            '{:<14} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(
+                name, generic * 1e6, unrolled * 1e6, generic / unrolled
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())